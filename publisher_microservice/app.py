@@ -3,18 +3,29 @@
 # Librerías Externas.
 from typing import Dict
 
-from flask_smorest import Api
+from flask_smorest import Api, abort
 from flask_jwt_extended import JWTManager
-from flask import Flask, jsonify, Response
+from flask import Flask, jsonify, request, Response
 
 
 # Librerías Internas.
 from config import Config
+from validation import self_check
+from workers.publisher import admission
 
 from resources import UserBlueprint
 from resources import ModelBlueprint
 from resources import ProblemBlueprint
 from resources import VersionBlueprint
+from resources import PublishBlueprint
+from resources import MetricsBlueprint
+
+
+PUBLISHING_BLUEPRINTS = {ProblemBlueprint.name, ModelBlueprint.name, VersionBlueprint.name}
+
+# La carga masiva pasa por la admisión lote por lote al publicar, no por el tamaño de todo el cuerpo.
+BULK_ENDPOINTS = {f"{ProblemBlueprint.name}.ProblemBulk", f"{ModelBlueprint.name}.ModelBulk",
+                  f"{VersionBlueprint.name}.VersionBulk"}
 
 
 def create_app() -> Flask:
@@ -30,6 +41,8 @@ def create_app() -> Flask:
     app.json.sort_keys = False
     app.config.from_object(Config)
 
+    self_check()
+
     api = Api(app)
     jwt = JWTManager(app)
 
@@ -88,9 +101,25 @@ def create_app() -> Flask:
         return jsonify({"message": "No se ha pasado un token de autenticación.",
                         "error": "Se requiere un token de autenticación."}), 401
 
+    @app.before_request
+    def admission_control() -> None:
+        """Función que rechaza las escrituras que publican en Pub/Sub cuando hay
+        demasiados mensajes o bytes en vuelo."""
+
+        if request.method not in ("POST", "PUT", "DELETE") or request.blueprint not in PUBLISHING_BLUEPRINTS:
+            return
+
+        incoming_bytes = 0 if request.endpoint in BULK_ENDPOINTS else request.content_length or 0
+
+        if not admission.admit(incoming_bytes):
+            abort(429, message = "El servicio está saturado, intente de nuevo más tarde.",
+                  headers = {"Retry-After": str(Config.ADMISSION_RETRY_AFTER)})
+
     api.register_blueprint(UserBlueprint)
     api.register_blueprint(ModelBlueprint)
     api.register_blueprint(ProblemBlueprint)
     api.register_blueprint(VersionBlueprint)
+    api.register_blueprint(PublishBlueprint)
+    api.register_blueprint(MetricsBlueprint)
 
     return app
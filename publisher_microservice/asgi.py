@@ -0,0 +1,250 @@
+"""Módulo que expone la app como aplicación ASGI.
+
+Las vistas siguen siendo las de Flask y se ejecutan en un pool acotado de
+hilos (ASGI_MAX_THREADS). En modo 'sync' la vista ya no bloquea su hilo
+esperando la confirmación de Pub/Sub: deja el futuro de la publicación en el
+environ y retorna, y la respuesta se envía desde el event loop cuando el
+futuro se resuelve. Así un contenedor sostiene miles de escrituras en vuelo
+con unos pocos hilos. Se ejecuta con:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8080"""
+
+# Librerías Externas.
+from typing import Any, Awaitable, Callable, Dict, List
+
+import json
+import asyncio
+from tempfile import SpooledTemporaryFile
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from flask import Flask
+from asgiref.wsgi import WsgiToAsgiInstance
+
+# Librerías Internas.
+from app import create_app
+from config import Config
+from workers.registry import DEFERRED_PUBLISHES
+
+
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def publish_error_messages() -> List[Dict[str, Any]]:
+    """Función que construye la respuesta enviada cuando falla una publicación
+    cuya confirmación se esperaba en el event loop.
+
+    Returns:
+    ----------
+    List[Dict[str, Any]].
+        Mensajes ASGI de la respuesta."""
+
+    body = json.dumps({"code": 500, "status": "Internal Server Error",
+                       "message": "No fue posible publicar el mensaje en Pub/Sub."}).encode()
+
+    return [{"type": "http.response.start", "status": 500,
+             "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]},
+            {"type": "http.response.body", "body": body}]
+
+
+class DeferredPublishInstance(WsgiToAsgiInstance):
+    """Clase que atiende una petición HTTP ejecutando la app WSGI en el pool de
+    hilos y esperando en el event loop las publicaciones que la vista dejó
+    pendientes antes de enviar la respuesta.
+
+    Las respuestas con 'Content-Length' se arman en el hilo y se envían desde
+    el event loop en un solo paso; las respuestas por partes (exportaciones,
+    cargas masivas) se envían desde el hilo a medida que se producen."""
+
+    def __init__(self, wsgi_application: Flask, executor: ThreadPoolExecutor) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        wsgi_application: Flask.
+            App WSGI.
+
+        executor: ThreadPoolExecutor.
+            Pool de hilos en el que se ejecutan las vistas."""
+
+        super().__init__(wsgi_application)
+
+        self.executor = executor
+        self.deferred: List[Future] = []
+
+    def build_environ(self, scope: Dict[str, Any], body: Any) -> Dict[str, Any]:
+        """Método que construye el environ WSGI con la lista de publicaciones a esperar.
+
+        Args:
+        ----------
+        scope: Dict[str, Any].
+            Scope ASGI de la petición.
+
+        body: Any.
+            Cuerpo de la petición.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Environ WSGI."""
+
+        environ = super().build_environ(scope, body)
+        environ[DEFERRED_PUBLISHES] = self.deferred
+
+        return environ
+
+    def run_wsgi(self, body: Any, send_from_thread: Callable[[Dict[str, Any]], None]) -> List[Dict[str, Any]]:
+        """Método que ejecuta la app WSGI en un hilo del pool.
+
+        Args:
+        ----------
+        body: Any.
+            Cuerpo de la petición.
+
+        send_from_thread: Callable[[Dict[str, Any]], None].
+            Función que envía un mensaje de la respuesta desde el hilo.
+
+        Returns:
+        ----------
+        List[Dict[str, Any]].
+            Mensajes de la respuesta a enviar desde el event loop, o una lista
+            vacía si la respuesta ya se envió por partes."""
+
+        try:
+            environ = self.build_environ(self.scope, body)
+        except ValueError:
+            return [{"type": "http.response.start", "status": 400, "headers": [(b"content-type", b"text/plain")]},
+                    {"type": "http.response.body", "body": b"Bad Request: Too many duplicate headers"}]
+
+        output = self.wsgi_application(environ, self.start_response)
+
+        try:
+            if self.response_content_length is not None:
+                content = b"".join(output)[:self.response_content_length]
+                return [self.response_start, {"type": "http.response.body", "body": content}]
+
+            wait(self.deferred)
+            send_from_thread(self.response_start)
+
+            for chunk in output:
+                send_from_thread({"type": "http.response.body", "body": chunk, "more_body": True})
+
+            send_from_thread({"type": "http.response.body"})
+            return []
+        finally:
+            if hasattr(output, "close"):
+                output.close()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        """Método que atiende la petición. Si la vista dejó publicaciones
+        pendientes, la respuesta se retiene sin ocupar el hilo hasta que se
+        confirmen; si alguna falla se responde 500.
+
+        Args:
+        ----------
+        scope: Dict[str, Any].
+            Scope ASGI de la petición.
+
+        receive: Receive.
+            Canal de mensajes de la petición.
+
+        send: Send.
+            Canal de mensajes de la respuesta."""
+
+        self.scope = scope
+        loop = asyncio.get_running_loop()
+
+        def send_from_thread(message: Dict[str, Any]) -> None:
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        with SpooledTemporaryFile(max_size = 65536) as body:
+            while True:
+                message = await receive()
+
+                if message["type"] != "http.request":
+                    return
+
+                body.write(message.get("body", b""))
+
+                if not message.get("more_body"):
+                    break
+
+            body.seek(0)
+            messages = await loop.run_in_executor(self.executor, self.run_wsgi, body, send_from_thread)
+
+        if messages and self.deferred:
+            results = await asyncio.gather(*[asyncio.wrap_future(future) for future in self.deferred],
+                                           return_exceptions = True)
+
+            if any(isinstance(result, BaseException) for result in results):
+                messages = publish_error_messages()
+
+        for message in messages:
+            await send(message)
+
+
+class AsyncPublishApp:
+    """Clase que envuelve la app WSGI como aplicación ASGI, con un pool acotado
+    de hilos para las vistas y la espera de las publicaciones en el event loop."""
+
+    def __init__(self, wsgi_application: Flask, max_threads: int = 32) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        wsgi_application: Flask.
+            App WSGI.
+
+        max_threads: int.
+            Hilos máximos en los que se ejecutan las vistas."""
+
+        self.wsgi_application = wsgi_application
+        self.executor = ThreadPoolExecutor(max_workers = max_threads, thread_name_prefix = "asgi-view")
+
+    async def __call__(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        """Método que atiende una conexión ASGI.
+
+        Args:
+        ----------
+        scope: Dict[str, Any].
+            Scope ASGI.
+
+        receive: Receive.
+            Canal de mensajes entrantes.
+
+        send: Send.
+            Canal de mensajes salientes."""
+
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            raise ValueError("La app solo atiende peticiones HTTP.")
+
+        await DeferredPublishInstance(self.wsgi_application, self.executor)(scope, receive, send)
+
+    async def lifespan(self, receive: Receive, send: Send) -> None:
+        """Método que atiende el inicio y el apagado del servidor.
+
+        Args:
+        ----------
+        receive: Receive.
+            Canal de mensajes entrantes.
+
+        send: Send.
+            Canal de mensajes salientes."""
+
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait = True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+app = AsyncPublishApp(create_app(), max_threads = Config.ASGI_MAX_THREADS)
@@ -0,0 +1,367 @@
+"""Benchmark de carga que compara el servidor WSGI, con un pool acotado de hilos
+y con un hilo por petición (el de 'flask run'), contra la app ASGI de 'asgi.py'
+con el mismo pool, en modo de publicación 'sync'.
+
+Cada servidor corre en un proceso aparte, con el transporte reemplazado por
+uno que confirma cada publicación tras '--latency' segundos, como lo haría
+Pub/Sub, sin GCP. Cada cliente concurrente envía POST /problem en una conexión
+nueva. Se reporta el throughput, la latencia y el pico de hilos del proceso
+del servidor. Se ejecuta desde la carpeta del servicio:
+
+    PUBSUB_TRANSPORT=local LOCAL_BROKER_PATH=/tmp/broker.db \\
+    ADMISSION_SOFT_MAX_MESSAGES=100000 ADMISSION_HARD_MAX_MESSAGES=100000 \\
+        python -m benchmarks.bench_async_serving --concurrency 1000 --requests 10000 --latency 0.2"""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, List, Tuple
+
+import json
+import time
+import asyncio
+import socket
+import logging
+import argparse
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import uvicorn
+from werkzeug.serving import BaseWSGIServer, make_server
+
+# Librerías Internas.
+import workers.publisher as publisher
+from app import create_app
+from asgi import AsyncPublishApp
+
+
+def delayed_publish(latency: float) -> Callable[..., Future]:
+    """Función que construye un reemplazo de 'transport.publish' que confirma
+    cada mensaje tras una latencia fija, desde un único hilo para no alterar
+    el conteo de hilos del proceso.
+
+    Args:
+    ----------
+    latency: float.
+        Segundos hasta la confirmación.
+
+    Returns:
+    ----------
+    Callable[..., Future].
+        Función de publicación."""
+
+    pending: "deque[Tuple[float, Future]]" = deque()
+    ready = threading.Condition()
+
+    def confirm() -> None:
+        while True:
+            with ready:
+                while not pending:
+                    ready.wait()
+
+                deadline, future = pending.popleft()
+
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            future.set_result("bench")
+
+    threading.Thread(target = confirm, daemon = True).start()
+
+    def publish(data: bytes, ordering_key: str = "", **attributes: str) -> Future:
+        future = Future()
+
+        with ready:
+            pending.append((time.monotonic() + latency, future))
+            ready.notify()
+
+        return future
+
+    return publish
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Clase que atiende las peticiones WSGI en un pool acotado de hilos, como
+    un servidor WSGI de producción con un número fijo de hilos por proceso."""
+
+    def __init__(self, host: str, port: int, app: Any, threads: int, backlog: int) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        host: str.
+            Host del servidor.
+
+        port: int.
+            Puerto del servidor.
+
+        app: Any.
+            App WSGI.
+
+        threads: int.
+            Hilos del pool.
+
+        backlog: int.
+            Conexiones pendientes máximas del socket."""
+
+        self.request_queue_size = backlog
+        super().__init__(host, port, app)
+
+        self.pool = ThreadPoolExecutor(max_workers = threads)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Método que entrega la conexión al pool de hilos.
+
+        Args:
+        ----------
+        request: Any.
+            Socket de la conexión.
+
+        client_address: Any.
+            Dirección del cliente."""
+
+        def handle() -> None:
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+        self.pool.submit(handle)
+
+async def post_problem(port: int, body: bytes) -> int:
+    """Función que envía un POST /problem y lee la respuesta completa.
+
+    Args:
+    ----------
+    port: int.
+        Puerto del servidor.
+
+    body: bytes.
+        Cuerpo JSON.
+
+    Returns:
+    ----------
+    int.
+        Código de estado."""
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"POST /problem HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+                 b"Connection: close\r\nContent-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+
+    return int(response.split(b" ", 2)[1])
+
+async def load(port: int, concurrency: int, requests: int) -> Dict[str, Any]:
+    """Función que genera la carga con 'concurrency' clientes concurrentes.
+
+    Args:
+    ----------
+    port: int.
+        Puerto del servidor.
+
+    concurrency: int.
+        Clientes concurrentes.
+
+    requests: int.
+        Total de peticiones.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Latencias y códigos de estado."""
+
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    remaining = iter(range(requests))
+
+    async def client() -> None:
+        for position in remaining:
+            name = f"bench-{position}"
+            body = json.dumps({"name": name, "type": "classification", "owner_team": "bench", "owner": "bench",
+                               "repository": f"https://github.com/org/{name}", "description": "Benchmark.",
+                               "documentation": f"https://docs.org/{name}", "execution": "batch"}).encode()
+            start = time.perf_counter()
+
+            try:
+                status = await post_problem(port, body)
+            except OSError:
+                status = 0
+
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+
+    return {"latencies": latencies, "statuses": statuses}
+
+def process_threads(pid: int) -> int:
+    """Función que obtiene la cantidad de hilos de un proceso (Linux).
+
+    Args:
+    ----------
+    pid: int.
+        ID del proceso.
+
+    Returns:
+    ----------
+    int.
+        Hilos del proceso, o 0 si no se pueden leer."""
+
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            return next(int(line.split()[1]) for line in status if line.startswith("Threads:"))
+    except (OSError, StopIteration):
+        return 0
+
+def measure(pid: int, port: int, concurrency: int, requests: int) -> Dict[str, Any]:
+    """Función que ejecuta la carga y mide el throughput, la latencia y el pico
+    de hilos del proceso del servidor.
+
+    Args:
+    ----------
+    pid: int.
+        ID del proceso del servidor.
+
+    port: int.
+        Puerto del servidor.
+
+    concurrency: int.
+        Clientes concurrentes.
+
+    requests: int.
+        Total de peticiones.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Resultados de la corrida."""
+
+    peak = {"threads": process_threads(pid)}
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.wait(0.01):
+            peak["threads"] = max(peak["threads"], process_threads(pid))
+
+    sampler = threading.Thread(target = sample, daemon = True)
+    sampler.start()
+
+    start = time.perf_counter()
+    result = asyncio.run(load(port, concurrency, requests))
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    sampler.join()
+
+    latencies = sorted(result["latencies"])
+
+    return {"seconds": round(elapsed, 2), "requests_per_second": round(requests / elapsed, 1),
+            "p50_ms": round(latencies[len(latencies) // 2] * 1000, 1),
+            "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 1),
+            "peak_threads": peak["threads"], "statuses": result["statuses"]}
+
+def serve(server: str, port: int, backlog: int, threads: int, latency: float) -> None:
+    """Función que ejecuta el servidor en el proceso hijo.
+
+    Args:
+    ----------
+    server: str.
+        'wsgi-pool' (pool acotado), 'wsgi-threaded' (un hilo por petición) o 'asgi'.
+
+    port: int.
+        Puerto del servidor.
+
+    backlog: int.
+        Conexiones pendientes máximas del socket.
+
+    threads: int.
+        Hilos del pool.
+
+    latency: float.
+        Segundos hasta la confirmación de cada publicación."""
+
+    publisher.transport.publish = delayed_publish(latency)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    if server == "asgi":
+        app = AsyncPublishApp(create_app(), max_threads = threads)
+        uvicorn.run(app, host = "127.0.0.1", port = port, backlog = backlog, log_level = "warning", access_log = False)
+        return
+
+    if server == "wsgi-pool":
+        wsgi_server = PooledWSGIServer("127.0.0.1", port, create_app(), threads, backlog = backlog)
+    else:
+        wsgi_server = make_server("127.0.0.1", port, create_app(), threaded = True)
+        wsgi_server.socket.listen(backlog)
+
+    wsgi_server.serve_forever()
+
+def run(server: str, port: int, concurrency: int, requests: int, threads: int, latency: float) -> Dict[str, Any]:
+    """Función que levanta el servidor en un proceso aparte, para que la carga
+    no compita con él por el GIL, y lo mide.
+
+    Args:
+    ----------
+    server: str.
+        Servidor a medir.
+
+    port: int.
+        Puerto del servidor.
+
+    concurrency: int.
+        Clientes concurrentes.
+
+    requests: int.
+        Total de peticiones.
+
+    threads: int.
+        Hilos del pool.
+
+    latency: float.
+        Segundos hasta la confirmación de cada publicación.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Resultados de la corrida."""
+
+    process = multiprocessing.Process(target = serve, args = (server, port, concurrency, threads, latency), daemon = True)
+    process.start()
+
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout = 1).close()
+            break
+        except OSError:
+            time.sleep(0.1)
+
+    try:
+        return measure(process.pid, port, concurrency, requests)
+    finally:
+        process.terminate()
+        process.join()
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--concurrency", type = int, default = 1000)
+    parser.add_argument("--requests", type = int, default = 10000)
+    parser.add_argument("--latency", type = float, default = 0.2)
+    parser.add_argument("--threads", type = int, default = 32)
+    parser.add_argument("--port", type = int, default = 8090)
+    args = parser.parse_args()
+
+    servers = [("wsgi-pool", f"wsgi, {args.threads} hilos"),
+               ("wsgi-threaded", "wsgi, un hilo por petición"),
+               ("asgi", f"asgi, {args.threads} hilos")]
+
+    for position, (server, label) in enumerate(servers):
+        result = run(server, args.port + position, args.concurrency, args.requests, args.threads, args.latency)
+        print(f"{label}:", result)
+
+if __name__ == "__main__":
+    main()
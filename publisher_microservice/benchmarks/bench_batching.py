@@ -0,0 +1,80 @@
+"""Benchmark de mensajes por segundo publicados con distintos tamaños de lote.
+
+Se ejecuta desde la carpeta del servicio contra el tópico configurado en
+PROJECT_ID/TOPIC_NAME (o el emulador si PUBSUB_EMULATOR_HOST está definido):
+
+    python -m benchmarks.bench_batching --threads 32 --messages 5000"""
+
+# Librerías Externas.
+from typing import Dict
+
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Librerías Internas.
+from workers.publisher import structure_msg
+from workers.transport import PubSubTransport
+
+
+def run(batch_size: int, threads: int, messages: int, max_latency: float) -> Dict[str, float]:
+    """Función que publica 'messages' mensajes desde 'threads' hilos, cada uno
+    esperando su confirmación como lo hace un handler en modo 'sync'.
+
+    Args:
+    ----------
+    batch_size: int.
+        Cantidad máxima de mensajes por lote.
+
+    threads: int.
+        Hilos concurrentes que publican.
+
+    messages: int.
+        Total de mensajes a publicar.
+
+    max_latency: float.
+        Segundos máximos de espera de un lote.
+
+    Returns:
+    ----------
+    Dict[str, float].
+        Resultados de la corrida."""
+
+    transport = PubSubTransport(batch_max_messages = batch_size, batch_max_latency = max_latency)
+
+    payload = json.dumps(structure_msg(table_name = "versions", action = "PUT",
+                                       request_data = {"metrics": {"train": 0.91, "validation": 0.89}},
+                                       request_ids = {"model_id": 1, "version_id": 1})).encode("utf-8")
+
+    def publish_one(_: int) -> None:
+        transport.publish(payload).result()
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers = threads) as executor:
+        list(executor.map(publish_one, range(messages)))
+
+    elapsed = time.perf_counter() - start
+    transport.stop()
+
+    return {"batch_size": batch_size, "seconds": round(elapsed, 3),
+            "messages_per_second": round(messages / elapsed, 1)}
+
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--threads", type = int, default = 32)
+    parser.add_argument("--messages", type = int, default = 5000)
+    parser.add_argument("--max-latency", type = float, default = 0.01)
+    parser.add_argument("--batch-sizes", type = int, nargs = "+", default = [1, 10, 50, 100, 500])
+    args = parser.parse_args()
+
+    for batch_size in args.batch_sizes:
+        print(run(batch_size, args.threads, args.messages, args.max_latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark de bytes ahorrados y costo de CPU al comprimir mensajes de versiones.
+
+No requiere Pub/Sub. Se ejecuta desde la carpeta del servicio:
+
+    python -m benchmarks.bench_compression --repeat 2000"""
+
+# Librerías Externas.
+from typing import Dict
+
+import json
+import time
+import random
+import argparse
+
+# Librerías Internas.
+from workers.publisher import structure_msg
+from workers.codec import CODECS, compress_payload, decompress_payload
+
+
+def version_payload(n_metrics: int, n_classes: int) -> bytes:
+    """Función que construye un mensaje de versión con métricas realistas:
+    métricas globales por partición y un reporte por clase.
+
+    Args:
+    ----------
+    n_metrics: int.
+        Cantidad de métricas globales por partición.
+
+    n_classes: int.
+        Cantidad de clases del reporte por clase.
+
+    Returns:
+    ----------
+    bytes.
+        Mensaje codificado en JSON."""
+
+    rng = random.Random(n_metrics * 1000 + n_classes)
+    names = ["accuracy", "precision", "recall", "f1", "roc_auc", "log_loss", "mae", "rmse", "r2", "mape"]
+
+    metrics = {}
+
+    for split in ("train", "validation", "test"):
+        metrics[split] = {f"{names[i % len(names)]}_{i}": round(rng.random(), 6) for i in range(n_metrics)}
+
+    metrics["per_class"] = {f"class_{i}": {"precision": round(rng.random(), 6),
+                                           "recall": round(rng.random(), 6),
+                                           "support": rng.randint(10, 10000)} for i in range(n_classes)}
+
+    msg = structure_msg(table_name = "versions", action = "POST",
+                        request_data = {"version": "3", "metrics": metrics, "status": "DEV"},
+                        request_ids = {"model_id": "42"})
+
+    return json.dumps(msg).encode("utf-8")
+
+def measure(payload: bytes, codec: str, repeat: int) -> Dict[str, float]:
+    """Función que mide el tamaño comprimido y el tiempo de compresión y
+    descompresión de un mensaje.
+
+    Args:
+    ----------
+    payload: bytes.
+        Mensaje a comprimir.
+
+    codec: str.
+        Códec a evaluar.
+
+    repeat: int.
+        Repeticiones de la medición.
+
+    Returns:
+    ----------
+    Dict[str, float].
+        Resultados de la medición."""
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encoded, attributes = compress_payload(payload, codec = codec, threshold = 0)
+    compress_time = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decompress_payload(encoded, attributes)
+    decompress_time = (time.perf_counter() - start) / repeat
+
+    return {"codec": codec, "raw_bytes": len(payload), "encoded_bytes": len(encoded),
+            "saved_pct": round(100 * (1 - len(encoded) / len(payload)), 1),
+            "compress_us": round(compress_time * 1e6, 1),
+            "decompress_us": round(decompress_time * 1e6, 1)}
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--repeat", type = int, default = 2000)
+    args = parser.parse_args()
+
+    shapes = [(2, 0), (10, 5), (25, 50), (50, 500)]
+
+    for n_metrics, n_classes in shapes:
+        payload = version_payload(n_metrics, n_classes)
+
+        for codec in ["none", *CODECS]:
+            print({"metrics": n_metrics, "classes": n_classes, **measure(payload, codec, args.repeat)})
+
+
+if __name__ == "__main__":
+    main()
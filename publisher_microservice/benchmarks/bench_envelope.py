@@ -0,0 +1,80 @@
+"""Micro-benchmark de codificación y decodificación del sobre JSON frente al sobre msgpack.
+
+No requiere Pub/Sub. Se ejecuta desde la carpeta del servicio:
+
+    python -m benchmarks.bench_envelope --repeat 20000"""
+
+# Librerías Externas.
+from typing import Any, Dict
+
+import time
+import argparse
+
+# Librerías Internas.
+from workers.publisher import structure_msg
+from workers.codec import encode_envelope, decode_envelope
+
+
+MESSAGES = {
+    "problem_post": structure_msg(table_name = "problems", action = "POST",
+                                  request_data = {"name": "churn", "type": "classification",
+                                                  "owner_team": "growth", "owner": "ana",
+                                                  "repository": "https://github.com/org/churn",
+                                                  "description": "Predicción de abandono de clientes.",
+                                                  "documentation": "https://docs.org/churn",
+                                                  "execution": "batch"}),
+    "version_put": structure_msg(table_name = "versions", action = "PUT",
+                                 request_data = {"metrics": {"train": 0.912, "validation": 0.887}},
+                                 request_ids = {"model_id": "12", "version_id": "345"}),
+    "model_delete": structure_msg(table_name = "models", action = "DELETE",
+                                  request_ids = {"problem_id": "7", "model_id": "12"})}
+
+
+def measure(msg: Dict[str, Any], envelope: str, repeat: int) -> Dict[str, float]:
+    """Función que mide el tamaño y los tiempos de codificación y decodificación
+    de un mensaje con el sobre dado.
+
+    Args:
+    ----------
+    msg: Dict[str, Any].
+        Mensaje estructurado.
+
+    envelope: str.
+        Sobre a evaluar.
+
+    repeat: int.
+        Repeticiones de la medición.
+
+    Returns:
+    ----------
+    Dict[str, float].
+        Resultados de la medición."""
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        payload, attributes = encode_envelope(msg, envelope = envelope)
+    encode_time = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode_envelope(payload, attributes)
+    decode_time = (time.perf_counter() - start) / repeat
+
+    return {"envelope": envelope, "bytes": len(payload),
+            "encode_us": round(encode_time * 1e6, 2),
+            "decode_us": round(decode_time * 1e6, 2)}
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--repeat", type = int, default = 20000)
+    args = parser.parse_args()
+
+    for name, msg in MESSAGES.items():
+        for envelope in ("json", "msgpack"):
+            print({"message": name, **measure(msg, envelope, args.repeat)})
+
+
+if __name__ == "__main__":
+    main()
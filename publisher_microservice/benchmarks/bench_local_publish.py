@@ -0,0 +1,79 @@
+"""Benchmark de publicación contra el broker local, sin GCP.
+
+Publica problemas nuevos en el archivo LOCAL_BROKER_PATH para que luego los
+consuma 'benchmarks.bench_local_consume' del suscriptor. Se ejecuta desde la
+carpeta del servicio:
+
+    PUBSUB_TRANSPORT=local LOCAL_BROKER_PATH=/tmp/broker.db \\
+        python -m benchmarks.bench_local_publish --threads 8 --messages 2000"""
+
+# Librerías Externas.
+from typing import Dict
+
+import time
+import uuid
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Librerías Internas.
+from config import Config
+from workers.publisher import publish_msg, structure_msg, transport
+
+
+def run(threads: int, messages: int) -> Dict[str, float]:
+    """Función que publica 'messages' problemas desde 'threads' hilos con el
+    modo de publicación configurado.
+
+    Args:
+    ----------
+    threads: int.
+        Hilos concurrentes que publican.
+
+    messages: int.
+        Total de mensajes a publicar.
+
+    Returns:
+    ----------
+    Dict[str, float].
+        Resultados de la corrida."""
+
+    run_id = uuid.uuid4().hex[:8]
+
+    def publish_one(position: int) -> None:
+        name = f"bench-{run_id}-{position}"
+        publish_msg(structure_msg(table_name = "problems", action = "POST",
+                                  request_data = {"name": name, "type": "classification",
+                                                  "owner_team": "bench", "owner": "bench",
+                                                  "repository": f"https://github.com/org/{name}",
+                                                  "description": "Problema de benchmark.",
+                                                  "documentation": f"https://docs.org/{name}",
+                                                  "execution": "batch"}))
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers = threads) as executor:
+        list(executor.map(publish_one, range(messages)))
+
+    elapsed = time.perf_counter() - start
+
+    return {"transport": Config.PUBSUB_TRANSPORT, "mode": Config.PUBLISH_MODE,
+            "seconds": round(elapsed, 3), "messages_per_second": round(messages / elapsed, 1)}
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--threads", type = int, default = 8)
+    parser.add_argument("--messages", type = int, default = 2000)
+    args = parser.parse_args()
+
+    result = run(args.threads, args.messages)
+
+    if hasattr(transport, "broker"):
+        result["broker_depth"] = transport.broker.depth()
+
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
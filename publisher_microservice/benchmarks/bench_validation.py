@@ -0,0 +1,108 @@
+"""Micro-benchmark de validación con marshmallow frente a los esquemas compilados.
+
+No requiere Pub/Sub. Se ejecuta desde la carpeta del servicio:
+
+    python -m benchmarks.bench_validation --repeat 20000"""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict
+
+import time
+import argparse
+
+from marshmallow import ValidationError
+
+# Librerías Internas.
+from validation import compile_schema
+from schemas import PlainProblemSchema, UpdateVersionSchema
+
+
+PAYLOADS = {
+    "problem_valid": (PlainProblemSchema(), {"name": "churn", "type": "classification",
+                                             "owner_team": "growth", "owner": "ana",
+                                             "repository": "https://github.com/org/churn",
+                                             "description": "Predicción de abandono de clientes.",
+                                             "documentation": "https://docs.org/churn",
+                                             "execution": "batch"}),
+    "problem_invalid": (PlainProblemSchema(), {"name": "ch", "type": "forecast",
+                                               "owner_team": "growth", "owner": 7,
+                                               "repository": "not a url",
+                                               "documentation": "https://docs.org/churn",
+                                               "execution": "batch", "status": "DEV"}),
+    "version_valid": (UpdateVersionSchema(), {"version": "3",
+                                              "metrics": {"train": 0.912, "validation": 0.887}}),
+    "version_invalid": (UpdateVersionSchema(), {"version": "300", "metrics": {"train": 0.912}})}
+
+
+def measure(load_fn: Callable[[Any], Any], data: Dict[str, Any], repeat: int) -> float:
+    """Función que mide el tiempo promedio de validación de un payload.
+
+    Args:
+    ----------
+    load_fn: Callable[[Any], Any].
+        Función de validación.
+
+    data: Dict[str, Any].
+        Payload a validar.
+
+    repeat: int.
+        Repeticiones de la medición.
+
+    Returns:
+    ----------
+    float.
+        Microsegundos por validación."""
+
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        try:
+            load_fn(data)
+        except ValidationError:
+            pass
+
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def errors_of(load_fn: Callable[[Any], Any], data: Dict[str, Any]) -> Any:
+    """Función que obtiene el resultado o los errores de una validación.
+
+    Args:
+    ----------
+    load_fn: Callable[[Any], Any].
+        Función de validación.
+
+    data: Dict[str, Any].
+        Payload a validar.
+
+    Returns:
+    ----------
+    Any.
+        Datos validados o mensajes de error."""
+
+    try:
+        return load_fn(data)
+    except ValidationError as e:
+        return e.messages
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--repeat", type = int, default = 20000)
+    args = parser.parse_args()
+
+    for name, (schema, data) in PAYLOADS.items():
+        compiled = compile_schema(schema)
+
+        marshmallow_us = measure(schema.load, data, args.repeat)
+        compiled_us = measure(compiled.load, data, args.repeat)
+
+        print({"payload": name,
+               "marshmallow_us": round(marshmallow_us, 2),
+               "compiled_us": round(compiled_us, 2),
+               "speedup": round(marshmallow_us / compiled_us, 2),
+               "same_result": errors_of(schema.load, data) == errors_of(compiled.load, data)})
+
+
+if __name__ == "__main__":
+    main()
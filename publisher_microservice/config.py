@@ -26,6 +26,116 @@ class Config:
     OPENAPI_SWAGGER_UI_PATH = "/swagger-ui"
     OPENAPI_SWAGGER_UI_URL = "https://cdn.jsdelivr.net/npm/swagger-ui-dist/"
 
+    # Transporte de mensajes: 'pubsub' (Google Cloud Pub/Sub) o 'local' (broker SQLite en
+    # LOCAL_BROKER_PATH, compartido con el suscriptor para pruebas sin GCP).
+    PUBSUB_TRANSPORT = os.getenv("PUBSUB_TRANSPORT", "pubsub")
+    LOCAL_BROKER_PATH = os.getenv("LOCAL_BROKER_PATH", "broker.db")
+
+    # Modo de publicación: 'sync' espera la confirmación de Pub/Sub antes de responder,
+    # 'async' responde 202 de inmediato y la confirmación se registra en segundo plano,
+    # 'outbox' guarda el mensaje en un outbox local (SQLite) que se envía en segundo plano.
+    PUBLISH_MODE = os.getenv("PUBLISH_MODE", "sync")
+    PUBLISH_REGISTRY_SIZE = int(os.getenv("PUBLISH_REGISTRY_SIZE", "10000"))
+
+    # Hilos del pool en el que se ejecutan las vistas cuando la app se sirve por ASGI ('asgi.py').
+    # En modo 'sync' la espera de la confirmación de Pub/Sub ocurre en el event loop, no en estos hilos.
+    ASGI_MAX_THREADS = int(os.getenv("ASGI_MAX_THREADS", "32"))
+
+    # Outbox local: archivo SQLite en modo WAL, tamaño de lote, reintentos, circuit breaker y segundos
+    # máximos de espera de la confirmación de un lote.
+    OUTBOX_PATH = os.getenv("OUTBOX_PATH", "outbox.db")
+    OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "500"))
+    OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "0.05"))
+    OUTBOX_MAX_BACKOFF = float(os.getenv("OUTBOX_MAX_BACKOFF", "30"))
+    OUTBOX_BREAKER_THRESHOLD = int(os.getenv("OUTBOX_BREAKER_THRESHOLD", "5"))
+    OUTBOX_BREAKER_COOLDOWN = float(os.getenv("OUTBOX_BREAKER_COOLDOWN", "30"))
+    OUTBOX_PUBLISH_TIMEOUT = float(os.getenv("OUTBOX_PUBLISH_TIMEOUT", "30"))
+
+    # Lotes del cliente de Pub/Sub: las publicaciones concurrentes de varios hilos se agrupan
+    # en un mismo RPC hasta alcanzar cualquiera de estos límites.
+    PUBSUB_BATCH_MAX_MESSAGES = int(os.getenv("PUBSUB_BATCH_MAX_MESSAGES", "100"))
+    PUBSUB_BATCH_MAX_BYTES = int(os.getenv("PUBSUB_BATCH_MAX_BYTES", "1000000"))
+    PUBSUB_BATCH_MAX_LATENCY = float(os.getenv("PUBSUB_BATCH_MAX_LATENCY", "0.01"))
+
+    # Control de flujo del cliente de Pub/Sub: 'ignore', 'block' o 'error' al superar los límites.
+    PUBSUB_FLOW_MAX_MESSAGES = int(os.getenv("PUBSUB_FLOW_MAX_MESSAGES", "1000"))
+    PUBSUB_FLOW_MAX_BYTES = int(os.getenv("PUBSUB_FLOW_MAX_BYTES", "10000000"))
+    PUBSUB_FLOW_LIMIT_BEHAVIOR = os.getenv("PUBSUB_FLOW_LIMIT_BEHAVIOR", "ignore")
+
+    # Llaves de orden: los mensajes de una misma entidad raíz (problema o modelo) se entregan
+    # en orden. Requiere que la suscripción tenga habilitado el ordenamiento de mensajes.
+    PUBSUB_ENABLE_ORDERING = os.getenv("PUBSUB_ENABLE_ORDERING", "false").lower() == "true"
+
+    # Compresión de los mensajes: 'none', 'zlib' o 'zstd' (requiere 'zstandard'). Solo se
+    # comprimen los mensajes que superan el umbral en bytes; el códec viaja como atributo.
+    PUBSUB_COMPRESSION_CODEC = os.getenv("PUBSUB_COMPRESSION_CODEC", "none")
+    PUBSUB_COMPRESSION_THRESHOLD = int(os.getenv("PUBSUB_COMPRESSION_THRESHOLD", "1024"))
+
+    # Sobre de los mensajes: 'json' o 'msgpack' (binario compacto, requiere 'msgpack').
+    # El formato viaja como atributo, así que el suscriptor debe actualizarse primero.
+    PUBSUB_ENVELOPE = os.getenv("PUBSUB_ENVELOPE", "json")
+
+    # Cantidad de registros válidos que se publican juntos en los endpoints de carga masiva.
+    BULK_PUBLISH_BATCH_SIZE = int(os.getenv("BULK_PUBLISH_BATCH_SIZE", "500"))
+
+    # Control de admisión según los mensajes y bytes en vuelo hacia Pub/Sub. Entre el límite suave y
+    # el duro las escrituras esperan hasta ADMISSION_QUEUE_TIMEOUT segundos; por encima del duro se
+    # rechazan con 429 y el header Retry-After.
+    ADMISSION_SOFT_MAX_MESSAGES = int(os.getenv("ADMISSION_SOFT_MAX_MESSAGES", "500"))
+    ADMISSION_HARD_MAX_MESSAGES = int(os.getenv("ADMISSION_HARD_MAX_MESSAGES", "1000"))
+    ADMISSION_SOFT_MAX_BYTES = int(os.getenv("ADMISSION_SOFT_MAX_BYTES", "5000000"))
+    ADMISSION_HARD_MAX_BYTES = int(os.getenv("ADMISSION_HARD_MAX_BYTES", "10000000"))
+    ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "0.25"))
+    ADMISSION_RETRY_AFTER = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+
+    # Segundos máximos que un lote de la carga masiva espera a que baje la presión antes de
+    # rechazar sus líneas con estado 'REJECTED'.
+    ADMISSION_BULK_TIMEOUT = float(os.getenv("ADMISSION_BULK_TIMEOUT", "30"))
+
+    # Ventana en segundos en la que se combinan los PUT a una misma entidad en un solo mensaje
+    # (gana el último valor de cada campo). Con 0 no se combinan. En modo 'sync' la respuesta
+    # espera a que cierre la ventana.
+    WRITE_COMBINE_WINDOW = float(os.getenv("WRITE_COMBINE_WINDOW", "0"))
+
+    # Llaves de idempotencia (header 'Idempotency-Key'): cuántas se recuerdan en memoria, por cuántos
+    # segundos y, opcionalmente, el SQLite compartido entre procesos (vacío para usar solo memoria).
+    IDEMPOTENCY_MAX_SIZE = int(os.getenv("IDEMPOTENCY_MAX_SIZE", "10000"))
+    IDEMPOTENCY_TTL = float(os.getenv("IDEMPOTENCY_TTL", "86400"))
+    IDEMPOTENCY_PATH = os.getenv("IDEMPOTENCY_PATH", "")
+
+    # Valida las peticiones con los esquemas compilados de 'validation.py' en lugar de recorrer los
+    # esquemas de marshmallow en cada petición. Los mensajes de error son los mismos.
+    COMPILED_VALIDATION = os.getenv("COMPILED_VALIDATION", "true").lower() == "true"
+
+    # API de lectura (servicio suscriptor, conectado a la base de datos) que atiende los GET y caché
+    # de lecturas: cuántas respuestas se guardan y por cuántos segundos. La API de lectura es el
+    # 'wsgi.py' del suscriptor, que en local escucha en el puerto 8081; en Cloud Run es el servicio
+    # desplegado con SUBSCRIBER_ROLE=api y su URL se entrega en QUERY_API_URL.
+    QUERY_API_URL = os.getenv("QUERY_API_URL", "http://localhost:8081")
+    QUERY_API_TIMEOUT = float(os.getenv("QUERY_API_TIMEOUT", "5"))
+    READ_CACHE_SIZE = int(os.getenv("READ_CACHE_SIZE", "1000"))
+    READ_CACHE_TTL = float(os.getenv("READ_CACHE_TTL", "5"))
+
+    # Paginación por llave (keyset) de los listados: registros por página por defecto y máximo.
+    PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "100"))
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "1000"))
+
+    # Overlay de escrituras publicadas pero aún no consumidas que se combina con las respuestas de los
+    # GET (read-your-writes). Con PENDING_OVERLAY_SCOPE='identity' cada cliente solo ve las suyas.
+    PENDING_OVERLAY_SIZE = int(os.getenv("PENDING_OVERLAY_SIZE", "1000"))
+    PENDING_OVERLAY_TTL = float(os.getenv("PENDING_OVERLAY_TTL", "60"))
+    PENDING_OVERLAY_SCOPE = os.getenv("PENDING_OVERLAY_SCOPE", "global")
+
+    # Cliente HTTP hacia la API de lectura: conexiones keep-alive por host, timeout de conexión
+    # (QUERY_API_TIMEOUT es el de lectura), reintentos ante fallas y presupuesto de reintentos
+    # (fracción de las peticiones más un mínimo por segundo).
+    QUERY_POOL_MAXSIZE = int(os.getenv("QUERY_POOL_MAXSIZE", "10"))
+    QUERY_CONNECT_TIMEOUT = float(os.getenv("QUERY_CONNECT_TIMEOUT", "1"))
+    QUERY_MAX_RETRIES = int(os.getenv("QUERY_MAX_RETRIES", "2"))
+    QUERY_RETRY_BACKOFF = float(os.getenv("QUERY_RETRY_BACKOFF", "0.05"))
+    QUERY_RETRY_BUDGET_RATIO = float(os.getenv("QUERY_RETRY_BUDGET_RATIO", "0.2"))
+    QUERY_RETRY_MIN_PER_SECOND = float(os.getenv("QUERY_RETRY_MIN_PER_SECOND", "5"))
+
     # Una vez cree la instancia de CloudSQL debe proceder a crear una base de datos y un usuario. 
     # También, debe configurar la instancia de CloudSQL para que reciba tráfico desde nuestra IP pública.
     # Una vez tenga la IP configurada en CloudSQL y haya creado una base de datos y un usuario,
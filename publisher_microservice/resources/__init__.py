@@ -5,3 +5,5 @@ from resources.user import blp as UserBlueprint
 from resources.model import blp as ModelBlueprint
 from resources.problem import blp as ProblemBlueprint
 from resources.version import blp as VersionBlueprint
+from resources.publish import blp as PublishBlueprint
+from resources.metrics import blp as MetricsBlueprint
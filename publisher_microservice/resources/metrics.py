@@ -0,0 +1,37 @@
+"""Módulo que contiene las vistas 'métricas'."""
+
+# Librerías Externas.
+from flask import Response, jsonify
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+# Librerías Internas.
+from workers.publisher import registry, outbox, admission, combiner, idempotency, read_cache, overlay
+from workers.query import client
+
+
+blp = Blueprint("metrics", __name__, description = "Vistas relacionadas con 'métricas'.")
+
+
+@blp.route("/metrics")
+class Metrics(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    def get(self) -> Response:
+        """Método GET que permite consultar el estado interno del publicador.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente."""
+
+        metrics = {"registry": registry.stats(),
+                   "admission": admission.stats(),
+                   "idempotency": idempotency.stats(),
+                   "read_cache": read_cache.stats(),
+                   "overlay": overlay.stats(),
+                   "query_client": client.stats(),
+                   "outbox": outbox.stats() if outbox is not None else None,
+                   "combiner": combiner.stats() if combiner is not None else None}
+
+        return jsonify(metrics), 200
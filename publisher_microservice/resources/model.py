@@ -1,16 +1,18 @@
 """Módulo que contiene las vistas 'modelos'."""
 
 # Librerías Externas.
-from typing import Dict
+from typing import Any, Dict
 
-from flask import Response, jsonify
+from flask import Response, request, jsonify, stream_with_context
 from flask.views import MethodView
-from flask_smorest import Blueprint
 from flask_jwt_extended import jwt_required
 
 # Librerías Internas.
-from workers.publisher import publish_msg, structure_msg
-from schemas import PlainModelSchema, UpdateModelSchema, MessageSchema
+from validation import Blueprint
+from workers.bulk import ingest_ndjson
+from workers.query import read_list, read_record, conditional_response, stream_export
+from workers.publisher import publish_msg, structure_msg, idempotency, PUBLISH_STATUS_CODE
+from schemas import PlainModelSchema, UpdateModelSchema, MessageSchema, PaginationQuerySchema, ExportQuerySchema, FieldsQuerySchema
 
 
 blp = Blueprint("models", __name__, description = "Vistas relacionadas con 'modelos'.")
@@ -20,16 +22,21 @@ blp = Blueprint("models", __name__, description = "Vistas relacionadas con 'mode
 class ModelList(MethodView):
     """Clase que encapsula los verbos de la ruta definida."""
 
-    @blp.response(200, PlainModelSchema(many = True))
-    def get(self) -> Response:
+    @blp.arguments(PaginationQuerySchema, location = "query")
+    def get(self, pagination: Dict[str, Any]) -> Response:
         """Método GET que permite listar todos los modelos.
         
+        Args:
+        ----------
+        pagination: Dict[str, Any].
+            Cursor de la página anterior, límite de registros y campos solicitados.
+
         Returns:
         ----------
         Response.
             Respuesta enviada al cliente."""
 
-        pass
+        return conditional_response(*read_list("models", "/model", pagination))
 
 
 @blp.route("/problem/<string:problem_id>/model")
@@ -38,6 +45,7 @@ class ModelCreation(MethodView):
     
     #@jwt_required()
     @blp.arguments(PlainModelSchema)
+    @idempotency.guard
     def post(self, model_data: Dict[str, str], problem_id: str) -> Response:
         """Método POST que permite crear un problema.
 
@@ -53,22 +61,70 @@ class ModelCreation(MethodView):
                 
         pub_sub_msg = structure_msg(request_data = model_data, 
                                     request_ids = {"problem_id": problem_id}, 
-                                    table_name = "models", action = "POST")
+                                    table_name = "models", action = "POST",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para crear modelo."}), 200
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para crear modelo.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
+
+
+@blp.route("/model/bulk")
+class ModelBulk(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    #@jwt_required()
+    def post(self) -> Response:
+        """Método POST que permite crear modelos de forma masiva a partir de un
+        cuerpo NDJSON, validando cada línea y publicando los registros válidos en lotes.
+        Cada línea debe incluir el campo 'problem_id' del registro padre.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta en formato NDJSON con el resultado de cada línea."""
+
+        results = ingest_ndjson(request.stream, PlainModelSchema(), table_name = "models", id_field = "problem_id")
+
+        return Response(stream_with_context(results), mimetype = "application/x-ndjson")
+
+
+@blp.route("/model/export")
+class ModelExport(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.arguments(ExportQuerySchema, location = "query")
+    def get(self, export_args: Dict[str, str]) -> Response:
+        """Método GET que permite exportar todos los modelos en una respuesta por
+        partes (NDJSON o arreglo JSON), reenviada desde el servicio a medida que llega.
+
+        Args:
+        ----------
+        export_args: Dict[str, str].
+            Formato de la exportación y campos solicitados.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente por partes."""
+
+        return stream_export("/model/export", export_args)
 
 
 @blp.route("/problem/<string:problem_id>/model/<string:model_id>")
 class Model(MethodView):
     """Clase que encapsula los verbos de la ruta definida."""
     
-    def get(self, problem_id: str, model_id: str) -> Response:
+    @blp.arguments(FieldsQuerySchema, location = "query")
+    def get(self, fields_args: Dict[str, str], problem_id: str, model_id: str) -> Response:
         """Método GET que permite obtener un modelo de un problema determinado.
 
         Args:
         ----------
+        fields_args: Dict[str, str].
+            Campos solicitados.
+
         problem_id: str.
             ID del problema.
         
@@ -79,9 +135,13 @@ class Model(MethodView):
         ----------
         Response.
             Respuesta enviada al cliente."""
-        
-        pass
+
+        path = f"/problem/{problem_id}/model/{model_id}"
+
+        return conditional_response(*read_record("models", path, model_id, fields_args.get("fieldset"),
+                                                 parent_ids = {"problem_id": problem_id}))
     
+    @idempotency.guard
     def delete(self, problem_id: str, model_id: str) -> Response:
         """Método GET que permite obtener un modelo de un problema determinado.
 
@@ -101,13 +161,16 @@ class Model(MethodView):
         pub_sub_msg = structure_msg(request_data = None, 
                                     request_ids = {"problem_id": problem_id, 
                                                    "model_id": model_id}, 
-                                    table_name = "models", action = "DELETE")
+                                    table_name = "models", action = "DELETE",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para eliminar modelo."}), 200
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para eliminar modelo.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
     
     @blp.arguments(UpdateModelSchema)
+    @idempotency.guard
     def put(self, model_data: Dict[str, str], problem_id: str, model_id: str) -> Response:
         """Método PUT que permite crear o actualizar un problema particular.
         
@@ -127,8 +190,10 @@ class Model(MethodView):
         pub_sub_msg = structure_msg(request_data = model_data, 
                                     request_ids = {"problem_id": problem_id, 
                                                    "model_id": model_id}, 
-                                    table_name = "models", action = "PUT")
+                                    table_name = "models", action = "PUT",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para actualizar modelo."}), 200
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para actualizar modelo.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
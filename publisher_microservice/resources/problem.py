@@ -1,17 +1,19 @@
 """Módulo que contiene las vistas 'problemas'."""
 
 # Librerías Externas.
-from typing import Dict
+from typing import Any, Dict
 
-from flask import Response, request, jsonify
+from flask import Response, request, jsonify, stream_with_context
 from flask.views import MethodView
-from flask_smorest import Blueprint
 from flask_jwt_extended import jwt_required
 
 # Librerías Internas.
-from workers.publisher import publish_msg, structure_msg
+from validation import Blueprint
+from workers.bulk import ingest_ndjson
+from workers.query import read_list, read_record, conditional_response, stream_export
+from workers.publisher import publish_msg, structure_msg, idempotency, PUBLISH_STATUS_CODE
 
-from schemas import PlainProblemSchema, UpdateProblemSchema, MessageSchema
+from schemas import PlainProblemSchema, UpdateProblemSchema, MessageSchema, PaginationQuerySchema, ExportQuerySchema, FieldsQuerySchema
 
 
 blp = Blueprint("problem", __name__, description = "Vistas relacionadas con 'problemas'.")
@@ -22,22 +24,27 @@ class ProblemList(MethodView):
     """Clase que encapsula los verbos de la ruta definida."""
 
     #@blp.response(200, PlainProblemSchema(many = True))
-    def get(self) -> Response:
+    @blp.arguments(PaginationQuerySchema, location = "query")
+    def get(self, pagination: Dict[str, Any]) -> Response:
         """Método GET que permite enviar a un servicio un requests y que este
         nos devuelva todos los problemas registrados.
         
+        Args:
+        ----------
+        pagination: Dict[str, Any].
+            Cursor de la página anterior, límite de registros y campos solicitados.
+
         Returns:
         ----------
         Response.
             Respuesta enviada al cliente gracias a la información suministrada
             por el servicio."""
 
-        # Debemos enviar un GET request a la API 2 (conectada a CloudSQL).
-
-        pass
+        return conditional_response(*read_list("problems", "/problem", pagination))
     
     #@jwt_required()
     @blp.arguments(PlainProblemSchema)
+    @idempotency.guard
     def post(self, problem_data: Dict[str, str]) -> Response:
         """Método POST que permite enviar a Pub/Sub la información para crear
         un problema.
@@ -53,23 +60,70 @@ class ProblemList(MethodView):
             Respuesta enviada al cliente para que sepa que la petición fue enviada."""
         
         pub_sub_msg = structure_msg(request_data = problem_data, request_ids = None, 
-                                    table_name = "problems", action = "POST")
+                                    table_name = "problems", action = "POST",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para crear problema."}), 200
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para crear problema.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
+
+
+@blp.route("/problem/bulk")
+class ProblemBulk(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    #@jwt_required()
+    def post(self) -> Response:
+        """Método POST que permite crear problemas de forma masiva a partir de un
+        cuerpo NDJSON, validando cada línea y publicando los registros válidos en lotes.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta en formato NDJSON con el resultado de cada línea."""
+
+        results = ingest_ndjson(request.stream, PlainProblemSchema(), table_name = "problems")
+
+        return Response(stream_with_context(results), mimetype = "application/x-ndjson")
+
+
+@blp.route("/problem/export")
+class ProblemExport(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.arguments(ExportQuerySchema, location = "query")
+    def get(self, export_args: Dict[str, str]) -> Response:
+        """Método GET que permite exportar todos los problemas en una respuesta por
+        partes (NDJSON o arreglo JSON), reenviada desde el servicio a medida que llega.
+
+        Args:
+        ----------
+        export_args: Dict[str, str].
+            Formato de la exportación y campos solicitados.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente por partes."""
+
+        return stream_export("/problem/export", export_args)
 
 
 @blp.route("/problem/<string:problem_id>")
 class Problem(MethodView):
     """Clase que encapsula los verbos de la ruta definida."""
 
-    def get(self, problem_id: str) -> Response:
+    @blp.arguments(FieldsQuerySchema, location = "query")
+    def get(self, fields_args: Dict[str, str], problem_id: str) -> Response:
         """Método GET que permite enviar a un servicio un requests y que este
         nos devuelva el problema solicitado.
         
         Args:
         ----------
+        fields_args: Dict[str, str].
+            Campos solicitados.
+
         problem_id: str.
             ID del problema a consultar.
         
@@ -77,12 +131,13 @@ class Problem(MethodView):
         ----------
         Response.
             Respuesta enviada al cliente."""
-                
-        # Debemos enviar un GET request a la API 2 (conectada a CloudSQL).
 
-        pass
+        path = f"/problem/{problem_id}"
+
+        return conditional_response(*read_record("problems", path, problem_id, fields_args.get("fieldset")))
 
     @blp.arguments(UpdateProblemSchema)
+    @idempotency.guard
     def put(self, problem_data: Dict[str, str], problem_id: str) -> Response:
         """Método PUT que permite crear o actualizar un problema particular.
         
@@ -101,12 +156,15 @@ class Problem(MethodView):
                 
         pub_sub_msg = structure_msg(request_data = problem_data, 
                                     request_ids = {"problem_id": problem_id}, 
-                                    table_name = "problems", action = "PUT")
+                                    table_name = "problems", action = "PUT",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para actualizar problema."}), 200
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para actualizar problema.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
 
+    @idempotency.guard
     def delete(self, problem_id: str) -> Response:
         """Método DELETE que permite eliminar problema particular.
         
@@ -123,8 +181,10 @@ class Problem(MethodView):
 
         pub_sub_msg = structure_msg(request_data = None, 
                                     request_ids = {"problem_id": problem_id}, 
-                                    table_name = "problems", action = "DELETE")
+                                    table_name = "problems", action = "DELETE",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para eliminar problema."}), 200
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para eliminar problema.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
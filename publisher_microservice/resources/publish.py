@@ -0,0 +1,37 @@
+"""Módulo que contiene las vistas 'publicaciones'."""
+
+# Librerías Externas.
+from flask import Response, jsonify
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+
+# Librerías Internas.
+from workers.publisher import registry
+
+
+blp = Blueprint("publish", __name__, description = "Vistas relacionadas con 'publicaciones'.")
+
+
+@blp.route("/publish/<string:request_id>")
+class PublishStatus(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    def get(self, request_id: str) -> Response:
+        """Método GET que permite consultar el estado de una publicación en Pub/Sub.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la petición devuelto al publicar.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente."""
+
+        entry = registry.get(request_id)
+
+        if entry is None:
+            abort(404, message = f"No existe un registro para la petición {request_id}.")
+
+        return jsonify(entry), 200
@@ -5,9 +5,9 @@ from typing import Dict
 
 from flask import Response
 from flask.views import MethodView
-from flask_smorest import Blueprint
 
 # Librerías Internas.
+from validation import Blueprint
 from schemas import PlainUserSchema, MessageSchema
 
 
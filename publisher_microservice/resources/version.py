@@ -1,16 +1,18 @@
 """Módulo que contiene las vistas 'versiones'."""
 
 # Librerías Externas.
-from typing import Dict
+from typing import Any, Dict
 
-from flask import Response, jsonify
+from flask import Response, request, jsonify, stream_with_context
 from flask.views import MethodView
-from flask_smorest import Blueprint
 from flask_jwt_extended import jwt_required
 
 # Librerías Internas.
-from workers.publisher import publish_msg, structure_msg
-from schemas import PlainVersionSchema, UpdateVersionSchema, MessageSchema
+from validation import Blueprint
+from workers.bulk import ingest_ndjson
+from workers.query import read_list, read_record, conditional_response, stream_export
+from workers.publisher import publish_msg, structure_msg, idempotency, PUBLISH_STATUS_CODE
+from schemas import PlainVersionSchema, UpdateVersionSchema, MessageSchema, PaginationQuerySchema, ExportQuerySchema, FieldsQuerySchema
 
 
 blp = Blueprint("versions", __name__, description = "Vistas relacionadas con 'versions'.")
@@ -20,17 +22,21 @@ blp = Blueprint("versions", __name__, description = "Vistas relacionadas con 've
 class VersionList(MethodView):
     """Clase que encapsula los verbos de la ruta definida."""
 
-    def get(self) -> Response:
+    @blp.arguments(PaginationQuerySchema, location = "query")
+    def get(self, pagination: Dict[str, Any]) -> Response:
         """Método GET que permite consultar a un microservicio todas las versiones.
         
+        Args:
+        ----------
+        pagination: Dict[str, Any].
+            Cursor de la página anterior, límite de registros y campos solicitados.
+
         Returns:
         ----------
         Response.
             Respuesta enviada al cliente por el microservicio."""
 
-        # Debemos enviar un requests a la API 2 con la información de IDs.
-
-        pass
+        return conditional_response(*read_list("versions", "/version", pagination))
 
 
 @blp.route("/model/<string:model_id>/version")
@@ -39,6 +45,7 @@ class VersionCreation(MethodView):
     
     #@jwt_required()
     @blp.arguments(PlainVersionSchema)
+    @idempotency.guard
     def post(self, version_data: Dict[str, str], model_id: str) -> Response:
         """Método POST que permite crear un problema.
 
@@ -56,12 +63,56 @@ class VersionCreation(MethodView):
             Respuesta enviada al cliente."""
         
         pub_sub_msg = structure_msg(request_data = version_data, request_ids = {"model_id": model_id}, 
-                                    table_name = "versions", action = "POST")
+                                    table_name = "versions", action = "POST",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para crear versión."}), 200
-    
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para crear versión.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
+
+
+@blp.route("/version/bulk")
+class VersionBulk(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    #@jwt_required()
+    def post(self) -> Response:
+        """Método POST que permite crear versiones de forma masiva a partir de un
+        cuerpo NDJSON, validando cada línea y publicando los registros válidos en lotes.
+        Cada línea debe incluir el campo 'model_id' del registro padre.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta en formato NDJSON con el resultado de cada línea."""
+
+        results = ingest_ndjson(request.stream, PlainVersionSchema(), table_name = "versions", id_field = "model_id")
+
+        return Response(stream_with_context(results), mimetype = "application/x-ndjson")
+
+
+@blp.route("/version/export")
+class VersionExport(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.arguments(ExportQuerySchema, location = "query")
+    def get(self, export_args: Dict[str, str]) -> Response:
+        """Método GET que permite exportar todas las versiones en una respuesta por
+        partes (NDJSON o arreglo JSON), reenviada desde el servicio a medida que llega.
+
+        Args:
+        ----------
+        export_args: Dict[str, str].
+            Formato de la exportación y campos solicitados.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente por partes."""
+
+        return stream_export("/version/export", export_args)
+
 
 @blp.route("/version/<string:version_id>/promote")
 class VersionPromotion(MethodView):
@@ -108,11 +159,15 @@ class VersionDeprecation(MethodView):
 class Model(MethodView):
     """Clase que encapsula los verbos de la ruta definida."""
     
-    def get(self, model_id: str, version_id: str) -> Response:
+    @blp.arguments(FieldsQuerySchema, location = "query")
+    def get(self, fields_args: Dict[str, str], model_id: str, version_id: str) -> Response:
         """Método GET que permite obtener un modelo de un problema determinado.
 
         Args:
         ----------
+        fields_args: Dict[str, str].
+            Campos solicitados.
+
         model_id: str.
             ID del modelo.
         
@@ -123,9 +178,13 @@ class Model(MethodView):
         ----------
         Response.
             Respuesta enviada al cliente."""
-        
-        pass
+
+        path = f"/model/{model_id}/version/{version_id}"
+
+        return conditional_response(*read_record("versions", path, version_id, fields_args.get("fieldset"),
+                                                 parent_ids = {"model_id": model_id}))
     
+    @idempotency.guard
     def delete(self, model_id: str, version_id: str) -> Response:
         """Método GET que permite obtener un modelo de un problema determinado.
 
@@ -145,13 +204,16 @@ class Model(MethodView):
         pub_sub_msg = structure_msg(request_data = None, 
                                     request_ids = {"model_id": model_id, 
                                                    "version_id": version_id}, 
-                                    table_name = "versions", action = "DELETE")
+                                    table_name = "versions", action = "DELETE",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para eliminar versión."}), 200
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para eliminar versión.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
     
     @blp.arguments(UpdateVersionSchema)
+    @idempotency.guard
     def put(self, version_data: Dict[str, str], model_id: str, version_id: str) -> Response:
         """Método PUT que permite crear o actualizar un problema particular.
         
@@ -174,8 +236,10 @@ class Model(MethodView):
         pub_sub_msg = structure_msg(request_data = version_data, 
                                     request_ids = {"model_id": model_id, 
                                                    "version_id": version_id}, 
-                                    table_name = "versions", action = "PUT")
+                                    table_name = "versions", action = "PUT",
+                                    request_id = request.headers.get("X-Request-ID"))
 
-        publish_msg(pub_sub_msg)
+        request_id = publish_msg(pub_sub_msg)
         
-        return jsonify({"status": "Mensaje enviado a Pub/Sub para actualizar versión."}), 200
+        return jsonify({"status": "Mensaje enviado a Pub/Sub para actualizar versión.",
+                        "request_id": request_id}), PUBLISH_STATUS_CODE
@@ -5,6 +5,9 @@ from typing import Dict
 
 from marshmallow import Schema, fields, validate, post_load, validates, ValidationError
 
+# Librerías Internas.
+from config import Config
+
 
 URL_REGEX = r"^(https?:\/\/)?([\w\-]+\.)+[\w\-]+(\/[\w\-._~:/?#[\]@!$&'()*+,;=]*)?$"
 
@@ -15,6 +18,34 @@ class MessageSchema(Schema):
     message = fields.Str(dump_only = True)
 
 
+class FieldsQuerySchema(Schema):
+    """Clase que contiene el esquema del parámetro de selección de campos de las lecturas."""
+
+    fieldset = fields.Str(required = False, data_key = "fields",
+                          error_messages = {"invalid": "Los campos deben ser un string separado por comas."})
+
+
+class PaginationQuerySchema(FieldsQuerySchema):
+    """Clase que contiene el esquema de los parámetros de paginación de los listados."""
+
+    cursor = fields.Str(required = False,
+                        error_messages = {"invalid": "El cursor debe ser un string."})
+
+    limit = fields.Int(required = False, load_default = Config.PAGE_SIZE_DEFAULT,
+                       validate = validate.Range(min = 1, max = Config.PAGE_SIZE_MAX,
+                                                 error = f"El límite debe estar entre 1 y {Config.PAGE_SIZE_MAX}."),
+                       error_messages = {"invalid": "El límite debe ser un entero."})
+
+
+class ExportQuerySchema(FieldsQuerySchema):
+    """Clase que contiene el esquema de los parámetros de las exportaciones."""
+
+    format = fields.Str(required = False, load_default = "ndjson",
+                        validate = validate.OneOf(choices = ["ndjson", "json"],
+                                                  error = "El formato debe ser ('ndjson', 'json')."),
+                        error_messages = {"invalid": "El formato debe ser un string."})
+
+
 class PlainProblemSchema(Schema):
     """Clase que contiene los esquemas de validación para 'problem'."""
 
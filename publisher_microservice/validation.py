@@ -0,0 +1,508 @@
+"""Módulo que contiene la validación compilada de los esquemas de 'schemas.py'.
+
+Cada esquema se recorre una sola vez y se traduce a una lista de chequeos
+especializados por campo (tipo, longitud, regex, opciones). Una petición
+válida solo pasa por esos chequeos; ante cualquier falla se delega en el
+campo de marshmallow para producir exactamente el mismo mensaje de error.
+Los esquemas siguen siendo la fuente de la documentación OpenAPI."""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import threading
+from collections.abc import Mapping
+
+import flask_smorest
+from webargs.flaskparser import FlaskParser
+from marshmallow import Schema, fields, validate, ValidationError, RAISE, INCLUDE, EXCLUDE, missing
+from marshmallow.decorators import PRE_LOAD, POST_LOAD, VALIDATES, VALIDATES_SCHEMA
+from marshmallow.error_store import ErrorStore
+
+# Librerías Internas.
+import schemas
+from config import Config
+
+
+FAST_FIELDS = (fields.String, fields.Raw)
+
+
+def _compile_check(validator: Callable[[Any], Any]) -> Optional[Callable[[Any], bool]]:
+    """Función que traduce un validador de marshmallow a un predicado rápido.
+
+    Args:
+    ----------
+    validator: Callable[[Any], Any].
+        Validador del campo.
+
+    Returns:
+    ----------
+    Optional[Callable[[Any], bool]].
+        Predicado equivalente, o None si el validador no tiene traducción."""
+
+    if type(validator) is validate.Length:
+        minimum, maximum, equal = validator.min, validator.max, validator.equal
+
+        if equal is not None:
+            return lambda value: len(value) == equal
+
+        return lambda value: ((minimum is None or len(value) >= minimum)
+                              and (maximum is None or len(value) <= maximum))
+
+    if type(validator) is validate.Regexp:
+        match = validator.regex.match
+        return lambda value: match(value) is not None
+
+    if type(validator) is validate.OneOf:
+        try:
+            choices = frozenset(validator.choices)
+        except TypeError:
+            return None
+
+        return lambda value: value in choices
+
+    return None
+
+
+class CompiledField:
+    """Clase que encapsula los chequeos compilados de un campo."""
+
+    __slots__ = ("name", "data_key", "attribute", "field", "kind", "checks")
+
+    def __init__(self, name: str, field: fields.Field) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        name: str.
+            Nombre del campo en el esquema.
+
+        field: fields.Field.
+            Campo de marshmallow."""
+
+        self.name = name
+        self.field = field
+        self.data_key = field.data_key if field.data_key is not None else name
+        self.attribute = field.attribute or name
+
+        checks = [_compile_check(validator) for validator in field.validators]
+
+        # Solo los campos String y Raw exactos con validadores traducibles tienen
+        # camino rápido; el resto siempre se delega en marshmallow.
+        if type(field) in FAST_FIELDS and None not in checks:
+            self.kind = type(field)
+            self.checks = tuple(checks)
+        else:
+            self.kind = None
+            self.checks = ()
+
+    def load(self, value: Any, data: Dict[str, Any]) -> Any:
+        """Método que valida y deserializa el valor del campo.
+
+        Args:
+        ----------
+        value: Any.
+            Valor recibido.
+
+        data: Dict[str, Any].
+            Datos completos recibidos.
+
+        Returns:
+        ----------
+        Any.
+            Valor deserializado."""
+
+        if self.kind is fields.String and type(value) is str:
+            for check in self.checks:
+                if not check(value):
+                    break
+            else:
+                return value
+
+        elif self.kind is fields.Raw and value is not None and value is not missing and not self.checks:
+            return value
+
+        return self.field.deserialize(value, self.name, data)
+
+
+class CompiledSchema:
+    """Clase que encapsula la validación compilada de un esquema."""
+
+    def __init__(self, schema: Schema) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        schema: Schema.
+            Esquema de marshmallow a compilar."""
+
+        self.schema = schema
+        self.fields = [CompiledField(name, field) for name, field in schema.load_fields.items()]
+        self.data_keys = {field.data_key for field in self.fields}
+
+        self.field_validators: List[Tuple[str, str, Callable[[Any], Any]]] = []
+
+        for attr_name, _, validator_kwargs in schema._hooks[VALIDATES]:
+            field_name = validator_kwargs["field_name"]
+
+            if field_name not in schema.fields:
+                continue
+
+            field = schema.fields[field_name]
+            self.field_validators.append((field.data_key if field.data_key is not None else field_name,
+                                          field.attribute or field_name, getattr(schema, attr_name)))
+
+        self.post_loads = [getattr(schema, attr_name) for attr_name, _, _ in schema._hooks[POST_LOAD]]
+
+    @staticmethod
+    def supports(schema: Schema) -> bool:
+        """Método que indica si un esquema puede compilarse. Los esquemas con
+        opciones o ganchos no soportados se validan con marshmallow.
+
+        Args:
+        ----------
+        schema: Schema.
+            Esquema de marshmallow.
+
+        Returns:
+        ----------
+        bool.
+            True si el esquema puede compilarse."""
+
+        hooks = schema._hooks
+
+        if schema.many or schema.partial or hooks[PRE_LOAD] or hooks[VALIDATES_SCHEMA]:
+            return False
+
+        if any(hook_many or processor_kwargs.get("pass_original")
+               for _, hook_many, processor_kwargs in hooks[POST_LOAD]):
+            return False
+
+        return not any("." in (field.attribute or "") for field in schema.load_fields.values())
+
+    def load(self, data: Any, unknown: Optional[str] = None) -> Dict[str, Any]:
+        """Método que valida y deserializa los datos, con el mismo resultado y
+        los mismos errores que 'Schema.load'.
+
+        Args:
+        ----------
+        data: Any.
+            Datos recibidos.
+
+        unknown: Optional[str].
+            Manejo de campos desconocidos; por defecto el del esquema.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Datos deserializados."""
+
+        schema = self.schema
+        unknown = unknown or schema.unknown
+        error_store = ErrorStore()
+        result: Dict[str, Any] = {}
+
+        if not isinstance(data, Mapping):
+            error_store.store_error([schema.error_messages["type"]])
+        else:
+            for field in self.fields:
+                try:
+                    value = field.load(data.get(field.data_key, missing), data)
+                except ValidationError as error:
+                    error_store.store_error(error.messages, field.data_key)
+                    continue
+
+                if value is not missing:
+                    result[field.attribute] = value
+
+            if unknown != EXCLUDE:
+                for key in set(data) - self.data_keys:
+                    if unknown == INCLUDE:
+                        result[key] = data[key]
+                    elif unknown == RAISE:
+                        error_store.store_error([schema.error_messages["unknown"]], key)
+
+        for data_key, attribute, validator in self.field_validators:
+            if attribute not in result:
+                continue
+
+            try:
+                validated_value = validator(result[attribute])
+            except ValidationError as error:
+                error_store.store_error(error.messages, data_key)
+                validated_value = missing
+
+            if validated_value is missing:
+                result.pop(attribute, None)
+
+        if not error_store.errors:
+            try:
+                for post_load in self.post_loads:
+                    result = post_load(result, many = False, partial = None)
+            except ValidationError as error:
+                error_store.store_error(error.normalized_messages())
+
+        if error_store.errors:
+            error = ValidationError(error_store.errors, data = data, valid_data = result)
+            schema.handle_error(error, data, many = False, partial = None)
+            raise error
+
+        return result
+
+
+_compiled: Dict[Schema, Optional[CompiledSchema]] = {}
+_compiled_lock = threading.Lock()
+
+# Se apaga si la verificación de arranque encuentra diferencias con marshmallow.
+_enabled = True
+
+
+def _samples(schema: Schema) -> List[Any]:
+    """Función que arma entradas de prueba para comparar un esquema compilado
+    con marshmallow: datos que no son un diccionario, campos faltantes,
+    desconocidos, de tipo incorrecto, vacíos, nulos, muy largos y valores
+    plausibles para cada campo.
+
+    Args:
+    ----------
+    schema: Schema.
+        Esquema de marshmallow.
+
+    Returns:
+    ----------
+    List[Any].
+        Entradas de prueba."""
+
+    data_keys = [field.data_key or name for name, field in schema.load_fields.items()]
+    plausible = {}
+
+    for name, field in schema.load_fields.items():
+        choices = [validator.choices for validator in field.validators if isinstance(validator, validate.OneOf)]
+
+        if choices:
+            plausible[field.data_key or name] = list(choices[0])[0]
+        elif isinstance(field, fields.String):
+            plausible[field.data_key or name] = "valor"
+        else:
+            plausible[field.data_key or name] = {"train": 0.9, "validation": 0.8}
+
+    samples: List[Any] = ["no es un diccionario", {}, {"__desconocido__": 1}, plausible,
+                          {**plausible, "__desconocido__": 1}]
+
+    for value in (123, "", None, "a" * 5000, ["a"]):
+        samples.append({key: value for key in data_keys})
+
+    return samples
+
+def _outcome(load_fn: Callable[[Any], Dict[str, Any]], data: Any) -> Tuple[str, Any]:
+    """Función que ejecuta una carga y retorna su resultado o sus errores.
+
+    Args:
+    ----------
+    load_fn: Callable[[Any], Dict[str, Any]].
+        Función de carga.
+
+    data: Any.
+        Datos de entrada.
+
+    Returns:
+    ----------
+    Tuple[str, Any].
+        ("ok", datos) o ("error", mensajes)."""
+
+    try:
+        return "ok", load_fn(data)
+    except ValidationError as error:
+        return "error", error.messages
+
+def _matches(schema: Schema, compiled: CompiledSchema) -> bool:
+    """Función que compara el esquema compilado con 'Schema.load' sobre las
+    entradas de prueba del esquema.
+
+    Args:
+    ----------
+    schema: Schema.
+        Esquema de marshmallow.
+
+    compiled: CompiledSchema.
+        Esquema compilado.
+
+    Returns:
+    ----------
+    bool.
+        True si ambos producen los mismos datos y los mismos errores."""
+
+    for data in _samples(schema):
+        try:
+            if _outcome(compiled.load, data) != _outcome(schema.load, data):
+                return False
+        except Exception:
+            return False
+
+    return True
+
+
+def compile_schema(schema: Schema) -> Optional[CompiledSchema]:
+    """Función que compila un esquema una sola vez por instancia.
+
+    Args:
+    ----------
+    schema: Schema.
+        Esquema de marshmallow.
+
+    Returns:
+    ----------
+    Optional[CompiledSchema].
+        Esquema compilado, o None si no es compilable."""
+
+    try:
+        return _compiled[schema]
+    except KeyError:
+        pass
+
+    with _compiled_lock:
+        if schema not in _compiled:
+            # El compilador lee los ganchos privados de marshmallow ('_hooks'); si su forma cambia
+            # o el resultado difiere del de 'Schema.load', el esquema se valida con marshmallow.
+            try:
+                compiled = CompiledSchema(schema) if CompiledSchema.supports(schema) else None
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                print(f"No se pudo compilar el esquema {type(schema).__name__}, se usa marshmallow: {e}")
+                compiled = None
+
+            if compiled is not None and not _matches(schema, compiled):
+                print(f"El esquema compilado {type(schema).__name__} difiere de marshmallow, se usa marshmallow.")
+                compiled = None
+
+            _compiled[schema] = compiled
+
+        return _compiled[schema]
+
+def self_check() -> bool:
+    """Función que, al iniciar la app, compila y compara con marshmallow todos
+    los esquemas de 'schemas.py'. Si alguno no se comporta igual, se apaga la
+    validación compilada y todas las peticiones usan el parser de marshmallow.
+
+    Returns:
+    ----------
+    bool.
+        True si la validación compilada queda habilitada."""
+
+    global _enabled
+
+    if not Config.COMPILED_VALIDATION:
+        return False
+
+    for schema_class in vars(schemas).values():
+        if not (isinstance(schema_class, type) and issubclass(schema_class, Schema)
+                and schema_class.__module__ == schemas.__name__):
+            continue
+
+        schema = schema_class()
+
+        try:
+            supported = CompiledSchema.supports(schema)
+        except (AttributeError, KeyError, TypeError):
+            supported = True
+
+        if supported and compile_schema(schema) is None:
+            print("La validación compilada está deshabilitada, se valida con marshmallow.")
+            _enabled = False
+            break
+
+    return _enabled
+
+def load(schema: Schema, data: Any, unknown: Optional[str] = None) -> Dict[str, Any]:
+    """Función que valida datos con el esquema compilado si está habilitado y
+    es posible, o con marshmallow en caso contrario.
+
+    Args:
+    ----------
+    schema: Schema.
+        Esquema de marshmallow.
+
+    data: Any.
+        Datos recibidos.
+
+    unknown: Optional[str].
+        Manejo de campos desconocidos.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Datos deserializados."""
+
+    compiled = compile_schema(schema) if Config.COMPILED_VALIDATION and _enabled else None
+
+    if compiled is None:
+        return schema.load(data, **({"unknown": unknown} if unknown else {}))
+
+    return compiled.load(data, unknown = unknown)
+
+
+class _CompiledLoader:
+    """Clase que envuelve un esquema para que webargs lo cargue con su versión compilada."""
+
+    def __init__(self, schema: Schema) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        schema: Schema.
+            Esquema de marshmallow."""
+
+        self.schema = schema
+
+    def load(self, data: Any, unknown: Optional[str] = None) -> Dict[str, Any]:
+        """Método que valida los datos con el esquema compilado.
+
+        Args:
+        ----------
+        data: Any.
+            Datos recibidos.
+
+        unknown: Optional[str].
+            Manejo de campos desconocidos.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Datos deserializados."""
+
+        return load(self.schema, data, unknown = unknown)
+
+    def __getattr__(self, name: str) -> Any:
+        """Método que delega el resto de atributos en el esquema original."""
+
+        return getattr(self.schema, name)
+
+
+class CompiledParser(FlaskParser):
+    """Clase que reemplaza el parser de flask-smorest para validar con los
+    esquemas compilados. El resto del flujo de webargs no cambia."""
+
+    def _process_location_data(self, location_data: Any, schema: Schema, *args: Any, **kwargs: Any) -> Any:
+        """Método que valida los datos de una ubicación de la petición.
+
+        Args:
+        ----------
+        location_data: Any.
+            Datos de la ubicación.
+
+        schema: Schema.
+            Esquema de marshmallow.
+
+        Returns:
+        ----------
+        Any.
+            Datos deserializados."""
+
+        if Config.COMPILED_VALIDATION and _enabled and compile_schema(schema) is not None:
+            schema = _CompiledLoader(schema)
+
+        return super()._process_location_data(location_data, schema, *args, **kwargs)
+
+
+class Blueprint(flask_smorest.Blueprint):
+    """Clase Blueprint de flask-smorest que valida sus argumentos con los esquemas compilados."""
+
+    ARGUMENTS_PARSER = CompiledParser()
@@ -0,0 +1,170 @@
+"""Módulo que contiene el control de admisión de peticiones según la presión de publicación."""
+
+# Librerías Externas.
+from typing import Any, Dict, Optional
+
+import threading
+from concurrent.futures import Future
+
+
+class AdmissionController:
+    """Clase que lleva la cuenta de los mensajes y bytes en vuelo hacia
+    Pub/Sub y decide si una nueva petición de escritura se admite.
+
+    Por debajo del límite suave las peticiones pasan de inmediato. Entre el
+    límite suave y el duro esperan un momento a que baje la presión. Por
+    encima del límite duro se rechazan de inmediato, salvo los lotes de la
+    carga masiva, que esperan a que baje la presión."""
+
+    OK = "OK"
+    SOFT = "SOFT"
+    HARD = "HARD"
+
+    def __init__(self, soft_max_messages: int = 500, hard_max_messages: int = 1000,
+                 soft_max_bytes: int = 5000000, hard_max_bytes: int = 10000000,
+                 queue_timeout: float = 0.25) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        soft_max_messages: int.
+            Mensajes en vuelo a partir de los cuales las peticiones esperan.
+
+        hard_max_messages: int.
+            Mensajes en vuelo a partir de los cuales las peticiones se rechazan.
+
+        soft_max_bytes: int.
+            Bytes en vuelo a partir de los cuales las peticiones esperan.
+
+        hard_max_bytes: int.
+            Bytes en vuelo a partir de los cuales las peticiones se rechazan.
+
+        queue_timeout: float.
+            Segundos máximos que una petición espera entre ambos límites."""
+
+        self.soft_max_messages = soft_max_messages
+        self.hard_max_messages = hard_max_messages
+        self.soft_max_bytes = soft_max_bytes
+        self.hard_max_bytes = hard_max_bytes
+        self.queue_timeout = queue_timeout
+
+        self._condition = threading.Condition()
+
+        self.in_flight_messages = 0
+        self.in_flight_bytes = 0
+
+        self.counters = {"admitted": 0, "queued": 0, "rejected": 0, "peak_messages": 0, "peak_bytes": 0}
+
+    def _state(self, incoming_bytes: int = 0) -> str:
+        """Método que clasifica la presión actual. Se debe llamar con el candado tomado.
+
+        Args:
+        ----------
+        incoming_bytes: int.
+            Bytes de la petición que se quiere admitir.
+
+        Returns:
+        ----------
+        str.
+            'OK', 'SOFT' o 'HARD'."""
+
+        if (self.in_flight_messages >= self.hard_max_messages
+                or self.in_flight_bytes + incoming_bytes > self.hard_max_bytes):
+            return self.HARD
+
+        if (self.in_flight_messages >= self.soft_max_messages
+                or self.in_flight_bytes + incoming_bytes > self.soft_max_bytes):
+            return self.SOFT
+
+        return self.OK
+
+    def admit(self, incoming_bytes: int = 0, timeout: Optional[float] = None, wait_on_hard: bool = False) -> bool:
+        """Método que decide si se admite una petición o un lote de mensajes.
+
+        Args:
+        ----------
+        incoming_bytes: int.
+            Bytes que se quieren publicar. Se cuentan hasta el límite suave, para
+            que una petición más grande que el límite duro no se rechace siempre.
+
+        timeout: Optional[float].
+            Segundos máximos de espera; si es None se usa 'queue_timeout'.
+
+        wait_on_hard: bool.
+            Si es True también espera por encima del límite duro, en lugar de
+            rechazar de inmediato.
+
+        Returns:
+        ----------
+        bool.
+            True si la petición se admite."""
+
+        incoming_bytes = min(incoming_bytes, self.soft_max_bytes)
+        settled = (self.OK,) if wait_on_hard else (self.OK, self.HARD)
+
+        with self._condition:
+            state = self._state(incoming_bytes)
+
+            if state == self.SOFT or (state == self.HARD and wait_on_hard):
+                self.counters["queued"] += 1
+                self._condition.wait_for(lambda: self._state(incoming_bytes) in settled,
+                                         timeout = self.queue_timeout if timeout is None else timeout)
+                state = self._state(incoming_bytes)
+
+            if state == self.HARD:
+                self.counters["rejected"] += 1
+                return False
+
+            self.counters["admitted"] += 1
+            return True
+
+    def track(self, future: Future, size: int) -> None:
+        """Método que suma un mensaje en vuelo y lo descuenta cuando su futuro se resuelve.
+
+        Args:
+        ----------
+        future: Future.
+            Futuro devuelto por el transporte.
+
+        size: int.
+            Bytes del mensaje codificado."""
+
+        with self._condition:
+            self.in_flight_messages += 1
+            self.in_flight_bytes += size
+
+            self.counters["peak_messages"] = max(self.counters["peak_messages"], self.in_flight_messages)
+            self.counters["peak_bytes"] = max(self.counters["peak_bytes"], self.in_flight_bytes)
+
+        future.add_done_callback(lambda done: self._release(size))
+
+    def _release(self, size: int) -> None:
+        """Método que descuenta un mensaje resuelto y despierta a las peticiones en espera.
+
+        Args:
+        ----------
+        size: int.
+            Bytes del mensaje codificado."""
+
+        with self._condition:
+            self.in_flight_messages -= 1
+            self.in_flight_bytes -= size
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume la presión actual.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Mensajes y bytes en vuelo, límites, estado y contadores."""
+
+        with self._condition:
+            return {**self.counters,
+                    "state": self._state(),
+                    "in_flight_messages": self.in_flight_messages,
+                    "in_flight_bytes": self.in_flight_bytes,
+                    "soft_max_messages": self.soft_max_messages,
+                    "hard_max_messages": self.hard_max_messages,
+                    "soft_max_bytes": self.soft_max_bytes,
+                    "hard_max_bytes": self.hard_max_bytes}
@@ -0,0 +1,170 @@
+"""Módulo que contiene un broker local basado en SQLite que reemplaza a Pub/Sub
+en ejecuciones sin red. El mismo archivo puede ser compartido por el
+publicador y el suscriptor."""
+
+# Librerías Externas.
+from typing import Any, Dict, List, Optional
+
+import json
+import time
+import sqlite3
+import threading
+
+
+class LocalBroker:
+    """Clase que encapsula una cola de mensajes persistida en SQLite (modo WAL),
+    con arriendos (ack deadline), conteo de entregas y orden por llave."""
+
+    def __init__(self, path: str, ack_deadline: float = 10.0) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        path: str.
+            Ruta del archivo SQLite compartido.
+
+        ack_deadline: float.
+            Segundos que un mensaje entregado queda reservado antes de reenviarse."""
+
+        self.path = path
+        self.ack_deadline = ack_deadline
+
+        self._local = threading.local()
+
+        self._connection().executescript("""
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data BLOB NOT NULL,
+                attributes TEXT NOT NULL,
+                ordering_key TEXT NOT NULL DEFAULT '',
+                publish_time REAL NOT NULL,
+                delivery_attempt INTEGER NOT NULL DEFAULT 0,
+                lease_until REAL NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS ix_messages_lease ON messages (lease_until, id);""")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Método que obtiene la conexión a SQLite del hilo actual.
+
+        Returns:
+        ----------
+        sqlite3.Connection.
+            Conexión en modo autocommit."""
+
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout = 30, isolation_level = None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+
+        return connection
+
+    def publish(self, data: bytes, attributes: Optional[Dict[str, str]] = None,
+                ordering_key: str = "") -> str:
+        """Método que agrega un mensaje a la cola.
+
+        Args:
+        ----------
+        data: bytes.
+            Cuerpo del mensaje.
+
+        attributes: Optional[Dict[str, str]].
+            Atributos del mensaje.
+
+        ordering_key: str.
+            Llave de orden del mensaje.
+
+        Returns:
+        ----------
+        str.
+            ID del mensaje."""
+
+        cursor = self._connection().execute(
+            "INSERT INTO messages (data, attributes, ordering_key, publish_time) VALUES (?, ?, ?, ?)",
+            (data, json.dumps(attributes or {}), ordering_key, time.time()))
+
+        return str(cursor.lastrowid)
+
+    def pull(self, max_messages: int = 10, ack_deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Método que reserva y entrega mensajes disponibles. De cada llave de
+        orden solo se entregan mensajes si ninguno de ella está reservado, y
+        siempre en el orden en que se publicaron.
+
+        Args:
+        ----------
+        max_messages: int.
+            Cantidad máxima de mensajes a entregar.
+
+        ack_deadline: Optional[float].
+            Segundos de reserva de los mensajes entregados.
+
+        Returns:
+        ----------
+        List[Dict[str, Any]].
+            Mensajes entregados."""
+
+        now = time.time()
+        deadline = now + (ack_deadline if ack_deadline is not None else self.ack_deadline)
+        connection = self._connection()
+
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            leased_keys = {key for (key,) in connection.execute(
+                "SELECT DISTINCT ordering_key FROM messages WHERE lease_until > ? AND ordering_key != ''", (now,))}
+
+            rows = connection.execute(
+                "SELECT id, data, attributes, ordering_key, publish_time, delivery_attempt "
+                "FROM messages WHERE lease_until <= ? ORDER BY id LIMIT ?", (now, max_messages * 4)).fetchall()
+
+            messages = [row for row in rows if row[3] not in leased_keys][:max_messages]
+
+            connection.executemany("UPDATE messages SET lease_until = ?, delivery_attempt = delivery_attempt + 1 "
+                                   "WHERE id = ?", [(deadline, row[0]) for row in messages])
+            connection.execute("COMMIT")
+
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        return [{"message_id": str(row[0]), "data": row[1], "attributes": json.loads(row[2]),
+                 "ordering_key": row[3], "publish_time": row[4], "delivery_attempt": row[5] + 1}
+                for row in messages]
+
+    def acknowledge(self, message_ids: List[str]) -> None:
+        """Método que elimina de la cola los mensajes confirmados.
+
+        Args:
+        ----------
+        message_ids: List[str].
+            IDs de los mensajes."""
+
+        self._connection().executemany("DELETE FROM messages WHERE id = ?",
+                                       [(int(message_id),) for message_id in message_ids])
+
+    def modify_ack_deadline(self, message_ids: List[str], seconds: float) -> None:
+        """Método que modifica la reserva de mensajes entregados. Con 0 segundos
+        los mensajes quedan disponibles de inmediato.
+
+        Args:
+        ----------
+        message_ids: List[str].
+            IDs de los mensajes.
+
+        seconds: float.
+            Nuevos segundos de reserva a partir de ahora."""
+
+        self._connection().executemany("UPDATE messages SET lease_until = ? WHERE id = ?",
+                                       [(time.time() + seconds, int(message_id)) for message_id in message_ids])
+
+    def depth(self) -> int:
+        """Método que obtiene la cantidad de mensajes sin confirmar.
+
+        Returns:
+        ----------
+        int.
+            Mensajes en la cola."""
+
+        return self._connection().execute("SELECT COUNT(*) FROM messages").fetchone()[0]
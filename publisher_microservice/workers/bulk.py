@@ -0,0 +1,155 @@
+"""Módulo encargado de la carga masiva de registros en formato NDJSON."""
+
+# Librerías Externas.
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import json
+
+from marshmallow import Schema, ValidationError
+
+# Librerías Internas.
+from config import Config
+from validation import load
+from workers.publisher import admission, publish_batch, structure_msg
+
+
+def ingest_ndjson(lines: Iterable[bytes], schema: Schema, table_name: str,
+                  id_field: Optional[str] = None,
+                  batch_size: int = Config.BULK_PUBLISH_BATCH_SIZE) -> Iterator[str]:
+    """Función que lee un cuerpo NDJSON línea por línea, valida cada registro
+    con el esquema dado y publica los registros válidos en lotes.
+
+    Solo se mantiene en memoria un lote a la vez, y el resultado de cada línea
+    se entrega como una línea NDJSON tan pronto se conoce. Cada lote pasa por
+    el control de admisión antes de publicarse; si la presión no baja en
+    ADMISSION_BULK_TIMEOUT segundos sus líneas se rechazan.
+
+    Args:
+    ----------
+    lines: Iterable[bytes].
+        Líneas del cuerpo de la petición.
+
+    schema: Schema.
+        Esquema de marshmallow con el que se valida cada registro.
+
+    table_name: str.
+        Tabla a impactar.
+
+    id_field: Optional[str].
+        Campo de cada registro que contiene el ID del registro padre.
+
+    batch_size: int.
+        Cantidad de registros válidos que se publican juntos.
+
+    Returns:
+    ----------
+    Iterator[str].
+        Resultado de cada línea en formato NDJSON."""
+
+    batch: List[Dict[str, Any]] = []
+    line_numbers: List[int] = []
+    batch_bytes = 0
+
+    for line_number, raw_line in enumerate(lines, start = 1):
+
+        raw_line = raw_line.strip()
+
+        if not raw_line:
+            continue
+
+        try:
+            record = json.loads(raw_line)
+        except ValueError:
+            yield _dump_line({"line": line_number, "status": "INVALID",
+                              "errors": {"_schema": ["La línea no es un JSON válido."]}})
+            continue
+
+        try:
+            request_ids = _pop_request_ids(record, id_field)
+            request_data = load(schema, record)
+        except ValidationError as e:
+            yield _dump_line({"line": line_number, "status": "INVALID", "errors": e.normalized_messages()})
+            continue
+
+        batch.append(structure_msg(table_name = table_name, action = "POST",
+                                   request_data = request_data, request_ids = request_ids))
+        line_numbers.append(line_number)
+        batch_bytes += len(raw_line)
+
+        if len(batch) >= batch_size:
+            yield from _flush(batch, line_numbers, batch_bytes)
+            batch, line_numbers, batch_bytes = [], [], 0
+
+    if batch:
+        yield from _flush(batch, line_numbers, batch_bytes)
+
+def _pop_request_ids(record: Any, id_field: Optional[str]) -> Optional[Dict[str, int]]:
+    """Función auxiliar que separa del registro el ID del registro padre.
+
+    Args:
+    ----------
+    record: Any.
+        Registro leído de la línea.
+
+    id_field: Optional[str].
+        Campo que contiene el ID del registro padre.
+
+    Returns:
+    ----------
+    Optional[Dict[str, int]].
+        IDs del mensaje a publicar."""
+
+    if not isinstance(record, dict):
+        raise ValidationError("Cada línea debe ser un objeto JSON.", field_name = "_schema")
+
+    if id_field is None:
+        return None
+
+    if record.get(id_field) is None:
+        raise ValidationError(f"Cada línea debe incluir el campo '{id_field}'.", field_name = id_field)
+
+    return {id_field: str(record.pop(id_field))}
+
+def _flush(batch: List[Dict[str, Any]], line_numbers: List[int], batch_bytes: int) -> Iterator[str]:
+    """Función auxiliar que publica un lote, si el control de admisión lo
+    admite, y entrega el resultado por línea.
+
+    Args:
+    ----------
+    batch: List[Dict[str, Any]].
+        Mensajes a publicar.
+
+    line_numbers: List[int].
+        Número de línea de cada mensaje.
+
+    batch_bytes: int.
+        Bytes de las líneas del lote.
+
+    Returns:
+    ----------
+    Iterator[str].
+        Resultado de cada línea en formato NDJSON."""
+
+    if not admission.admit(batch_bytes, timeout = Config.ADMISSION_BULK_TIMEOUT, wait_on_hard = True):
+        for line_number in line_numbers:
+            yield _dump_line({"line": line_number, "status": "REJECTED",
+                              "error": "El servicio está saturado, intente de nuevo más tarde."})
+        return
+
+    for line_number, result in zip(line_numbers, publish_batch(batch)):
+        yield _dump_line({"line": line_number, **result})
+
+def _dump_line(result: Dict[str, Any]) -> str:
+    """Función auxiliar que serializa un resultado como línea NDJSON.
+
+    Args:
+    ----------
+    result: Dict[str, Any].
+        Resultado de una línea.
+
+    Returns:
+    ----------
+    str.
+        Línea NDJSON."""
+
+    return json.dumps(result) + "\n"
@@ -0,0 +1,232 @@
+"""Módulo que contiene la caché de lecturas de la API de consulta."""
+
+# Librerías Externas.
+from typing import Any, Dict, List, Optional
+
+import time
+import threading
+import urllib.parse
+from collections import OrderedDict
+
+
+class ReadCache:
+    """Clase que encapsula una caché LRU acotada con expiración (TTL) para las
+    respuestas de la API de consulta.
+
+    Las llaves tienen la forma '<tabla>:<id>/<padres>' o '<tabla>:<id>/<padres>?<consulta>'
+    para un registro, donde los padres son los IDs de la ruta (p. ej. 'model_id=1'),
+    y '<tabla>:list' o '<tabla>:list?<consulta>' para las páginas del listado de
+    la tabla; la consulta incluye la paginación y los campos."""
+
+    LIST = "list"
+
+    # Tablas cuyos registros se eliminan en cascada al eliminar un registro de la tabla.
+    DEPENDENTS = {"problems": ["models", "versions"],
+                  "models": ["versions"]}
+
+    # Campo de 'ids' que identifica al registro afectado en cada tabla.
+    ID_FIELDS = {"problems": "problem_id",
+                 "models": "model_id",
+                 "versions": "version_id"}
+
+    def __init__(self, max_size: int = 1000, ttl: float = 5.0) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        max_size: int.
+            Cantidad máxima de llaves en memoria.
+
+        ttl: float.
+            Segundos durante los que una respuesta es válida."""
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self.counters = {"hits": 0, "misses": 0, "revalidations": 0, "invalidations": 0, "evictions": 0}
+
+    @classmethod
+    def key(cls, table: str, record_id: Optional[Any] = None, query: str = "",
+            parent_ids: Optional[Dict[str, Any]] = None) -> str:
+        """Método que construye la llave de un registro o de una página del listado de una tabla.
+
+        Args:
+        ----------
+        table: str.
+            Tabla consultada.
+
+        record_id: Optional[Any].
+            ID del registro; si es None se refiere al listado.
+
+        query: str.
+            Parámetros de la consulta (paginación y campos), codificados como query string.
+
+        parent_ids: Optional[Dict[str, Any]].
+            IDs de los padres en la ruta del registro; '/model/2/version/5' no es '/model/1/version/5'.
+
+        Returns:
+        ----------
+        str.
+            Llave de la caché."""
+
+        if record_id is None:
+            key = f"{table}:{cls.LIST}"
+        else:
+            key = f"{table}:{record_id}/" + urllib.parse.urlencode(sorted((parent_ids or {}).items()))
+
+        return key + (f"?{query}" if query else "")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Método que obtiene una respuesta vigente. Las respuestas expiradas
+        se conservan hasta ser reemplazadas, para revalidarlas con 'peek'.
+
+        Args:
+        ----------
+        key: str.
+            Llave de la caché.
+
+        Returns:
+        ----------
+        Optional[Any].
+            Respuesta guardada, o None si no existe o expiró."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or time.monotonic() >= entry["expires_at"]:
+                self.counters["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+
+            return entry["value"]
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Método que obtiene una respuesta guardada aunque haya expirado.
+
+        Args:
+        ----------
+        key: str.
+            Llave de la caché.
+
+        Returns:
+        ----------
+        Optional[Any].
+            Respuesta guardada, o None si no existe."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            return entry["value"] if entry is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Método que guarda una respuesta.
+
+        Args:
+        ----------
+        key: str.
+            Llave de la caché.
+
+        value: Any.
+            Respuesta a guardar."""
+
+        with self._lock:
+            self._entries[key] = {"value": value, "expires_at": time.monotonic() + self.ttl}
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last = False)
+                self.counters["evictions"] += 1
+
+    def revalidated(self, key: str) -> None:
+        """Método que renueva la vigencia de una respuesta que la API de lectura
+        confirmó como no modificada.
+
+        Args:
+        ----------
+        key: str.
+            Llave de la caché."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                entry["expires_at"] = time.monotonic() + self.ttl
+                self._entries.move_to_end(key)
+                self.counters["revalidations"] += 1
+
+    def invalidate(self, keys: List[str]) -> None:
+        """Método que elimina llaves de la caché.
+
+        Args:
+        ----------
+        keys: List[str].
+            Llaves a eliminar."""
+
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.counters["invalidations"] += 1
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Método que elimina todas las llaves que empiezan por un prefijo.
+
+        Args:
+        ----------
+        prefix: str.
+            Prefijo de las llaves."""
+
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+
+        self.invalidate(keys)
+
+    def invalidate_table(self, table: str) -> None:
+        """Método que elimina todas las llaves de una tabla.
+
+        Args:
+        ----------
+        table: str.
+            Tabla."""
+
+        self.invalidate_prefix(f"{table}:")
+
+    def invalidate_write(self, metadata: Dict[str, str], ids: Optional[Dict[str, Any]]) -> None:
+        """Método que elimina las llaves afectadas por una escritura publicada.
+
+        Args:
+        ----------
+        metadata: Dict[str, str].
+            Metadata del mensaje (tabla y acción).
+
+        ids: Optional[Dict[str, Any]].
+            IDs del mensaje."""
+
+        table, action = metadata["table"], metadata["action"]
+        self.invalidate_prefix(self.key(table))
+
+        record_id = (ids or {}).get(self.ID_FIELDS.get(table))
+
+        # Se eliminan las llaves del registro con cualquier padre, porque algunas escrituras
+        # (p. ej. promover una versión) no traen los IDs de los padres.
+        if record_id is not None:
+            self.invalidate_prefix(f"{table}:{record_id}/")
+
+        if action == "DELETE":
+            for dependent in self.DEPENDENTS.get(table, []):
+                self.invalidate_table(dependent)
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume el estado de la caché.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Contadores y llaves en memoria."""
+
+        with self._lock:
+            return {**self.counters, "size": len(self._entries), "ttl": self.ttl}
@@ -0,0 +1,172 @@
+"""Módulo encargado de la codificación de los mensajes de Pub/Sub."""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, Tuple
+
+import json
+import zlib
+from datetime import datetime, timedelta
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+ENCODING_ATTRIBUTE = "content_encoding"
+ENVELOPE_ATTRIBUTE = "envelope"
+
+MSGPACK_ENVELOPE = "msgpack-v1"
+
+TABLE_CODES = {"problems": 1, "models": 2, "versions": 3}
+ACTION_CODES = {"POST": 1, "PUT": 2, "DELETE": 3}
+
+TABLE_NAMES = {code: name for name, code in TABLE_CODES.items()}
+ACTION_NAMES = {code: name for name, code in ACTION_CODES.items()}
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds = 1)
+
+
+CODECS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (zlib.compress, zlib.decompress)}
+
+if zstandard is not None:
+    CODECS["zstd"] = (lambda payload: zstandard.ZstdCompressor().compress(payload),
+                      lambda payload: zstandard.ZstdDecompressor().decompress(payload))
+
+
+def compress_payload(payload: bytes, codec: str = "none",
+                     threshold: int = 1024) -> Tuple[bytes, Dict[str, str]]:
+    """Función que comprime el cuerpo del mensaje cuando supera el umbral.
+
+    Args:
+    ----------
+    payload: bytes.
+        Cuerpo del mensaje.
+
+    codec: str.
+        Códec a usar ('none', 'zlib' o 'zstd').
+
+    threshold: int.
+        Tamaño mínimo en bytes a partir del cual se comprime.
+
+    Returns:
+    ----------
+    Tuple[bytes, Dict[str, str]].
+        Cuerpo del mensaje y atributos que indican cómo decodificarlo."""
+
+    if codec == "none" or len(payload) < threshold:
+        return payload, {}
+
+    if codec not in CODECS:
+        raise ValueError(f"El códec '{codec}' no está disponible.")
+
+    compress, _ = CODECS[codec]
+    return compress(payload), {ENCODING_ATTRIBUTE: codec}
+
+def decompress_payload(payload: bytes, attributes: Dict[str, str]) -> bytes:
+    """Función que descomprime el cuerpo del mensaje según sus atributos.
+    Los mensajes sin el atributo de códec se retornan tal cual.
+
+    Args:
+    ----------
+    payload: bytes.
+        Cuerpo del mensaje.
+
+    attributes: Dict[str, str].
+        Atributos del mensaje.
+
+    Returns:
+    ----------
+    bytes.
+        Cuerpo del mensaje descomprimido."""
+
+    codec = attributes.get(ENCODING_ATTRIBUTE) if attributes else None
+
+    if not codec:
+        return payload
+
+    if codec not in CODECS:
+        raise ValueError(f"El códec '{codec}' no está disponible.")
+
+    _, decompress = CODECS[codec]
+    return decompress(payload)
+
+def encode_envelope(msg: Dict[str, Any], envelope: str = "json") -> Tuple[bytes, Dict[str, str]]:
+    """Función que serializa el mensaje estructurado por 'structure_msg'.
+
+    El sobre 'msgpack' reemplaza la tabla y la acción por códigos enteros y la
+    fecha ISO por microsegundos desde epoch: [tabla, acción, timestamp,
+    request_id, ids, request, metadata restante].
+
+    Args:
+    ----------
+    msg: Dict[str, Any].
+        Mensaje estructurado.
+
+    envelope: str.
+        Formato del sobre ('json' o 'msgpack').
+
+    Returns:
+    ----------
+    Tuple[bytes, Dict[str, str]].
+        Cuerpo del mensaje y atributos que indican cómo decodificarlo."""
+
+    if envelope == "json":
+        return json.dumps(msg).encode("utf-8"), {}
+
+    if envelope != "msgpack" or msgpack is None:
+        raise ValueError(f"El sobre '{envelope}' no está disponible.")
+
+    metadata = dict(msg["metadata"])
+
+    table = TABLE_CODES[metadata.pop("table")]
+    action = ACTION_CODES[metadata.pop("action")]
+    timestamp = (datetime.fromisoformat(metadata.pop("timestamp")) - EPOCH) // MICROSECOND
+    request_id = metadata.pop("request_id", None)
+
+    packed = msgpack.packb([table, action, timestamp, request_id,
+                            msg["ids"], msg["request"], metadata or None])
+
+    return packed, {ENVELOPE_ATTRIBUTE: MSGPACK_ENVELOPE}
+
+def decode_envelope(payload: bytes, attributes: Dict[str, str]) -> Dict[str, Any]:
+    """Función que reconstruye el mensaje estructurado a partir de su sobre.
+    Los mensajes sin el atributo de sobre se leen como JSON.
+
+    Args:
+    ----------
+    payload: bytes.
+        Cuerpo del mensaje ya descomprimido.
+
+    attributes: Dict[str, str].
+        Atributos del mensaje.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Mensaje con las llaves 'request', 'ids' y 'metadata'."""
+
+    envelope = attributes.get(ENVELOPE_ATTRIBUTE) if attributes else None
+
+    if not envelope:
+        return json.loads(payload.decode("utf-8"))
+
+    if envelope != MSGPACK_ENVELOPE or msgpack is None:
+        raise ValueError(f"El sobre '{envelope}' no está disponible.")
+
+    table, action, timestamp, request_id, request_ids, request_data, metadata = msgpack.unpackb(payload)
+
+    return {"request": request_data,
+            "ids": request_ids,
+            "metadata": {"table": TABLE_NAMES[table],
+                         "action": ACTION_NAMES[action],
+                         "timestamp": (EPOCH + timestamp * MICROSECOND).isoformat(),
+                         "request_id": request_id,
+                         **(metadata or {})}}
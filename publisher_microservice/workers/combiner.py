@@ -0,0 +1,261 @@
+"""Módulo que contiene la combinación de actualizaciones redundantes antes de publicarlas."""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import copy
+import time
+import heapq
+import itertools
+import threading
+from functools import partial
+from concurrent.futures import Future
+
+
+class WriteCombiner:
+    """Clase que retiene por una ventana corta las actualizaciones (PUT) de una
+    misma entidad y publica un único mensaje con los campos combinados, donde
+    gana el último valor recibido de cada campo.
+
+    Las ventanas las cierra un solo hilo, según un heap de vencimientos. Las
+    publicaciones de una misma llave de orden se serializan con un candado por
+    franja de llaves, de modo que una publicación lenta no detiene las
+    actualizaciones de las demás entidades."""
+
+    def __init__(self, send_fn: Callable[[Dict[str, Any]], Future], window: float = 0.5,
+                 stripes: int = 64) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        send_fn: Callable[[Dict[str, Any]], Future].
+            Función que publica un mensaje y retorna su futuro.
+
+        window: float.
+            Segundos que se retiene la primera actualización de una entidad.
+
+        stripes: int.
+            Cantidad de candados entre los que se reparten las llaves de orden al publicar."""
+
+        self.send_fn = send_fn
+        self.window = window
+
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._key_locks = [threading.Lock() for _ in range(stripes)]
+        self._pending: Dict[Tuple, Dict[str, Any]] = {}
+        self._sequence = itertools.count()
+
+        # Vencimientos (instante, secuencia, llave) de las ventanas abiertas.
+        self._deadlines: List[Tuple[float, int, Tuple]] = []
+
+        # Llave de orden -> llaves de las entidades con ventana abierta, en orden de llegada.
+        self._by_ordering_key: Dict[str, Dict[Tuple, None]] = {}
+
+        self.counters = {"submitted": 0, "emitted": 0, "collapsed": 0}
+
+        self._thread = threading.Thread(target = self._run, name = "write-combiner", daemon = True)
+        self._thread.start()
+
+    @staticmethod
+    def key(data: Dict[str, Any]) -> Tuple:
+        """Método que obtiene la llave de la entidad afectada por un mensaje.
+
+        Args:
+        ----------
+        data: Dict[str, Any].
+            Mensaje estructurado por 'structure_msg'.
+
+        Returns:
+        ----------
+        Tuple.
+            Tabla e IDs del mensaje."""
+
+        return (data["metadata"]["table"], tuple(sorted((data["ids"] or {}).items())))
+
+    @classmethod
+    def ordering_key(cls, data: Dict[str, Any]) -> str:
+        """Método que obtiene la llave de orden de un mensaje; si no tiene, la de su entidad.
+
+        Args:
+        ----------
+        data: Dict[str, Any].
+            Mensaje estructurado por 'structure_msg'.
+
+        Returns:
+        ----------
+        str.
+            Llave de orden."""
+
+        return data["metadata"].get("ordering_key") or str(cls.key(data))
+
+    def submit(self, data: Dict[str, Any]) -> Future:
+        """Método que agrega una actualización a la ventana de su entidad.
+
+        Args:
+        ----------
+        data: Dict[str, Any].
+            Mensaje estructurado por 'structure_msg'.
+
+        Returns:
+        ----------
+        Future.
+            Futuro que se resuelve con el resultado del mensaje combinado."""
+
+        key = self.key(data)
+
+        with self._lock:
+            self.counters["submitted"] += 1
+            entry = self._pending.get(key)
+
+            if entry is not None:
+                self.counters["collapsed"] += 1
+                entry["data"]["request"].update(data["request"] or {})
+                entry["data"]["metadata"] = copy.deepcopy(data["metadata"])
+                return entry["future"]
+
+            entry = {"data": copy.deepcopy(data), "future": Future(), "sequence": next(self._sequence),
+                     "ordering_key": self.ordering_key(data)}
+            entry["data"]["request"] = entry["data"]["request"] or {}
+
+            self._pending[key] = entry
+            self._by_ordering_key.setdefault(entry["ordering_key"], {})[key] = None
+
+            heapq.heappush(self._deadlines, (time.monotonic() + self.window, entry["sequence"], key))
+
+            if self._deadlines[0][1] == entry["sequence"]:
+                self._ready.notify()
+
+        return entry["future"]
+
+    def _run(self) -> None:
+        """Método del hilo que publica las ventanas a medida que vencen."""
+
+        while True:
+            with self._ready:
+                while not self._deadlines:
+                    self._ready.wait()
+
+                deadline, sequence, key = self._deadlines[0]
+                entry = self._pending.get(key)
+
+                # La ventana ya se publicó antes de vencer.
+                if entry is None or entry["sequence"] != sequence:
+                    heapq.heappop(self._deadlines)
+                    continue
+
+                remaining = deadline - time.monotonic()
+
+                if remaining > 0:
+                    self._ready.wait(remaining)
+                    continue
+
+                heapq.heappop(self._deadlines)
+                ordering_key = entry["ordering_key"]
+
+            self._flush(ordering_key, [key])
+
+    def flush(self, key: Tuple) -> None:
+        """Método que publica de inmediato la actualización combinada de una entidad.
+
+        Args:
+        ----------
+        key: Tuple.
+            Llave de la entidad."""
+
+        with self._lock:
+            entry = self._pending.get(key)
+
+            if entry is None:
+                return
+
+            ordering_key = entry["ordering_key"]
+
+        self._flush(ordering_key, [key])
+
+    def flush_related(self, data: Dict[str, Any]) -> None:
+        """Método que publica de inmediato, en orden de llegada, todas las
+        actualizaciones retenidas con la llave de orden de un mensaje. Se usa
+        antes de publicar cualquier otro mensaje con esa llave (p. ej. eliminar
+        el problema de un modelo con una actualización retenida), para no
+        alterar el orden.
+
+        Args:
+        ----------
+        data: Dict[str, Any].
+            Mensaje que se va a publicar."""
+
+        self._flush(self.ordering_key(data))
+
+    def _flush(self, ordering_key: str, keys: Optional[List[Tuple]] = None) -> None:
+        """Método que publica las actualizaciones retenidas de una llave de orden.
+
+        Args:
+        ----------
+        ordering_key: str.
+            Llave de orden.
+
+        keys: Optional[List[Tuple]].
+            Entidades a publicar; si es None, todas las de la llave de orden."""
+
+        # Se publica con el candado de la llave de orden tomado para que un mensaje posterior
+        # con la misma llave no se adelante a las actualizaciones combinadas; el candado global
+        # solo protege las ventanas, así que 'submit' no espera a la publicación.
+        with self._key_locks[hash(ordering_key) % len(self._key_locks)]:
+            with self._lock:
+                related = self._by_ordering_key.get(ordering_key, {})
+                entries = [self._pending.pop(key) for key in list(keys if keys is not None else related)
+                           if key in self._pending]
+
+                for entry in entries:
+                    related.pop(self.key(entry["data"]), None)
+                    self.counters["emitted"] += 1
+
+                if not related:
+                    self._by_ordering_key.pop(ordering_key, None)
+
+            for entry in entries:
+                try:
+                    sent = self.send_fn(entry["data"])
+                except Exception as e:
+                    entry["future"].set_exception(e)
+                    continue
+
+                sent.add_done_callback(partial(self._resolve, entry["future"]))
+
+    @staticmethod
+    def _resolve(future: Future, done: Future) -> None:
+        """Método que traslada el resultado del mensaje combinado al futuro compartido.
+
+        Args:
+        ----------
+        future: Future.
+            Futuro entregado a las actualizaciones combinadas.
+
+        done: Future.
+            Futuro de la publicación."""
+
+        try:
+            future.set_result(done.result())
+        except Exception as e:
+            future.set_exception(e)
+
+    def flush_all(self) -> None:
+        """Método que publica todas las actualizaciones retenidas."""
+
+        with self._lock:
+            ordering_keys = list(self._by_ordering_key)
+
+        for ordering_key in ordering_keys:
+            self._flush(ordering_key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume el estado del combinador.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Contadores y entidades con actualizaciones retenidas."""
+
+        with self._lock:
+            return {**self.counters, "pending": len(self._pending), "window": self.window}
@@ -0,0 +1,304 @@
+"""Módulo que contiene el cliente HTTP compartido para consultar otros servicios."""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import json
+import time
+import threading
+from concurrent.futures import Future
+
+import urllib3
+
+
+class RetryBudget:
+    """Clase que limita la cantidad de reintentos a una fracción de las
+    peticiones, más un mínimo por segundo, para que los reintentos no
+    multipliquen la carga sobre un servicio que ya está fallando."""
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 5.0, window: float = 10.0) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        ratio: float.
+            Reintentos permitidos por cada petición original.
+
+        min_per_second: float.
+            Reintentos por segundo permitidos aunque no haya tráfico.
+
+        window: float.
+            Segundos de reintentos que se pueden acumular."""
+
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = max(1.0, min_per_second * window)
+
+        self._lock = threading.Lock()
+        self._balance = self.capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        """Método que suma el mínimo por segundo transcurrido. Se debe llamar con el candado tomado."""
+
+        now = time.monotonic()
+        self._balance = min(self.capacity, self._balance + (now - self._updated_at) * self.min_per_second)
+        self._updated_at = now
+
+    def deposit(self) -> None:
+        """Método que registra una petición original."""
+
+        with self._lock:
+            self._refill()
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Método que intenta gastar un reintento.
+
+        Returns:
+        ----------
+        bool.
+            True si el presupuesto permite reintentar."""
+
+        with self._lock:
+            self._refill()
+
+            if self._balance < 1:
+                return False
+
+            self._balance -= 1
+            return True
+
+
+class Singleflight:
+    """Clase que agrupa las llamadas concurrentes con la misma llave en una
+    sola ejecución, cuyo resultado reciben todas."""
+
+    def __init__(self) -> None:
+        """Método constructor."""
+
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Método que ejecuta 'fn' o espera la ejecución en curso de la misma llave.
+
+        Args:
+        ----------
+        key: str.
+            Llave de la llamada.
+
+        fn: Callable[[], Any].
+            Función a ejecutar.
+
+        Returns:
+        ----------
+        Tuple[Any, bool].
+            Resultado y si fue compartido con otra llamada."""
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return future.result(), False
+
+
+class HttpClient:
+    """Clase que encapsula un pool de conexiones keep-alive hacia un servicio,
+    con límite de conexiones por host, timeouts, reintentos acotados por un
+    presupuesto y agrupación de GET concurrentes idénticos."""
+
+    RETRY_STATUSES = {502, 503, 504}
+
+    def __init__(self, base_url: str, max_connections: int = 10, connect_timeout: float = 1.0,
+                 read_timeout: float = 5.0, max_retries: int = 2, retry_backoff: float = 0.05,
+                 budget: RetryBudget = None) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        base_url: str.
+            URL base del servicio.
+
+        max_connections: int.
+            Conexiones máximas por host; las peticiones adicionales esperan una libre.
+
+        connect_timeout: float.
+            Segundos máximos para conectar.
+
+        read_timeout: float.
+            Segundos máximos de espera de la respuesta.
+
+        max_retries: int.
+            Reintentos máximos por petición.
+
+        retry_backoff: float.
+            Segundos de espera antes del primer reintento; se duplica en cada uno.
+
+        budget: RetryBudget.
+            Presupuesto de reintentos compartido."""
+
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.budget = budget or RetryBudget()
+
+        self.pool = urllib3.PoolManager(maxsize = max_connections, block = True, retries = False,
+                                        timeout = urllib3.Timeout(connect = connect_timeout, read = read_timeout))
+        self.singleflight = Singleflight()
+
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "upstream_calls": 0, "coalesced": 0, "retries": 0,
+                         "budget_exhausted": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        """Método que incrementa un contador.
+
+        Args:
+        ----------
+        name: str.
+            Contador."""
+
+        with self._lock:
+            self.counters[name] += 1
+
+    def get_json(self, path: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, Dict[str, str]]:
+        """Método que hace un GET y decodifica el cuerpo JSON. Las llamadas
+        concurrentes a la misma ruta y con los mismos headers comparten una
+        sola petición al servicio.
+
+        Args:
+        ----------
+        path: str.
+            Ruta a consultar.
+
+        headers: Optional[Dict[str, str]].
+            Headers adicionales, por ejemplo 'If-None-Match'.
+
+        Returns:
+        ----------
+        Tuple[int, Any, Dict[str, str]].
+            Código de estado, cuerpo y headers de la respuesta."""
+
+        self._count("requests")
+
+        key = path + "".join(f"\n{name}: {value}" for name, value in sorted((headers or {}).items()))
+        result, shared = self.singleflight.do(key, lambda: self._get(path, headers))
+
+        if shared:
+            self._count("coalesced")
+
+        return result
+
+    def _get(self, path: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, Dict[str, str]]:
+        """Método que hace un GET con reintentos ante errores de conexión o
+        respuestas 502/503/504, mientras el presupuesto lo permita.
+
+        Args:
+        ----------
+        path: str.
+            Ruta a consultar.
+
+        headers: Optional[Dict[str, str]].
+            Headers adicionales.
+
+        Returns:
+        ----------
+        Tuple[int, Any, Dict[str, str]].
+            Código de estado, cuerpo y headers de la respuesta."""
+
+        self.budget.deposit()
+        attempt = 0
+
+        while True:
+            self._count("upstream_calls")
+
+            try:
+                response = self.pool.request("GET", self.base_url + path, headers = headers)
+                error = None
+            except urllib3.exceptions.HTTPError as e:
+                response, error = None, e
+
+            retryable = error is not None or response.status in self.RETRY_STATUSES
+
+            if not retryable:
+                body = json.loads(response.data) if response.data else None
+                return response.status, body, dict(response.headers)
+
+            if attempt >= self.max_retries:
+                break
+
+            if not self.budget.withdraw():
+                self._count("budget_exhausted")
+                break
+
+            self._count("retries")
+            time.sleep(self.retry_backoff * 2 ** attempt)
+            attempt += 1
+
+        self._count("errors")
+
+        if error is not None:
+            raise error
+
+        return response.status, None, dict(response.headers)
+
+    def stream(self, path: str, chunk_size: int = 65536) -> Tuple[int, Dict[str, str], Iterator[bytes]]:
+        """Método que hace un GET y entrega el cuerpo por partes a medida que
+        llega, sin cargarlo en memoria. No se reintenta ni se agrupa con otras
+        llamadas; la conexión vuelve al pool al terminar de leer el cuerpo.
+
+        Args:
+        ----------
+        path: str.
+            Ruta a consultar.
+
+        chunk_size: int.
+            Tamaño máximo de cada parte en bytes.
+
+        Returns:
+        ----------
+        Tuple[int, Dict[str, str], Iterator[bytes]].
+            Código de estado, headers y partes del cuerpo."""
+
+        self._count("requests")
+        self._count("upstream_calls")
+
+        try:
+            response = self.pool.request("GET", self.base_url + path, preload_content = False)
+        except urllib3.exceptions.HTTPError:
+            self._count("errors")
+            raise
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.stream(chunk_size)
+            finally:
+                response.release_conn()
+
+        return response.status, dict(response.headers), chunks()
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume el uso del cliente.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Contadores."""
+
+        with self._lock:
+            return dict(self.counters)
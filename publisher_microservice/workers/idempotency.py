@@ -0,0 +1,331 @@
+"""Módulo que contiene el almacén de llaves de idempotencia de las escrituras."""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, List, Optional
+
+import time
+import sqlite3
+import hashlib
+import threading
+from functools import wraps
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from flask import Response, request, make_response
+from flask_smorest import abort
+
+# Librerías Internas.
+from workers.registry import DEFERRED_PUBLISHES
+
+
+class IdempotencyStore:
+    """Clase que guarda, por un tiempo limitado, la respuesta de cada escritura
+    enviada con el header 'Idempotency-Key', de modo que los reintentos del
+    cliente reciban la respuesta original sin publicar de nuevo.
+
+    Las llaves viven en un LRU en memoria acotado y, si se indica una ruta, en
+    un SQLite compartido por los procesos del contenedor."""
+
+    HEADER = "Idempotency-Key"
+
+    def __init__(self, max_size: int = 10000, ttl: float = 86400.0, path: Optional[str] = None) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        max_size: int.
+            Cantidad máxima de llaves en memoria.
+
+        ttl: float.
+            Segundos durante los que se recuerda una llave.
+
+        path: Optional[str].
+            Ruta del archivo SQLite compartido. Si es None solo se usa memoria."""
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self.counters = {"hits": 0, "misses": 0, "conflicts": 0, "mismatches": 0}
+
+        if self.path:
+            self._connection().executescript("""
+                CREATE TABLE IF NOT EXISTS idempotency (
+                    key TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    status INTEGER,
+                    body BLOB,
+                    mimetype TEXT,
+                    created_at REAL NOT NULL
+                );""")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Método que obtiene la conexión a SQLite del hilo actual.
+
+        Returns:
+        ----------
+        sqlite3.Connection.
+            Conexión en modo autocommit."""
+
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout = 5, isolation_level = None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+
+        return connection
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Método que busca una llave vigente.
+
+        Args:
+        ----------
+        key: str.
+            Llave de idempotencia.
+
+        Returns:
+        ----------
+        Optional[Dict[str, Any]].
+            Entrada guardada; su 'status' es None mientras la petición original está en curso."""
+
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and now - entry["created_at"] <= self.ttl:
+                self._entries.move_to_end(key)
+                return entry
+
+            self._entries.pop(key, None)
+
+        if not self.path:
+            return None
+
+        row = self._connection().execute(
+            "SELECT fingerprint, status, body, mimetype, created_at FROM idempotency "
+            "WHERE key = ? AND created_at >= ?", (key, now - self.ttl)).fetchone()
+
+        if row is None:
+            return None
+
+        entry = {"fingerprint": row[0], "status": row[1], "body": row[2], "mimetype": row[3], "created_at": row[4]}
+
+        if entry["status"] is not None:
+            with self._lock:
+                self._remember(key, entry)
+
+        return entry
+
+    def reserve(self, key: str, fingerprint: str) -> bool:
+        """Método que reserva una llave nueva para la petición en curso.
+
+        Args:
+        ----------
+        key: str.
+            Llave de idempotencia.
+
+        fingerprint: str.
+            Huella del cuerpo de la petición.
+
+        Returns:
+        ----------
+        bool.
+            True si la llave quedó reservada; False si otra petición ya la tomó."""
+
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and now - entry["created_at"] <= self.ttl:
+                return False
+
+            if self.path:
+                connection = self._connection()
+                connection.execute("DELETE FROM idempotency WHERE key = ? AND created_at < ?", (key, now - self.ttl))
+                cursor = connection.execute("INSERT OR IGNORE INTO idempotency (key, fingerprint, created_at) "
+                                            "VALUES (?, ?, ?)", (key, fingerprint, now))
+
+                if cursor.rowcount == 0:
+                    return False
+
+            self._remember(key, {"fingerprint": fingerprint, "status": None, "body": None,
+                                 "mimetype": None, "created_at": now})
+
+        return True
+
+    def complete(self, key: str, response: Response) -> None:
+        """Método que guarda la respuesta de una petición reservada.
+
+        Args:
+        ----------
+        key: str.
+            Llave de idempotencia.
+
+        response: Response.
+            Respuesta enviada al cliente."""
+
+        body = response.get_data()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                entry.update({"status": response.status_code, "body": body, "mimetype": response.mimetype})
+
+        if self.path:
+            self._connection().execute("UPDATE idempotency SET status = ?, body = ?, mimetype = ? WHERE key = ?",
+                                       (response.status_code, body, response.mimetype, key))
+
+    def complete_when_published(self, key: str, response: Response, futures: List[Future]) -> None:
+        """Método que guarda la respuesta de una petición reservada cuando se
+        confirman sus publicaciones, o libera la llave si alguna falla.
+
+        Args:
+        ----------
+        key: str.
+            Llave de idempotencia.
+
+        response: Response.
+            Respuesta enviada al cliente.
+
+        futures: List[Future].
+            Futuros de las publicaciones de la petición."""
+
+        state = {"remaining": len(futures), "failed": False}
+
+        def on_done(future: Future) -> None:
+            with self._lock:
+                state["remaining"] -= 1
+                state["failed"] = state["failed"] or future.exception() is not None
+                finished = state["remaining"] == 0
+
+            if not finished:
+                return
+
+            if state["failed"]:
+                self.release(key)
+            else:
+                self.complete(key, response)
+
+        for future in futures:
+            future.add_done_callback(on_done)
+
+    def release(self, key: str) -> None:
+        """Método que libera una llave cuya petición no terminó con éxito, para
+        que el cliente pueda reintentarla.
+
+        Args:
+        ----------
+        key: str.
+            Llave de idempotencia."""
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+        if self.path:
+            self._connection().execute("DELETE FROM idempotency WHERE key = ? AND status IS NULL", (key,))
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Método que guarda una entrada en el LRU en memoria. Se debe llamar con el candado tomado.
+
+        Args:
+        ----------
+        key: str.
+            Llave de idempotencia.
+
+        entry: Dict[str, Any].
+            Entrada a guardar."""
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last = False)
+
+    def guard(self, view: Callable[..., Any]) -> Callable[..., Any]:
+        """Método decorador de las vistas de escritura. Sin el header
+        'Idempotency-Key' la vista se ejecuta normalmente.
+
+        Args:
+        ----------
+        view: Callable[..., Any].
+            Vista a proteger.
+
+        Returns:
+        ----------
+        Callable[..., Any].
+            Vista protegida."""
+
+        @wraps(view)
+        def wrapper(*args: Any, **kwargs: Any) -> Response:
+            idempotency_key = request.headers.get(self.HEADER)
+
+            if not idempotency_key:
+                return view(*args, **kwargs)
+
+            key = f"{request.method}:{request.path}:{idempotency_key}"
+            fingerprint = hashlib.sha256(request.get_data()).hexdigest()
+
+            entry = self.lookup(key)
+
+            if entry is None and self.reserve(key, fingerprint):
+                with self._lock:
+                    self.counters["misses"] += 1
+
+                try:
+                    response = make_response(view(*args, **kwargs))
+                except Exception:
+                    self.release(key)
+                    raise
+
+                # Si la confirmación de Pub/Sub se espera en el event loop, la respuesta se guarda al confirmarse.
+                deferred = request.environ.get(DEFERRED_PUBLISHES)
+
+                if not 200 <= response.status_code < 300:
+                    self.release(key)
+                elif deferred:
+                    self.complete_when_published(key, response, list(deferred))
+                else:
+                    self.complete(key, response)
+
+                return response
+
+            entry = entry or self.lookup(key)
+
+            if entry is not None and entry["fingerprint"] != fingerprint:
+                with self._lock:
+                    self.counters["mismatches"] += 1
+
+                abort(422, message = "La llave de idempotencia ya se usó con una petición distinta.")
+
+            if entry is None or entry["status"] is None:
+                with self._lock:
+                    self.counters["conflicts"] += 1
+
+                abort(409, message = "Hay una petición en curso con la misma llave de idempotencia.")
+
+            with self._lock:
+                self.counters["hits"] += 1
+
+            return Response(entry["body"], status = entry["status"], mimetype = entry["mimetype"],
+                            headers = {"Idempotent-Replayed": "true"})
+
+        return wrapper
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume el estado del almacén.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Contadores y llaves en memoria."""
+
+        with self._lock:
+            return {**self.counters, "size": len(self._entries)}
@@ -0,0 +1,360 @@
+"""Módulo que contiene el outbox local de mensajes pendientes por publicar."""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import json
+import time
+import sqlite3
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+
+class CircuitBreaker:
+    """Clase que suspende los envíos a Pub/Sub tras varias fallas seguidas."""
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        threshold: int.
+            Fallas consecutivas a partir de las cuales se abre el circuito.
+
+        cooldown: float.
+            Segundos que el circuito permanece abierto antes de volver a intentar."""
+
+        self.threshold = threshold
+        self.cooldown = cooldown
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Método que indica si se puede intentar un envío.
+
+        Returns:
+        ----------
+        bool.
+            True si el circuito está cerrado o ya pasó el tiempo de espera."""
+
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+            self.state = self.HALF_OPEN
+
+        return self.state != self.OPEN
+
+    def record_success(self) -> None:
+        """Método que registra un envío exitoso y cierra el circuito."""
+
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Método que registra un envío fallido y abre el circuito si corresponde."""
+
+        self.failures += 1
+
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class Outbox:
+    """Clase que encapsula un outbox en SQLite (modo WAL). Los handlers agregan
+    mensajes de forma local y un hilo en segundo plano los envía a Pub/Sub en
+    lotes, con reintentos y un circuit breaker.
+
+    Los mensajes se envían en el orden en que se agregaron. Si un envío falla,
+    toda su llave de orden espera un tiempo exponencial y ningún mensaje de la
+    llave se envía antes que el fallido, mientras las demás llaves se siguen
+    enviando; los mensajes sin llave esperan cada uno por su cuenta."""
+
+    def __init__(self, path: str, batch_size: int = 500, poll_interval: float = 0.05,
+                 max_backoff: float = 30.0, breaker: Optional[CircuitBreaker] = None,
+                 publish_timeout: float = 30.0) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        path: str.
+            Ruta del archivo SQLite.
+
+        batch_size: int.
+            Cantidad máxima de mensajes enviados por ciclo.
+
+        poll_interval: float.
+            Segundos de espera cuando el outbox está vacío.
+
+        max_backoff: float.
+            Segundos máximos de espera entre reintentos fallidos.
+
+        breaker: Optional[CircuitBreaker].
+            Circuit breaker a usar.
+
+        publish_timeout: float.
+            Segundos máximos de espera de la confirmación de un lote; los mensajes
+            sin confirmar se tratan como fallidos."""
+
+        self.path = path
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.publish_timeout = publish_timeout
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._waiters: Dict[int, Future] = {}
+        self._thread: Optional[threading.Thread] = None
+
+        self.counters = {"appended": 0, "flushed": 0, "failed_attempts": 0}
+
+        self._connection().executescript("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                request_id TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                ordering_key TEXT NOT NULL DEFAULT ''
+            );""")
+
+        # Los outbox creados antes de la espera por llave no tienen estas columnas.
+        columns = [column[1] for column in self._connection().execute("PRAGMA table_info(outbox)")]
+
+        for column, definition in [("next_attempt_at", "REAL NOT NULL DEFAULT 0"),
+                                   ("ordering_key", "TEXT NOT NULL DEFAULT ''")]:
+            if column not in columns:
+                self._connection().execute(f"ALTER TABLE outbox ADD COLUMN {column} {definition}")
+
+        self._connection().execute("CREATE INDEX IF NOT EXISTS outbox_next_attempt_at ON outbox (next_attempt_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Método que obtiene la conexión a SQLite del hilo actual.
+
+        Returns:
+        ----------
+        sqlite3.Connection.
+            Conexión en modo autocommit."""
+
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout = 5, isolation_level = None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+
+        return connection
+
+    def append(self, data: Dict[str, Any]) -> Future:
+        """Método que agrega un mensaje al outbox.
+
+        Args:
+        ----------
+        data: Dict[str, Any].
+            Mensaje estructurado por 'structure_msg'.
+
+        Returns:
+        ----------
+        Future.
+            Futuro que se resuelve con el ID de Pub/Sub cuando el mensaje se envía."""
+
+        request_id = data["metadata"]["request_id"]
+        future = Future()
+
+        # El futuro se guarda, por el ID de la fila, antes de que el hilo de envío pueda resolverlo.
+        with self._lock:
+            cursor = self._connection().execute("INSERT INTO outbox (request_id, payload, created_at, ordering_key) "
+                                                "VALUES (?, ?, ?, ?)",
+                                                (request_id, json.dumps(data), time.time(),
+                                                 data["metadata"].get("ordering_key") or ""))
+            self._waiters[cursor.lastrowid] = future
+            self.counters["appended"] += 1
+
+        self._wake.set()
+        return future
+
+    def start(self, publish_fn: Callable[[Dict[str, Any]], Future]) -> None:
+        """Método que inicia el hilo que vacía el outbox hacia Pub/Sub.
+
+        Args:
+        ----------
+        publish_fn: Callable[[Dict[str, Any]], Future].
+            Función que envía un mensaje a Pub/Sub y retorna su futuro."""
+
+        self._thread = threading.Thread(target = self._run, args = (publish_fn,),
+                                        name = "outbox-flusher", daemon = True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Método que detiene el hilo que vacía el outbox.
+
+        Args:
+        ----------
+        timeout: Optional[float].
+            Segundos máximos de espera."""
+
+        self._stop.set()
+        self._wake.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self, publish_fn: Callable[[Dict[str, Any]], Future]) -> None:
+        """Método que ejecuta el ciclo de envío del outbox.
+
+        Args:
+        ----------
+        publish_fn: Callable[[Dict[str, Any]], Future].
+            Función que envía un mensaje a Pub/Sub y retorna su futuro."""
+
+        backoff = self.poll_interval
+
+        while not self._stop.is_set():
+
+            if not self.breaker.allow():
+                self._stop.wait(self.poll_interval)
+                continue
+
+            # Una llave con mensajes en espera no envía ninguno, ni siquiera los agregados después.
+            now = time.time()
+            rows = self._connection().execute("SELECT id, request_id, payload, attempts, ordering_key FROM outbox "
+                                              "WHERE next_attempt_at <= ? AND ordering_key NOT IN "
+                                              "(SELECT ordering_key FROM outbox WHERE next_attempt_at > ? "
+                                              "AND ordering_key != '') ORDER BY id LIMIT ?",
+                                              (now, now, self.batch_size)).fetchall()
+
+            if not rows:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+                continue
+
+            sent, failed = self._flush(rows, publish_fn)
+
+            if failed and not sent:
+                self.breaker.record_failure()
+                backoff = min(backoff * 2, self.max_backoff)
+                print(f"Error enviando el outbox a Pub/Sub, reintento en {backoff} segundos: {failed[0][1]}")
+                self._stop.wait(backoff)
+                continue
+
+            self.breaker.record_success()
+            backoff = self.poll_interval
+
+            # Los fallidos ya quedaron con su espera; la del ciclo evita reintentar sin pausa.
+            if failed:
+                print(f"Error enviando {len(failed)} mensajes del outbox a Pub/Sub: {failed[0][1]}")
+                self._stop.wait(self.poll_interval)
+
+    def _flush(self, rows: List[Tuple[int, str, str, int, str]],
+               publish_fn: Callable[[Dict[str, Any]], Future]) -> Tuple[List[int], List[Tuple[int, str]]]:
+        """Método que envía un lote del outbox y elimina los mensajes confirmados.
+        Cada mensaje fallido, o toda su llave de orden si tiene una, se
+        reintenta tras una espera que se duplica con cada intento, hasta
+        'max_backoff' segundos.
+
+        Args:
+        ----------
+        rows: List[Tuple[int, str, str, int, str]].
+            Filas del outbox (id, request_id, payload, attempts, ordering_key).
+
+        publish_fn: Callable[[Dict[str, Any]], Future].
+            Función que envía un mensaje a Pub/Sub y retorna su futuro.
+
+        Returns:
+        ----------
+        Tuple[List[int], List[Tuple[int, str]]].
+            IDs enviados y pares (id, error) de los fallidos."""
+
+        pending = []
+
+        for row_id, _, payload, attempts, ordering_key in rows:
+            try:
+                pending.append((row_id, attempts, ordering_key, publish_fn(json.loads(payload))))
+            except Exception as e:
+                pending.append((row_id, attempts, ordering_key, e))
+
+        sent, failed, retries = [], [], []
+
+        # Llave de orden -> instante del siguiente intento de sus mensajes.
+        key_retries: Dict[str, float] = {}
+        deadline = time.monotonic() + self.publish_timeout
+
+        for row_id, attempts, ordering_key, future in pending:
+            try:
+                if isinstance(future, Exception):
+                    raise future
+
+                message_id = future.result(timeout = max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                error = f"Sin confirmación de Pub/Sub tras {self.publish_timeout} segundos."
+            except Exception as e:
+                error = str(e)
+            else:
+                error = None
+
+            if error is not None:
+                retry_at = time.time() + min(self.poll_interval * 2 ** (attempts + 1), self.max_backoff)
+                failed.append((row_id, error))
+                retries.append(retry_at)
+
+                if ordering_key:
+                    key_retries[ordering_key] = max(key_retries.get(ordering_key, 0.0), retry_at)
+
+                continue
+
+            sent.append(row_id)
+
+            with self._lock:
+                waiter = self._waiters.pop(row_id, None)
+
+            if waiter is not None:
+                waiter.set_result(message_id)
+
+        connection = self._connection()
+
+        if sent:
+            connection.executemany("DELETE FROM outbox WHERE id = ?", [(row_id,) for row_id in sent])
+
+        if failed:
+            connection.executemany("UPDATE outbox SET attempts = attempts + 1, last_error = ?, "
+                                   "next_attempt_at = ? WHERE id = ?",
+                                   [(error, retry_at, row_id) for (row_id, error), retry_at in zip(failed, retries)])
+
+        if key_retries:
+            connection.executemany("UPDATE outbox SET next_attempt_at = ? WHERE ordering_key = ?",
+                                   [(retry_at, ordering_key) for ordering_key, retry_at in key_retries.items()])
+
+        with self._lock:
+            self.counters["flushed"] += len(sent)
+            self.counters["failed_attempts"] += len(failed)
+
+        return sent, failed
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume el estado del outbox.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Profundidad, antigüedad del mensaje más viejo y contadores."""
+
+        depth, oldest = self._connection().execute("SELECT COUNT(*), MIN(created_at) FROM outbox").fetchone()
+
+        with self._lock:
+            counters = dict(self.counters)
+
+        return {**counters,
+                "depth": depth,
+                "oldest_age_seconds": round(time.time() - oldest, 3) if oldest else 0.0,
+                "breaker_state": self.breaker.state}
@@ -0,0 +1,386 @@
+"""Módulo que contiene el overlay de escrituras publicadas pero aún no consumidas."""
+
+# Librerías Externas.
+from typing import Any, Dict, List, Optional
+
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from flask import has_request_context
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+# Librerías Internas.
+from workers.cache import ReadCache
+
+
+class PendingOverlay:
+    """Clase que guarda, de forma acotada y con expiración, las escrituras que
+    el publicador envió a Pub/Sub y que el suscriptor quizá aún no aplicó, para
+    combinarlas con el estado persistido en las respuestas de los GET.
+
+    Los registros afectados se marcan con el campo 'pending', que indica la
+    acción, los campos pendientes y los 'request_id' de las escrituras. Una
+    entrada se descarta cuando el estado persistido ya la refleja, cuando su
+    publicación falla o cuando expira."""
+
+    PENDING_FIELD = "pending"
+
+    def __init__(self, max_size: int = 1000, ttl: float = 60.0, scoped: bool = False) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        max_size: int.
+            Cantidad máxima de escrituras pendientes en memoria.
+
+        ttl: float.
+            Segundos tras los que una escritura pendiente se descarta.
+
+        scoped: bool.
+            Si es True cada cliente solo ve sus propias escrituras (identidad del JWT)."""
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.scoped = scoped
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self.counters = {"recorded": 0, "applied": 0, "reconciled": 0, "failed": 0, "expired": 0}
+
+    def current_identity(self) -> Optional[str]:
+        """Método que obtiene la identidad del JWT de la petición en curso, si
+        el overlay está limitado por identidad.
+
+        Returns:
+        ----------
+        Optional[str].
+            Identidad, o None si no aplica o no se envió un token."""
+
+        if not self.scoped or not has_request_context():
+            return None
+
+        try:
+            verify_jwt_in_request(optional = True)
+            return get_jwt_identity()
+        except Exception:
+            return None
+
+    def record(self, data: Dict[str, Any], future: Future) -> None:
+        """Método que registra una escritura publicada.
+
+        Args:
+        ----------
+        data: Dict[str, Any].
+            Mensaje estructurado por 'structure_msg'.
+
+        future: Future.
+            Futuro de la publicación; si falla la escritura se descarta."""
+
+        metadata = data["metadata"]
+        table = metadata["table"]
+        ids = data["ids"] or {}
+
+        entry = {"request_id": metadata["request_id"],
+                 "table": table,
+                 "action": metadata["action"],
+                 "record_id": ids.get(ReadCache.ID_FIELDS.get(table)),
+                 "ids": dict(ids),
+                 "fields": dict(data["request"] or {}),
+                 "identity": self.current_identity(),
+                 "expires_at": time.monotonic() + self.ttl}
+
+        with self._lock:
+            self._entries[entry["request_id"]] = entry
+            self.counters["recorded"] += 1
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last = False)
+
+        future.add_done_callback(lambda done: self._on_done(entry["request_id"], done))
+
+    def _on_done(self, request_id: str, future: Future) -> None:
+        """Método que descarta una escritura cuya publicación falló.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la petición.
+
+        future: Future.
+            Futuro de la publicación."""
+
+        if future.exception() is None:
+            return
+
+        with self._lock:
+            if self._entries.pop(request_id, None) is not None:
+                self.counters["failed"] += 1
+
+    def _pending(self, table: str, identity: Optional[str]) -> List[Dict[str, Any]]:
+        """Método que obtiene las escrituras vigentes de una tabla visibles para una identidad.
+
+        Args:
+        ----------
+        table: str.
+            Tabla.
+
+        identity: Optional[str].
+            Identidad del cliente.
+
+        Returns:
+        ----------
+        List[Dict[str, Any]].
+            Escrituras pendientes en orden de publicación."""
+
+        now = time.monotonic()
+
+        with self._lock:
+            expired = [request_id for request_id, entry in self._entries.items() if entry["expires_at"] <= now]
+
+            for request_id in expired:
+                del self._entries[request_id]
+
+            self.counters["expired"] += len(expired)
+
+            return [entry for entry in self._entries.values()
+                    if entry["table"] == table and (not self.scoped or entry["identity"] == identity)]
+
+    def _discard(self, entries: List[Dict[str, Any]]) -> None:
+        """Método que descarta escrituras que ya se reflejan en el estado persistido.
+
+        Args:
+        ----------
+        entries: List[Dict[str, Any]].
+            Escrituras a descartar."""
+
+        with self._lock:
+            for entry in entries:
+                if self._entries.pop(entry["request_id"], None) is not None:
+                    self.counters["reconciled"] += 1
+
+    @staticmethod
+    def _reflects(record: Dict[str, Any], fields: Dict[str, Any]) -> bool:
+        """Método que indica si un registro persistido ya tiene los valores de una escritura.
+
+        Args:
+        ----------
+        record: Dict[str, Any].
+            Registro persistido.
+
+        fields: Dict[str, Any].
+            Campos de la escritura.
+
+        Returns:
+        ----------
+        bool.
+            True si todos los campos coinciden."""
+
+        return all(key in record and record[key] == value for key, value in fields.items())
+
+    def _apply(self, record: Optional[Dict[str, Any]], entries: List[Dict[str, Any]],
+               reconciled: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Método que aplica sobre un registro persistido sus escrituras pendientes.
+
+        Args:
+        ----------
+        record: Optional[Dict[str, Any]].
+            Registro persistido, o None si no existe.
+
+        entries: List[Dict[str, Any]].
+            Escrituras pendientes del registro.
+
+        reconciled: List[Dict[str, Any]].
+            Lista donde se agregan las escrituras que ya se reflejan.
+
+        Returns:
+        ----------
+        Optional[Dict[str, Any]].
+            Registro combinado y marcado, o el persistido si no hay nada pendiente."""
+
+        pending = {"action": None, "fields": [], "request_ids": []}
+        merged = dict(record) if record is not None else None
+
+        for entry in entries:
+            if entry["action"] == "DELETE":
+                if record is None:
+                    reconciled.append(entry)
+                    continue
+
+                pending["action"] = "DELETE"
+
+            elif entry["action"] == "PUT":
+                if record is None:
+                    continue
+
+                if self._reflects(record, entry["fields"]):
+                    reconciled.append(entry)
+                    continue
+
+                merged.update(entry["fields"])
+                pending["action"] = pending["action"] or "PUT"
+                pending["fields"].extend(key for key in entry["fields"] if key not in pending["fields"])
+
+            else:
+                continue
+
+            pending["request_ids"].append(entry["request_id"])
+
+        if not pending["request_ids"]:
+            return record
+
+        merged[self.PENDING_FIELD] = pending
+        return merged
+
+    def merge_record(self, table: str, record_id: Any, record: Optional[Dict[str, Any]],
+                     parent_ids: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Método que combina un registro persistido con sus escrituras pendientes.
+
+        Args:
+        ----------
+        table: str.
+            Tabla.
+
+        record_id: Any.
+            ID del registro.
+
+        record: Optional[Dict[str, Any]].
+            Registro persistido, o None si no existe.
+
+        parent_ids: Optional[Dict[str, Any]].
+            IDs de los padres en la ruta del registro; una escritura que trae
+            otro valor para alguno de ellos es de otra ruta y no se aplica.
+
+        Returns:
+        ----------
+        Optional[Dict[str, Any]].
+            Registro combinado."""
+
+        parents = {key: str(value) for key, value in (parent_ids or {}).items()}
+
+        entries = [entry for entry in self._pending(table, self.current_identity())
+                   if str(entry["record_id"]) == str(record_id)
+                   and all(str(entry["ids"].get(key, value)) == value for key, value in parents.items())]
+
+        if not entries:
+            return record
+
+        reconciled = []
+        merged = self._apply(record, entries, reconciled)
+        self._discard(reconciled)
+
+        if merged is not record:
+            with self._lock:
+                self.counters["applied"] += 1
+
+        return merged
+
+    def merge_list(self, table: str, records: List[Dict[str, Any]],
+                   first_page: bool = True, last_page: bool = True) -> List[Dict[str, Any]]:
+        """Método que combina una página del listado persistido con las escrituras
+        pendientes de la tabla, incluyendo al final de la última página los
+        registros creados aún no persistidos.
+
+        Args:
+        ----------
+        table: str.
+            Tabla.
+
+        records: List[Dict[str, Any]].
+            Registros persistidos de la página.
+
+        first_page: bool.
+            Si la página es la primera del listado.
+
+        last_page: bool.
+            Si la página es la última del listado.
+
+        Returns:
+        ----------
+        List[Dict[str, Any]].
+            Registros combinados."""
+
+        entries = self._pending(table, self.current_identity())
+
+        if not entries:
+            return records
+
+        by_record: Dict[str, List[Dict[str, Any]]] = {}
+        created, reconciled = [], []
+
+        for entry in entries:
+            if entry["action"] == "POST":
+                created.append(entry)
+            elif entry["record_id"] is not None:
+                by_record.setdefault(str(entry["record_id"]), []).append(entry)
+
+        merged = []
+
+        for record in records:
+            record_entries = by_record.pop(str(record.get("id")), None)
+            merged.append(self._apply(record, record_entries, reconciled) if record_entries else record)
+
+        # Las eliminaciones de registros que no aparecen en el listado completo ya se aplicaron. En una
+        # página no se sabe si el registro está en otra, así que se dejan para el registro o el TTL.
+        if first_page and last_page:
+            for record_entries in by_record.values():
+                reconciled.extend(entry for entry in record_entries if entry["action"] == "DELETE")
+
+        for entry in created:
+            parent_ids = {key: int(value) if str(value).isdigit() else value for key, value in entry["ids"].items()}
+            fields = {**parent_ids, **entry["fields"]}
+
+            if any(self._reflects(record, fields) for record in records):
+                reconciled.append(entry)
+                continue
+
+            if not last_page:
+                continue
+
+            merged.append({"id": None, **fields,
+                           self.PENDING_FIELD: {"action": "POST", "fields": list(entry["fields"]),
+                                                "request_ids": [entry["request_id"]]}})
+
+        self._discard(reconciled)
+
+        with self._lock:
+            self.counters["applied"] += sum(1 for record in merged if self.PENDING_FIELD in record)
+
+        return merged
+
+    def pending_fields(self, table: str) -> List[str]:
+        """Método que obtiene los campos que necesitan las escrituras pendientes
+        de una tabla para combinarse con el estado persistido y reconciliarse.
+
+        Args:
+        ----------
+        table: str.
+            Tabla.
+
+        Returns:
+        ----------
+        List[str].
+            Campos de las escrituras, incluyendo los IDs de los padres de las creaciones."""
+
+        names: Dict[str, None] = {}
+
+        for entry in self._pending(table, self.current_identity()):
+            if entry["action"] == "POST":
+                names.update(dict.fromkeys(entry["ids"]))
+
+            names.update(dict.fromkeys(entry["fields"]))
+
+        return list(names)
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume el estado del overlay.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Contadores y escrituras pendientes en memoria."""
+
+        with self._lock:
+            return {**self.counters, "size": len(self._entries), "ttl": self.ttl, "scoped": self.scoped}
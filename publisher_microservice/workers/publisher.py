@@ -1,37 +1,253 @@
 """Módulo encargado de las comunicaciones con Pub/Sub."""
 
 # Librerías Externas.
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-import json
+import uuid
 from datetime import datetime
+from concurrent.futures import Future
 
-from google.cloud import pubsub_v1
+from flask import request, has_request_context
+from flask_smorest import abort
 
 # Librerías Internas.
-from config import PROJECT_ID, TOPIC_NAME
+from config import Config
+from workers.registry import PublishRegistry, DEFERRED_PUBLISHES
+from workers.admission import AdmissionController
+from workers.idempotency import IdempotencyStore
+from workers.cache import ReadCache
+from workers.overlay import PendingOverlay
+from workers.outbox import Outbox, CircuitBreaker
+from workers.combiner import WriteCombiner
+from workers.codec import compress_payload, encode_envelope
+from workers.transport import build_transport
 
 
-publisher = pubsub_v1.PublisherClient()
-topic_path = publisher.topic_path(PROJECT_ID, TOPIC_NAME)
+transport = build_transport()
 
+registry = PublishRegistry(max_size = Config.PUBLISH_REGISTRY_SIZE)
 
-def publish_msg(data: Dict[str, str]) -> None:
+read_cache = ReadCache(max_size = Config.READ_CACHE_SIZE, ttl = Config.READ_CACHE_TTL)
+
+overlay = PendingOverlay(max_size = Config.PENDING_OVERLAY_SIZE, ttl = Config.PENDING_OVERLAY_TTL,
+                         scoped = Config.PENDING_OVERLAY_SCOPE == "identity")
+
+idempotency = IdempotencyStore(max_size = Config.IDEMPOTENCY_MAX_SIZE, ttl = Config.IDEMPOTENCY_TTL,
+                               path = Config.IDEMPOTENCY_PATH or None)
+
+admission = AdmissionController(soft_max_messages = Config.ADMISSION_SOFT_MAX_MESSAGES,
+                                hard_max_messages = Config.ADMISSION_HARD_MAX_MESSAGES,
+                                soft_max_bytes = Config.ADMISSION_SOFT_MAX_BYTES,
+                                hard_max_bytes = Config.ADMISSION_HARD_MAX_BYTES,
+                                queue_timeout = Config.ADMISSION_QUEUE_TIMEOUT)
+
+outbox = None
+
+if Config.PUBLISH_MODE == "outbox":
+    outbox = Outbox(Config.OUTBOX_PATH, batch_size = Config.OUTBOX_BATCH_SIZE,
+                    poll_interval = Config.OUTBOX_POLL_INTERVAL, max_backoff = Config.OUTBOX_MAX_BACKOFF,
+                    breaker = CircuitBreaker(threshold = Config.OUTBOX_BREAKER_THRESHOLD,
+                                             cooldown = Config.OUTBOX_BREAKER_COOLDOWN),
+                    publish_timeout = Config.OUTBOX_PUBLISH_TIMEOUT)
+
+PUBLISH_STATUS_CODE = 200 if Config.PUBLISH_MODE == "sync" else 202
+
+
+def publish_msg(data: Dict[str, str]) -> str:
     """Función encargada de publicar mensajes en Pub/Sub.
+
+    En modo 'sync' espera la confirmación de Pub/Sub; si la app se sirve por
+    ASGI, la espera se delega al event loop y el hilo queda libre. En modo
+    'async' retorna de inmediato y el resultado queda en el registro de
+    publicaciones. En modo 'outbox' el mensaje se guarda en el outbox local y
+    se envía en segundo plano.
     
     Args:
     ----------
     data: Dict[str, str].
-        Data a publicar en el tópico de Pub/Sub."""
-        
-    encoded_msg = json.dumps(data).encode("utf-8")
+        Data a publicar en el tópico de Pub/Sub.
     
-    future = publisher.publish(topic_path, encoded_msg)
-    msg_id = future.result()
+    Returns:
+    ----------
+    str.
+        ID de la petición con el que se puede consultar la publicación."""
+        
+    future = _publish(data)
+
+    if Config.PUBLISH_MODE == "sync":
+        deferred = request.environ.get(DEFERRED_PUBLISHES) if has_request_context() else None
+
+        if deferred is not None:
+            deferred.append(future)
+        else:
+            future.result()
+
+    return data["metadata"]["request_id"]
+
+def publish_batch(data_list: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Función que publica un conjunto de mensajes sin esperar uno por uno,
+    de modo que el cliente de Pub/Sub los agrupe en pocos RPCs.
+
+    Args:
+    ----------
+    data_list: List[Dict[str, str]].
+        Mensajes a publicar en el tópico de Pub/Sub.
+
+    Returns:
+    ----------
+    List[Dict[str, str]].
+        Resultado de cada publicación, en el mismo orden recibido."""
+
+    futures = [(data["metadata"]["request_id"], _publish(data)) for data in data_list]
+    results = []
+
+    for request_id, future in futures:
+
+        if Config.PUBLISH_MODE != "sync":
+            results.append({"request_id": request_id, "status": registry.PENDING})
+            continue
+
+        try:
+            results.append({"request_id": request_id, "status": registry.PUBLISHED,
+                            "message_id": future.result()})
+        except Exception as e:
+            results.append({"request_id": request_id, "status": registry.FAILED,
+                            "error": str(e)})
+
+    return results
+
+def _publish(data: Dict[str, str]) -> Future:
+    """Función auxiliar que entrega el mensaje al combinador de actualizaciones
+    o lo despacha, y lo registra en el registro de publicaciones. Si el
+    'request_id' ya está registrado responde 409 sin publicar.
+
+    Args:
+    ----------
+    data: Dict[str, str].
+        Data a publicar en el tópico de Pub/Sub.
+
+    Returns:
+    ----------
+    Future.
+        Futuro de la publicación."""
+
+    request_id = data["metadata"]["request_id"]
+
+    if not registry.reserve(request_id, data["metadata"]):
+        abort(409, message = f"Ya existe una publicación con el X-Request-ID {request_id}.")
+
+    # Si el envío falla antes de obtener el futuro, el ID se libera para que el cliente pueda reintentar.
+    try:
+        if combiner is not None and data["metadata"]["action"] == "PUT":
+            future = combiner.submit(data)
+        else:
+            if combiner is not None:
+                combiner.flush_related(data)
+
+            future = _dispatch(data)
+
+    except Exception:
+        registry.release(request_id)
+        raise
+
+    registry.track(request_id, future)
+    read_cache.invalidate_write(data["metadata"], data["ids"])
+    overlay.record(data, future)
+
+    return future
+
+def _dispatch(data: Dict[str, str]) -> Future:
+    """Función auxiliar que entrega el mensaje al outbox o directamente al
+    cliente de Pub/Sub.
+
+    Args:
+    ----------
+    data: Dict[str, str].
+        Data a publicar en el tópico de Pub/Sub.
+
+    Returns:
+    ----------
+    Future.
+        Futuro de la publicación."""
+
+    return outbox.append(data) if outbox is not None else _send(data)
+
+def _send(data: Dict[str, str]) -> Future:
+    """Función auxiliar que codifica el mensaje y lo entrega al transporte.
+
+    Args:
+    ----------
+    data: Dict[str, str].
+        Data a publicar en el tópico de Pub/Sub.
+
+    Returns:
+    ----------
+    Future.
+        Futuro de la publicación."""
+
+    encoded_msg, envelope_attributes = encode_envelope(data, envelope = Config.PUBSUB_ENVELOPE)
+    encoded_msg, attributes = compress_payload(encoded_msg,
+                                               codec = Config.PUBSUB_COMPRESSION_CODEC,
+                                               threshold = Config.PUBSUB_COMPRESSION_THRESHOLD)
+
+    ordering_key = data["metadata"]["ordering_key"] if Config.PUBSUB_ENABLE_ORDERING else ""
+
+    future = transport.publish(encoded_msg, ordering_key = ordering_key,
+                               **envelope_attributes, **attributes)
+    admission.track(future, len(encoded_msg))
+
+    if ordering_key:
+        future.add_done_callback(lambda done: _resume_on_error(done, ordering_key))
+
+    return future
+
+def _resume_on_error(future: Future, ordering_key: str) -> None:
+    """Función auxiliar que reanuda una llave de orden cuando una publicación
+    falla, ya que Pub/Sub pausa la llave para no romper el orden.
+
+    Args:
+    ----------
+    future: Future.
+        Futuro ya resuelto.
+
+    ordering_key: str.
+        Llave de orden del mensaje."""
+
+    if future.exception() is not None:
+        transport.resume_publish(ordering_key)
+
+def get_ordering_key(table_name: str, request_ids: Optional[Dict[str, int]]) -> str:
+    """Función auxiliar que obtiene la llave de orden a partir de la entidad
+    raíz del mensaje: el modelo para las versiones y el problema para los
+    problemas y modelos.
+
+    Args:
+    ----------
+    table_name: str.
+        Tabla a impactar.
+
+    request_ids: Optional[Dict[str, int]].
+        IDs del mensaje.
+
+    Returns:
+    ----------
+    str.
+        Llave de orden, vacía si el mensaje no tiene entidad raíz (p. ej. crear un problema)."""
+
+    request_ids = request_ids or {}
+
+    if table_name == "versions" and request_ids.get("model_id") is not None:
+        return f"model-{request_ids['model_id']}"
+
+    if request_ids.get("problem_id") is not None:
+        return f"problem-{request_ids['problem_id']}"
+
+    return ""
 
 def structure_msg(table_name: str, action: str,
                   request_data: Optional[Dict[str, str]] = None,
-                  request_ids: Optional[Dict[str, int]] = None) -> Dict[str, str]:
+                  request_ids: Optional[Dict[str, int]] = None,
+                  request_id: Optional[str] = None) -> Dict[str, str]:
     """Función auxiliar que permite definir la estructura de los mensajes
     a publicar en Pub/Sub.
     
@@ -48,6 +264,9 @@ def structure_msg(table_name: str, action: str,
     
     request_ids: Optional[Dict[str, int]].
         Información adicional relacionada con registros en la misma u otra tabla.
+
+    request_id: Optional[str].
+        ID de la petición enviado por el cliente. Si no se envía, se genera uno.
     
     Returns:
     ----------
@@ -58,6 +277,14 @@ def structure_msg(table_name: str, action: str,
                      "ids": request_ids,
                      "metadata": {"table": table_name,
                                   "action": action, 
-                                  "timestamp": datetime.utcnow().isoformat()}}
+                                  "timestamp": datetime.utcnow().isoformat(),
+                                  "request_id": request_id or uuid.uuid4().hex,
+                                  "ordering_key": get_ordering_key(table_name, request_ids)}}
     
-    return msg_structure
\ No newline at end of file
+    return msg_structure
+
+
+combiner = WriteCombiner(_dispatch, window = Config.WRITE_COMBINE_WINDOW) if Config.WRITE_COMBINE_WINDOW > 0 else None
+
+if outbox is not None:
+    outbox.start(_send)
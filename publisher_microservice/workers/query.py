@@ -0,0 +1,311 @@
+"""Módulo encargado de las consultas a la API de lectura (servicio suscriptor)."""
+
+# Librerías Externas.
+from typing import Any, Dict, List, Optional, Tuple
+
+import json
+import urllib.parse
+import urllib3
+
+from flask import Response, request, jsonify, stream_with_context
+from flask_smorest import abort
+from werkzeug.http import unquote_etag
+from werkzeug.exceptions import NotFound
+
+# Librerías Internas.
+from config import Config
+from workers.publisher import read_cache, overlay
+from workers.http_client import HttpClient, RetryBudget
+
+
+client = HttpClient(Config.QUERY_API_URL,
+                    max_connections = Config.QUERY_POOL_MAXSIZE,
+                    connect_timeout = Config.QUERY_CONNECT_TIMEOUT,
+                    read_timeout = Config.QUERY_API_TIMEOUT,
+                    max_retries = Config.QUERY_MAX_RETRIES,
+                    retry_backoff = Config.QUERY_RETRY_BACKOFF,
+                    budget = RetryBudget(ratio = Config.QUERY_RETRY_BUDGET_RATIO,
+                                         min_per_second = Config.QUERY_RETRY_MIN_PER_SECOND))
+
+
+def fetch(path: str, cached: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], bool]:
+    """Función que consulta una ruta de la API de lectura. Si se entrega una
+    respuesta guardada con ETag, la consulta es condicional.
+
+    Args:
+    ----------
+    path: str.
+        Ruta a consultar, por ejemplo '/problem/1'.
+
+    cached: Optional[Dict[str, Any]].
+        Respuesta guardada ('etag' y 'body') a revalidar.
+
+    Returns:
+    ----------
+    Tuple[Dict[str, Any], bool].
+        Respuesta ('etag' y 'body') y si la API confirmó que la guardada no cambió."""
+
+    headers = {"If-None-Match": f'"{cached["etag"]}"'} if cached and cached["etag"] else None
+
+    try:
+        status, body, response_headers = client.get_json(path, headers = headers)
+    except (urllib3.exceptions.HTTPError, ValueError):
+        abort(502, message = "No fue posible consultar la API de lectura.")
+
+    if status == 304 and headers:
+        return cached, True
+
+    if status == 404:
+        abort(404, message = "No existe el registro solicitado.")
+
+    if status == 400:
+        abort(400, message = (body or {}).get("message", "La consulta a la API de lectura no es válida."))
+
+    if not 200 <= status < 300:
+        abort(502, message = f"La API de lectura respondió con el código {status}.")
+
+    etag = response_headers.get("ETag")
+
+    return {"etag": unquote_etag(etag)[0] if etag else None, "body": body}, False
+
+def query_string(params: Dict[str, Any]) -> str:
+    """Función que codifica los parámetros de una consulta a la API de lectura,
+    en orden y sin los vacíos, para que sirvan también como llave de la caché.
+
+    Args:
+    ----------
+    params: Dict[str, Any].
+        Parámetros de la consulta; 'fieldset' se envía como 'fields'.
+
+    Returns:
+    ----------
+    str.
+        Query string."""
+
+    return urllib.parse.urlencode(sorted(("fields" if key == "fieldset" else key, value)
+                                         for key, value in params.items() if value is not None))
+
+def widen_fields(table: str, fieldset: Optional[str]) -> Tuple[Optional[List[str]], Optional[str]]:
+    """Función que interpreta el parámetro 'fields' y lo amplía con los campos
+    que necesitan las escrituras pendientes de la tabla, para que el overlay
+    pueda combinarlas y reconciliarlas aunque no se hayan solicitado.
+
+    Args:
+    ----------
+    table: str.
+        Tabla consultada.
+
+    fieldset: Optional[str].
+        Campos solicitados, separados por comas; si es None se solicitan todos.
+
+    Returns:
+    ----------
+    Tuple[Optional[List[str]], Optional[str]].
+        Campos solicitados y campos a consultar en la API de lectura, o None si se solicitan todos."""
+
+    if fieldset is None:
+        return None, None
+
+    requested = list(dict.fromkeys(["id"] + [name.strip() for name in fieldset.split(",") if name.strip()]))
+    upstream = sorted(set(requested) | set(overlay.pending_fields(table)))
+
+    return requested, ",".join(upstream)
+
+def narrow(record: Dict[str, Any], requested: Optional[List[str]]) -> Dict[str, Any]:
+    """Función que reduce un registro combinado a los campos solicitados,
+    conservando la marca de escrituras pendientes.
+
+    Args:
+    ----------
+    record: Dict[str, Any].
+        Registro combinado.
+
+    requested: Optional[List[str]].
+        Campos solicitados; si es None se devuelve el registro completo.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Registro reducido."""
+
+    if requested is None:
+        return record
+
+    return {key: record[key] for key in [*requested, overlay.PENDING_FIELD] if key in record}
+
+def read_through(table: str, path: str, record_id: Any = None, query: str = "",
+                 parent_ids: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Función que obtiene un registro o una página del listado desde la caché
+    de lecturas y, si no está vigente, lo consulta en la API de lectura. Las
+    respuestas expiradas se revalidan con su ETag, de modo que si no cambiaron
+    la API responde 304 sin volver a enviar el cuerpo.
+
+    Args:
+    ----------
+    table: str.
+        Tabla consultada.
+
+    path: str.
+        Ruta de la API de lectura, sin parámetros.
+
+    record_id: Any.
+        ID del registro; si es None se consulta el listado de la tabla.
+
+    query: str.
+        Parámetros de la consulta (paginación y campos), codificados como query string.
+
+    parent_ids: Optional[Dict[str, Any]].
+        IDs de los padres en la ruta del registro.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Respuesta ('etag' y 'body')."""
+
+    key = read_cache.key(table, record_id, query, parent_ids)
+    cached = read_cache.get(key)
+
+    if cached is None:
+        cached, not_modified = fetch(path + (f"?{query}" if query else ""), read_cache.peek(key))
+
+        if not_modified:
+            read_cache.revalidated(key)
+        else:
+            read_cache.set(key, cached)
+
+    return cached
+
+def read_list(table: str, path: str, pagination: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Función que obtiene una página del listado de una tabla combinada con las
+    escrituras publicadas que aún no se han consumido.
+
+    Args:
+    ----------
+    table: str.
+        Tabla consultada.
+
+    path: str.
+        Ruta de la API de lectura.
+
+    pagination: Dict[str, Any].
+        Cursor de la página anterior, límite de registros y campos solicitados.
+
+    Returns:
+    ----------
+    Tuple[Dict[str, Any], Optional[str]].
+        Página ('items' y 'next_cursor') y ETag; el ETag es None si hay
+        escrituras pendientes en la página."""
+
+    requested, upstream = widen_fields(table, pagination.get("fieldset"))
+
+    cached = read_through(table, path, query = query_string({**pagination, "fieldset": upstream}))
+    next_cursor = cached["body"]["next_cursor"]
+
+    records = overlay.merge_list(table, cached["body"]["items"],
+                                 first_page = pagination.get("cursor") is None,
+                                 last_page = next_cursor is None)
+
+    pending = any(overlay.PENDING_FIELD in record for record in records)
+    items = [narrow(record, requested) for record in records]
+
+    return {"items": items, "next_cursor": next_cursor}, None if pending else cached["etag"]
+
+def read_record(table: str, path: str, record_id: Any, fieldset: Optional[str] = None,
+                parent_ids: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Función que obtiene un registro combinado con sus escrituras publicadas
+    que aún no se han consumido.
+
+    Args:
+    ----------
+    table: str.
+        Tabla consultada.
+
+    path: str.
+        Ruta de la API de lectura.
+
+    record_id: Any.
+        ID del registro.
+
+    fieldset: Optional[str].
+        Campos solicitados, separados por comas; si es None se solicitan todos.
+
+    parent_ids: Optional[Dict[str, Any]].
+        IDs de los padres en la ruta del registro (p. ej. {"model_id": "1"}).
+
+    Returns:
+    ----------
+    Tuple[Dict[str, Any], Optional[str]].
+        Registro y ETag; el ETag es None si el registro tiene escrituras pendientes."""
+
+    requested, upstream = widen_fields(table, fieldset)
+
+    try:
+        cached = read_through(table, path, record_id, query_string({"fieldset": upstream}), parent_ids)
+    except NotFound:
+        cached = {"etag": None, "body": None}
+
+    record = overlay.merge_record(table, record_id, cached["body"], parent_ids)
+
+    if record is None:
+        abort(404, message = "No existe el registro solicitado.")
+
+    return narrow(record, requested), None if record is not cached["body"] else cached["etag"]
+
+def stream_export(path: str, export_args: Dict[str, str]) -> Response:
+    """Función que reenvía por partes una exportación de la API de lectura, sin
+    cargarla en memoria. Las exportaciones no pasan por la caché ni incluyen
+    las escrituras pendientes.
+
+    Args:
+    ----------
+    path: str.
+        Ruta de exportación de la API de lectura.
+
+    export_args: Dict[str, str].
+        Parámetros de la exportación (formato y campos).
+
+    Returns:
+    ----------
+    Response.
+        Respuesta enviada al cliente por partes."""
+
+    try:
+        status, headers, chunks = client.stream(f"{path}?{query_string(export_args)}")
+    except urllib3.exceptions.HTTPError:
+        abort(502, message = "No fue posible consultar la API de lectura.")
+
+    if status == 400:
+        body = json.loads(b"".join(chunks) or b"{}")
+        abort(400, message = body.get("message", "La consulta a la API de lectura no es válida."))
+
+    if status != 200:
+        # Se consume el cuerpo para que la conexión vuelva al pool.
+        b"".join(chunks)
+        abort(502, message = f"La API de lectura respondió con el código {status}.")
+
+    return Response(stream_with_context(chunks), mimetype = headers.get("Content-Type"))
+
+def conditional_response(data: Any, etag: Optional[str]) -> Response:
+    """Función que construye la respuesta de un GET con su ETag. Si el cliente
+    envía 'If-None-Match' con el mismo ETag se responde 304 sin cuerpo.
+
+    Args:
+    ----------
+    data: Any.
+        Cuerpo de la respuesta.
+
+    etag: Optional[str].
+        ETag de la respuesta; si es None la respuesta no es condicional.
+
+    Returns:
+    ----------
+    Response.
+        Respuesta enviada al cliente."""
+
+    response = jsonify(data)
+
+    if etag is not None:
+        response.set_etag(etag)
+        response.make_conditional(request)
+
+    return response
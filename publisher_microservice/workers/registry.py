@@ -0,0 +1,241 @@
+"""Módulo que contiene el registro de las publicaciones en vuelo."""
+
+# Librerías Externas.
+from typing import Any, Dict, Optional
+
+import threading
+from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+# Llave del environ WSGI con la lista de futuros de publicaciones cuya confirmación se espera en el
+# event loop antes de enviar la respuesta. Solo existe cuando la app se sirve por ASGI ('asgi.py').
+DEFERRED_PUBLISHES = "publisher.deferred_publishes"
+
+
+class PublishRegistry:
+    """Clase que lleva un registro acotado del estado de cada publicación
+    enviada a Pub/Sub, identificada por el 'request_id' del cliente.
+
+    Las publicaciones pendientes y las resueltas se guardan por separado, en
+    orden de llegada y de resolución respectivamente, para liberar espacio
+    sin recorrer el registro."""
+
+    PENDING = "PENDING"
+    PUBLISHED = "PUBLISHED"
+    FAILED = "FAILED"
+
+    def __init__(self, max_size: int = 10000) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        max_size: int.
+            Cantidad máxima de publicaciones que se mantienen en memoria."""
+
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._resolved: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self.counters = {"registered": 0, "published": 0, "failed": 0, "evicted_pending": 0, "duplicates": 0}
+
+    def reserve(self, request_id: str, metadata: Optional[Dict[str, str]] = None) -> bool:
+        """Método que registra una publicación antes de enviarla. Un 'request_id'
+        que ya está en el registro no se reemplaza, para no perder el estado de
+        la publicación anterior.
+
+        Args:
+        ----------
+        request_id: str.
+            ID con el que el cliente puede consultar la publicación.
+
+        metadata: Optional[Dict[str, str]].
+            Metadata del mensaje a publicar.
+
+        Returns:
+        ----------
+        bool.
+            True si se registró; False si el 'request_id' ya estaba registrado."""
+
+        entry = {"request_id": request_id,
+                 "status": self.PENDING,
+                 "table": (metadata or {}).get("table"),
+                 "action": (metadata or {}).get("action"),
+                 "message_id": None,
+                 "error": None,
+                 "created_at": datetime.utcnow().isoformat(),
+                 "resolved_at": None,
+                 "future": None}
+
+        with self._lock:
+            if request_id in self._pending or request_id in self._resolved:
+                self.counters["duplicates"] += 1
+                return False
+
+            self._pending[request_id] = entry
+            self.counters["registered"] += 1
+            self._evict()
+
+        return True
+
+    def release(self, request_id: str) -> None:
+        """Método que libera una publicación registrada con 'reserve' que no se
+        llegó a enviar, para que el cliente pueda reintentarla con el mismo ID.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la publicación."""
+
+        with self._lock:
+            if self._pending.pop(request_id, None) is not None:
+                self.counters["registered"] -= 1
+
+    def track(self, request_id: str, future: Future) -> None:
+        """Método que asocia una publicación registrada con 'reserve' a su
+        futuro y se suscribe a su resultado.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la publicación.
+
+        future: Future.
+            Futuro devuelto por el cliente de Pub/Sub."""
+
+        with self._lock:
+            entry = self._pending.get(request_id)
+
+            if entry is not None:
+                entry["future"] = future
+
+        future.add_done_callback(lambda done: self._on_done(request_id, done))
+
+    def _on_done(self, request_id: str, future: Future) -> None:
+        """Método que se ejecuta cuando Pub/Sub confirma o rechaza la publicación.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la publicación.
+
+        future: Future.
+            Futuro ya resuelto."""
+
+        error = future.exception()
+
+        if error is None:
+            self.resolve(request_id, message_id = future.result())
+        else:
+            self.resolve(request_id, error = error)
+
+    def resolve(self, request_id: str, message_id: Optional[str] = None,
+                error: Optional[BaseException] = None) -> None:
+        """Método que marca una publicación como exitosa o fallida y la pasa a
+        las resueltas.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la publicación.
+
+        message_id: Optional[str].
+            ID asignado por Pub/Sub al mensaje.
+
+        error: Optional[BaseException].
+            Error ocurrido al publicar."""
+
+        with self._lock:
+            self.counters["failed" if error else "published"] += 1
+            entry = self._pending.pop(request_id, None)
+
+            if entry is not None:
+                entry["status"] = self.FAILED if error else self.PUBLISHED
+                entry["message_id"] = message_id
+                entry["error"] = str(error) if error else None
+                entry["resolved_at"] = datetime.utcnow().isoformat()
+                self._resolved[request_id] = entry
+
+        if error:
+            print(f"Error publicando el mensaje {request_id}: {error}")
+
+    def _evict(self) -> None:
+        """Método que libera espacio en el registro, empezando por las
+        publicaciones ya resueltas más antiguas. Se debe llamar con el candado tomado."""
+
+        while len(self._pending) + len(self._resolved) > self.max_size and self._resolved:
+            self._resolved.popitem(last = False)
+
+        while len(self._pending) > self.max_size:
+            key, _ = self._pending.popitem(last = False)
+            self.counters["evicted_pending"] += 1
+            print(f"Registro de publicaciones lleno, se deja de rastrear el mensaje {key}.")
+
+    def _entry(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Método que busca una publicación. Se debe llamar con el candado tomado.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la publicación.
+
+        Returns:
+        ----------
+        Optional[Dict[str, Any]].
+            Registro de la publicación o None si no está registrada."""
+
+        entry = self._pending.get(request_id)
+        return entry if entry is not None else self._resolved.get(request_id)
+
+    def get(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Método que obtiene el estado de una publicación.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la publicación.
+
+        Returns:
+        ----------
+        Optional[Dict[str, Any]].
+            Estado de la publicación o None si no está registrada."""
+
+        with self._lock:
+            entry = self._entry(request_id)
+
+            if entry is None:
+                return None
+
+            return {key: value for key, value in entry.items() if key != "future"}
+
+    def future(self, request_id: str) -> Optional[Future]:
+        """Método que obtiene el futuro asociado a una publicación.
+
+        Args:
+        ----------
+        request_id: str.
+            ID de la publicación.
+
+        Returns:
+        ----------
+        Optional[Future].
+            Futuro de Pub/Sub o None si no está registrada."""
+
+        with self._lock:
+            entry = self._entry(request_id)
+            return entry["future"] if entry else None
+
+    def stats(self) -> Dict[str, int]:
+        """Método que resume el estado del registro.
+
+        Returns:
+        ----------
+        Dict[str, int].
+            Contadores del registro."""
+
+        with self._lock:
+            return {**self.counters, "tracked": len(self._pending) + len(self._resolved),
+                    "pending": len(self._pending)}
@@ -0,0 +1,169 @@
+"""Módulo que contiene los transportes con los que se publican los mensajes."""
+
+# Librerías Externas.
+from typing import Optional, Union
+
+from concurrent.futures import Future
+
+try:
+    from google.cloud import pubsub_v1
+    from google.cloud.pubsub_v1 import types
+except ImportError:
+    pubsub_v1 = None
+
+# Librerías Internas.
+from config import PROJECT_ID, TOPIC_NAME, Config
+from workers.broker import LocalBroker
+
+
+class PubSubTransport:
+    """Clase que publica mensajes en un tópico de Google Cloud Pub/Sub."""
+
+    def __init__(self, project_id: Optional[str] = PROJECT_ID, topic_name: Optional[str] = TOPIC_NAME,
+                 batch_max_messages: int = Config.PUBSUB_BATCH_MAX_MESSAGES,
+                 batch_max_bytes: int = Config.PUBSUB_BATCH_MAX_BYTES,
+                 batch_max_latency: float = Config.PUBSUB_BATCH_MAX_LATENCY) -> None:
+        """Método constructor. El cliente se construye con la configuración de
+        lotes y control de flujo, de modo que agrupa en un solo RPC las
+        publicaciones concurrentes hechas desde los distintos hilos de la app.
+
+        Args:
+        ----------
+        project_id: Optional[str].
+            Proyecto de GCP.
+
+        topic_name: Optional[str].
+            Tópico de Pub/Sub.
+
+        batch_max_messages: int.
+            Cantidad máxima de mensajes por lote.
+
+        batch_max_bytes: int.
+            Tamaño máximo en bytes de cada lote.
+
+        batch_max_latency: float.
+            Segundos máximos que un mensaje espera a que se complete su lote."""
+
+        if pubsub_v1 is None:
+            raise ImportError("Se requiere 'google-cloud-pubsub' para usar el transporte 'pubsub'.")
+
+        batch_settings = types.BatchSettings(max_messages = batch_max_messages,
+                                             max_bytes = batch_max_bytes,
+                                             max_latency = batch_max_latency)
+
+        behavior = types.LimitExceededBehavior(Config.PUBSUB_FLOW_LIMIT_BEHAVIOR.lower())
+        flow_control = types.PublishFlowControl(message_limit = Config.PUBSUB_FLOW_MAX_MESSAGES,
+                                                byte_limit = Config.PUBSUB_FLOW_MAX_BYTES,
+                                                limit_exceeded_behavior = behavior)
+
+        publisher_options = types.PublisherOptions(enable_message_ordering = Config.PUBSUB_ENABLE_ORDERING,
+                                                   flow_control = flow_control)
+
+        self.client = pubsub_v1.PublisherClient(batch_settings = batch_settings,
+                                                publisher_options = publisher_options)
+        self.topic_path = self.client.topic_path(project_id, topic_name)
+
+    def publish(self, data: bytes, ordering_key: str = "", **attributes: str) -> Future:
+        """Método que publica un mensaje.
+
+        Args:
+        ----------
+        data: bytes.
+            Cuerpo del mensaje.
+
+        ordering_key: str.
+            Llave de orden del mensaje.
+
+        Returns:
+        ----------
+        Future.
+            Futuro que se resuelve con el ID del mensaje."""
+
+        return self.client.publish(self.topic_path, data, ordering_key = ordering_key, **attributes)
+
+    def resume_publish(self, ordering_key: str) -> None:
+        """Método que reanuda una llave de orden pausada por un error.
+
+        Args:
+        ----------
+        ordering_key: str.
+            Llave de orden."""
+
+        self.client.resume_publish(self.topic_path, ordering_key)
+
+    def stop(self) -> None:
+        """Método que envía los lotes pendientes y detiene el cliente."""
+
+        self.client.stop()
+
+
+class LocalTransport:
+    """Clase que publica mensajes en el broker local, para ejecuciones sin GCP."""
+
+    def __init__(self, path: str = Config.LOCAL_BROKER_PATH) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        path: str.
+            Ruta del archivo SQLite del broker, compartido con el suscriptor."""
+
+        self.broker = LocalBroker(path)
+
+    def publish(self, data: bytes, ordering_key: str = "", **attributes: str) -> Future:
+        """Método que publica un mensaje.
+
+        Args:
+        ----------
+        data: bytes.
+            Cuerpo del mensaje.
+
+        ordering_key: str.
+            Llave de orden del mensaje.
+
+        Returns:
+        ----------
+        Future.
+            Futuro ya resuelto con el ID del mensaje."""
+
+        future = Future()
+
+        try:
+            future.set_result(self.broker.publish(data, attributes, ordering_key))
+        except Exception as e:
+            future.set_exception(e)
+
+        return future
+
+    def resume_publish(self, ordering_key: str) -> None:
+        """Método sin efecto: el broker local no pausa llaves de orden.
+
+        Args:
+        ----------
+        ordering_key: str.
+            Llave de orden."""
+
+    def stop(self) -> None:
+        """Método sin efecto: el broker local no mantiene lotes pendientes."""
+
+
+def build_transport(name: str = Config.PUBSUB_TRANSPORT) -> Union[PubSubTransport, LocalTransport]:
+    """Función que construye el transporte configurado.
+
+    Args:
+    ----------
+    name: str.
+        Transporte a usar ('pubsub' o 'local').
+
+    Returns:
+    ----------
+    Union[PubSubTransport, LocalTransport].
+        Transporte de publicación."""
+
+    if name == "local":
+        return LocalTransport()
+
+    if name == "pubsub":
+        return PubSubTransport()
+
+    raise ValueError(f"El transporte '{name}' no existe.")
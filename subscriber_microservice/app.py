@@ -1,9 +1,12 @@
 """Módulo que encapsula todas las funcionalidades de la app."""
 
 # Librerías Externas.
-from flask import Flask
+from typing import Dict
+
 from flask_smorest import Api
 from flask_migrate import Migrate
+from flask_jwt_extended import JWTManager
+from flask import Flask, jsonify, Response
 
 
 # Librerías Internas.
@@ -11,6 +14,11 @@ import models
 from db import db
 from config import Config
 
+from resources import ModelBlueprint
+from resources import ProblemBlueprint
+from resources import VersionBlueprint
+from resources import FailedMessageBlueprint
+
 
 def create_app() -> Flask:
     """Función que encapsula la creación de la app.
@@ -28,12 +36,73 @@ def create_app() -> Flask:
     db.init_app(app)
 
     api = Api(app)
+    jwt = JWTManager(app)
     migrate = Migrate(app, db)
 
+    @jwt.expired_token_loader
+    def expired_token_callback(jwt_header: Dict[str, str], jwt_payload: Dict[str, str]) -> Response:
+        """Función que protege a nuestros endpoints cuando ha pasado mucho tiempo
+        desde el login.
+
+        Args:
+        ----------
+        jwt_header: Dict[str, str]
+            Información de los headers.
+
+        jwt_payload: Dict[str, str].
+            Información del request.
+        
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente."""
+
+        return jsonify({"message": "El token ha expirado.",
+                        "error": "Token expirado."}), 401
+    
+    @jwt.invalid_token_loader
+    def invalid_token_callback(error: str) -> Response:
+        """Función que protege a nuestros endpoints de tokens inválidos.
+
+        Args:
+        ----------
+        error: str.
+            Error.
+        
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente."""
+
+        return jsonify({"message": "El token es inválido.",
+                        "error": "Token inválido."}), 401
+    
+    @jwt.unauthorized_loader
+    def missing_token_callback(error: str) -> Response:
+        """Función que protege a nuestros endpoints cuando no se envía el token.
+
+        Args:
+        ----------
+        error: str.
+            Error.
+        
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente."""
+
+        return jsonify({"message": "No se ha pasado un token de autenticación.",
+                        "error": "Se requiere un token de autenticación."}), 401
+
     @app.before_request
     def create_tables() -> None:
         """Función que crea las tablas definidas en nuestra app."""
 
         db.create_all()
 
+    api.register_blueprint(ModelBlueprint)
+    api.register_blueprint(ProblemBlueprint)
+    api.register_blueprint(VersionBlueprint)
+    api.register_blueprint(FailedMessageBlueprint)
+
     return app
@@ -0,0 +1,122 @@
+"""Benchmark de la exportación de versiones: compara el pico de memoria y el
+tiempo de construir el listado completo en memoria contra la exportación por
+partes con un cursor del servidor.
+
+Si la tabla tiene menos de '--rows' versiones, se completan con registros
+sintéticos. Se ejecuta desde la carpeta del servicio:
+
+    DATABASE_URL=sqlite:////tmp/export.db python -m benchmarks.bench_export --rows 200000"""
+
+# Librerías Externas.
+from typing import Callable, Dict
+
+import json
+import time
+import argparse
+import tracemalloc
+from datetime import datetime
+
+# Librerías Internas.
+from app import create_app
+from db import db
+from models import ProblemModel, ModelModel, VersionModel
+from schemas import PlainVersionSchema
+
+
+def seed(rows: int) -> None:
+    """Función que completa la tabla de versiones hasta 'rows' registros.
+
+    Args:
+    ----------
+    rows: int.
+        Cantidad de versiones deseada."""
+
+    missing = rows - VersionModel.query.count()
+
+    if missing <= 0:
+        return
+
+    model = ModelModel.query.first()
+
+    if model is None:
+        now = datetime.now()
+        problem = ProblemModel(name = "bench-export", type = "regression", owner_team = "bench", owner = "bench",
+                               repository = "https://github.com/org/bench-export", description = "Benchmark.",
+                               documentation = "https://docs.org/bench-export", execution = "batch",
+                               created_at = now, updated_at = now)
+        model = ModelModel(problem = problem, frequency = "daily", days = "01", time = "05:00",
+                           created_at = now, updated_at = now)
+        db.session.add(model)
+        db.session.commit()
+
+    now = datetime.now()
+
+    for start in range(0, missing, 10000):
+        db.session.execute(VersionModel.__table__.insert(),
+                           [{"model_id": model.id, "version": "1", "status": "DEV",
+                             "metrics": {"train": 0.9, "validation": 0.8}, "semantic_version": "1.0.0",
+                             "created_at": now, "updated_at": now}
+                            for _ in range(min(10000, missing - start))])
+
+    db.session.commit()
+
+def measure(fn: Callable[[], int]) -> Dict[str, float]:
+    """Función que mide el tiempo y el pico de memoria de una exportación.
+
+    Args:
+    ----------
+    fn: Callable[[], int].
+        Exportación; devuelve la cantidad de bytes producidos.
+
+    Returns:
+    ----------
+    Dict[str, float].
+        Bytes, segundos y pico de memoria en MB."""
+
+    db.session.expunge_all()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    size = fn()
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"bytes": size, "seconds": round(elapsed, 3), "peak_mb": round(peak / 2 ** 20, 1)}
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--rows", type = int, default = 200000)
+    args = parser.parse_args()
+
+    app = create_app()
+
+    with app.app_context():
+        db.create_all()
+        seed(args.rows)
+
+        schema = PlainVersionSchema(many = True)
+
+        def in_memory() -> int:
+            return len(json.dumps(schema.dump(VersionModel.query.order_by(VersionModel.id).all())))
+
+        print("lista en memoria:", measure(in_memory))
+
+    client = app.test_client()
+
+    for export_format in ["ndjson", "json"]:
+        def streamed() -> int:
+            response = client.get(f"/version/export?format={export_format}", buffered = False)
+            size = sum(len(chunk) for chunk in response.response)
+            response.close()
+            return size
+
+        with app.app_context():
+            print(f"exportación {export_format}:", measure(streamed))
+
+
+if __name__ == "__main__":
+    main()
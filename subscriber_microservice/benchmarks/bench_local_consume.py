@@ -0,0 +1,86 @@
+"""Benchmark de consumo desde el broker local hasta la base de datos, sin GCP.
+
+Vacía el archivo LOCAL_BROKER_PATH llenado por 'benchmarks.bench_local_publish'
+del publicador y reporta mensajes por segundo y la latencia extremo a extremo
+(desde la publicación hasta la confirmación). Se ejecuta desde la carpeta del
+servicio:
+
+    PUBSUB_TRANSPORT=local LOCAL_BROKER_PATH=/tmp/broker.db DATABASE_URL=sqlite:////tmp/bench.db \\
+        python -m benchmarks.bench_local_consume"""
+
+# Librerías Externas.
+from typing import Any, Dict, List
+
+import time
+import argparse
+import contextlib
+import io
+from concurrent.futures import Future
+
+# Librerías Internas.
+import subscriber
+from db import db
+
+
+def run(max_idle_polls: int) -> Dict[str, float]:
+    """Función que procesa mensajes hasta que el broker queda vacío.
+
+    Args:
+    ----------
+    max_idle_polls: int.
+        Lecturas vacías consecutivas tras las cuales se termina la corrida.
+
+    Returns:
+    ----------
+    Dict[str, float].
+        Resultados de la corrida."""
+
+    latencies: List[float] = []
+    handle_message = subscriber.handle_message
+
+    def timed_handle_message(received_message: Any, future: Future) -> bool:
+        processed = handle_message(received_message, future)
+
+        if processed:
+            latencies.append(time.time() - received_message.message.publish_time)
+
+        return processed
+
+    subscriber.handle_message = timed_handle_message
+
+    with subscriber.app.app_context():
+        db.create_all()
+
+    idle_polls = 0
+    start = time.perf_counter()
+
+    # Se silencian los 'print' por mensaje para no medir la escritura en consola.
+    with contextlib.redirect_stdout(io.StringIO()):
+        while idle_polls < max_idle_polls:
+            processed = len(latencies)
+            subscriber.process_msg()
+            idle_polls = idle_polls + 1 if len(latencies) == processed else 0
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    if not latencies:
+        return {"messages": 0}
+
+    return {"messages": len(latencies), "seconds": round(elapsed, 3),
+            "messages_per_second": round(len(latencies) / elapsed, 1),
+            "latency_p50_ms": round(latencies[len(latencies) // 2] * 1000, 1),
+            "latency_p95_ms": round(latencies[int(len(latencies) * 0.95)] * 1000, 1)}
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--max-idle-polls", type = int, default = 3)
+    args = parser.parse_args()
+
+    print(run(args.max_idle_polls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Benchmark de consumo sostenido desde el broker local: compara el ciclo de
+lecturas de 'process_msg' (10 mensajes por lectura, esperando a que termine
+cada lote) contra el streaming pull de 'consume', con el control de flujo y
+las particiones de la configuración.
+
+Cada modo llena el broker con '--messages' creaciones de problemas y los
+consume hasta vaciarlo. Se reportan los mensajes por segundo de la corrida y
+los percentiles de los mensajes por segundo de cada ventana de un segundo. Se
+ejecuta desde la carpeta del servicio:
+
+    PUBSUB_TRANSPORT=local LOCAL_BROKER_PATH=/tmp/stream-broker.db DATABASE_URL=sqlite:////tmp/stream.db \\
+        python -m benchmarks.bench_streaming_consume --messages 5000"""
+
+# Librerías Externas.
+from typing import Any, Dict, List
+
+import io
+import time
+import uuid
+import argparse
+import threading
+import contextlib
+from datetime import datetime
+from concurrent.futures import Future
+
+# Librerías Internas.
+import subscriber
+from config import Config
+from workers.codec import encode_envelope
+
+
+def seed(messages: int, tag: str) -> None:
+    """Función que publica en el broker local creaciones de problemas.
+
+    Args:
+    ----------
+    messages: int.
+        Cantidad de mensajes.
+
+    tag: str.
+        Prefijo de los nombres, para no repetirlos entre corridas."""
+
+    broker = subscriber.transport.broker
+
+    for position in range(messages):
+        name = f"{tag}-{position}"
+        msg = {"request": {"name": name, "type": "classification", "owner_team": "bench", "owner": "bench",
+                           "repository": f"https://github.com/org/{name}", "description": "Benchmark.",
+                           "documentation": f"https://docs.org/{name}", "execution": "batch"},
+               "ids": {},
+               "metadata": {"table": "problems", "action": "POST", "timestamp": datetime.utcnow().isoformat(),
+                            "request_id": uuid.uuid4().hex, "ordering_key": ""}}
+
+        data, attributes = encode_envelope(msg)
+        broker.publish(data, attributes)
+
+def summarize(timestamps: List[float], start: float) -> Dict[str, Any]:
+    """Función que resume una corrida.
+
+    Args:
+    ----------
+    timestamps: List[float].
+        Instantes en que se aplicó cada mensaje.
+
+    start: float.
+        Instante de inicio de la corrida.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Resultados de la corrida."""
+
+    if not timestamps:
+        return {"messages": 0}
+
+    elapsed = max(timestamps) - start
+    windows: Dict[int, int] = {}
+
+    for timestamp in timestamps:
+        windows[int(timestamp - start)] = windows.get(int(timestamp - start), 0) + 1
+
+    # La última ventana suele estar incompleta, así que no se cuenta si hay otras.
+    per_second = sorted(list(windows.values())[:-1] or list(windows.values()))
+
+    return {"messages": len(timestamps), "seconds": round(elapsed, 3),
+            "messages_per_second": round(len(timestamps) / elapsed, 1),
+            "window_p50": per_second[len(per_second) // 2], "window_min": per_second[0]}
+
+def run_pull(messages: int, max_idle_polls: int) -> Dict[str, Any]:
+    """Función que consume con lecturas sucesivas de 'process_msg' hasta vaciar el broker.
+
+    Args:
+    ----------
+    messages: int.
+        Cantidad de mensajes.
+
+    max_idle_polls: int.
+        Lecturas vacías consecutivas tras las cuales se termina la corrida.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Resultados de la corrida."""
+
+    seed(messages, f"bench-pull-{uuid.uuid4().hex[:8]}")
+
+    timestamps: List[float] = []
+    handle_message = subscriber.handle_message
+
+    def timed_handle_message(received_message: Any, future: Future) -> bool:
+        processed = handle_message(received_message, future)
+
+        if processed:
+            timestamps.append(time.perf_counter())
+
+        return processed
+
+    subscriber.handle_message = timed_handle_message
+    idle_polls = 0
+    start = time.perf_counter()
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            while idle_polls < max_idle_polls and len(timestamps) < messages:
+                processed = len(timestamps)
+                subscriber.process_msg()
+                idle_polls = idle_polls + 1 if len(timestamps) == processed else 0
+    finally:
+        subscriber.handle_message = handle_message
+
+    return {**summarize(timestamps, start), "acks_per_rpc": subscriber.acker.stats()["acks_per_rpc"]}
+
+def run_streaming(messages: int, timeout: float) -> Dict[str, Any]:
+    """Función que consume con el streaming pull hasta aplicar todos los mensajes.
+
+    Args:
+    ----------
+    messages: int.
+        Cantidad de mensajes.
+
+    timeout: float.
+        Segundos máximos de la corrida.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Resultados de la corrida."""
+
+    seed(messages, f"bench-streaming-{uuid.uuid4().hex[:8]}")
+
+    timestamps: List[float] = []
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def on_message(message: Any) -> None:
+        subscriber.on_message(message)
+
+        if not message.nacked:
+            with lock:
+                timestamps.append(time.perf_counter())
+
+                if len(timestamps) >= messages:
+                    done.set()
+
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        streaming_pull = subscriber.transport.subscribe(on_message,
+                                                       max_messages = Config.SUBSCRIBER_FLOW_MAX_MESSAGES,
+                                                       max_bytes = Config.SUBSCRIBER_FLOW_MAX_BYTES,
+                                                       max_workers = Config.SUBSCRIBER_MAX_WORKERS)
+        done.wait(timeout)
+        streaming_pull.cancel()
+        streaming_pull.result()
+
+    return {**summarize(timestamps, start), "acks_per_rpc": streaming_pull.acker.stats()["acks_per_rpc"]}
+
+def main() -> None:
+    """Función principal del benchmark."""
+
+    parser = argparse.ArgumentParser(description = __doc__)
+    parser.add_argument("--messages", type = int, default = 5000)
+    parser.add_argument("--max-idle-polls", type = int, default = 3)
+    parser.add_argument("--timeout", type = float, default = 600)
+    args = parser.parse_args()
+
+    print(f"process_msg, {Config.SUBSCRIBER_PARTITIONS} particiones:", run_pull(args.messages, args.max_idle_polls))
+    print(f"streaming pull, {Config.SUBSCRIBER_PARTITIONS} particiones, "
+          f"{Config.SUBSCRIBER_FLOW_MAX_MESSAGES} mensajes en vuelo:", run_streaming(args.messages, args.timeout))
+    print("particiones:", subscriber.executor.stats()["partitions"])
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,56 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///data.db")
 
+    # Puerto de la API de lectura ('wsgi.py'). Cloud Run lo entrega en PORT; en local el
+    # publicador la busca por defecto en http://localhost:8081 (QUERY_API_URL).
+    READ_API_PORT = int(os.getenv("PORT", "8081"))
+
+    # Transporte de mensajes: 'pubsub' (Google Cloud Pub/Sub) o 'local' (broker SQLite en
+    # LOCAL_BROKER_PATH, compartido con el publicador para pruebas sin GCP).
+    PUBSUB_TRANSPORT = os.getenv("PUBSUB_TRANSPORT", "pubsub")
+    LOCAL_BROKER_PATH = os.getenv("LOCAL_BROKER_PATH", "broker.db")
+
+    # Particiones (hilos) que aplican los mensajes; cada una es dueña de un rango del hash de la
+    # entidad raíz, así que los mensajes de una misma entidad se aplican en orden.
+    SUBSCRIBER_PARTITIONS = int(os.getenv("SUBSCRIBER_PARTITIONS", "4"))
+
+    # Hilos que reciben los mensajes del streaming pull y esperan a que su partición los aplique.
+    SUBSCRIBER_MAX_WORKERS = int(os.getenv("SUBSCRIBER_MAX_WORKERS", "16"))
+
+    # Aplicación por lotes: cada partición aplica hasta SUBSCRIBER_BATCH_MAX_MESSAGES mensajes en una
+    # sola transacción, con un SAVEPOINT por mensaje para que uno que falla no revierta los demás.
+    SUBSCRIBER_BATCH_APPLY = os.getenv("SUBSCRIBER_BATCH_APPLY", "false").lower() == "true"
+    SUBSCRIBER_BATCH_MAX_MESSAGES = int(os.getenv("SUBSCRIBER_BATCH_MAX_MESSAGES", "100"))
+
+    # Modo del suscriptor: 'streaming' (streaming pull continuo) o 'pull' (una sola lectura de mensajes).
+    SUBSCRIBER_MODE = os.getenv("SUBSCRIBER_MODE", "streaming")
+
+    # Control de flujo del streaming pull: mensajes y bytes máximos entregados sin confirmar.
+    SUBSCRIBER_FLOW_MAX_MESSAGES = int(os.getenv("SUBSCRIBER_FLOW_MAX_MESSAGES", "100"))
+    SUBSCRIBER_FLOW_MAX_BYTES = int(os.getenv("SUBSCRIBER_FLOW_MAX_BYTES", str(10 * 1024 * 1024)))
+
+    # Segundos máximos de espera de los mensajes en proceso al apagar el suscriptor (SIGTERM).
+    SUBSCRIBER_DRAIN_TIMEOUT = float(os.getenv("SUBSCRIBER_DRAIN_TIMEOUT", "30"))
+
+    # Confirmaciones agrupadas: mensajes máximos por llamada y segundos máximos de espera de una confirmación.
+    ACK_BATCH_MAX_MESSAGES = int(os.getenv("ACK_BATCH_MAX_MESSAGES", "100"))
+    ACK_BATCH_MAX_LATENCY = float(os.getenv("ACK_BATCH_MAX_LATENCY", "0.05"))
+
+    # Mensajes que fallan: intentos tras los que se ponen en cuarentena (tabla 'failed_messages'),
+    # segundos de espera tras el primer intento (se duplican en cada uno, hasta FAILURE_BACKOFF_MAX)
+    # y mensajes máximos cuyos intentos se cuentan en memoria si Pub/Sub no informa 'delivery_attempt'.
+    FAILURE_MAX_ATTEMPTS = int(os.getenv("FAILURE_MAX_ATTEMPTS", "5"))
+    FAILURE_BACKOFF_BASE = float(os.getenv("FAILURE_BACKOFF_BASE", "10"))
+    FAILURE_BACKOFF_MAX = float(os.getenv("FAILURE_BACKOFF_MAX", "600"))
+    FAILURE_TRACKED_MESSAGES = int(os.getenv("FAILURE_TRACKED_MESSAGES", "10000"))
+
+    # Paginación por llave (keyset) de los listados: registros por página por defecto y máximo.
+    PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "100"))
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "1000"))
+
+    # Registros que se leen por vuelta del cursor del servidor (yield_per) en las exportaciones.
+    EXPORT_YIELD_PER = int(os.getenv("EXPORT_YIELD_PER", "1000"))
+
     # Una vez cree la instancia de CloudSQL debe proceder a crear una base de datos y un usuario. 
     # También, debe configurar la instancia de CloudSQL para que reciba tráfico desde nuestra IP pública.
     # Una vez tenga la IP configurada en CloudSQL y haya creado una base de datos y un usuario,
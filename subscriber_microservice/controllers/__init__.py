@@ -4,4 +4,6 @@
 from controllers.user import UserController
 from controllers.model import ModelController
 from controllers.problem import ProblemController
-from controllers.version import VersionController
\ No newline at end of file
+from controllers.version import VersionController
+from controllers.change_counter import ChangeCounterController
+from controllers.failed_message import FailedMessageController
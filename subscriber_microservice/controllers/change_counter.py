@@ -0,0 +1,184 @@
+"""Módulo que contiene los controladores de los contadores de cambios por tabla."""
+
+# Librerías Externas.
+from typing import Any, Dict, Optional, Set
+
+import itertools
+import threading
+
+from sqlalchemy import Table, event, func, insert, update
+from sqlalchemy.engine import Connection
+from flask_sqlalchemy.session import Session
+
+# Librerías Internas.
+from db import db
+from models import ChangeCounterModel
+
+
+class ChangeCounterController:
+    """Clase que encapsula los controladores de los contadores de cambios.
+
+    Los contadores permiten calcular el ETag de un listado o de un registro con
+    una sola consulta por llave primaria, sin cargar las filas.
+
+    Cada hilo incrementa siempre la misma franja, así que las particiones del
+    suscriptor no se bloquean entre sí por el contador de una tabla mientras
+    sus lotes están abiertos. Las franjas se crean junto con la tabla."""
+
+    TRACKED_TABLES = {"problems", "models", "versions"}
+
+    STRIPES = 16
+
+    _next_stripe = itertools.count()
+    _local = threading.local()
+
+    # Tablas cuyos registros se eliminan en cascada al eliminar un registro de la tabla.
+    DEPENDENTS = {"problems": ["models", "versions"],
+                  "models": ["versions"]}
+
+    @staticmethod
+    def get_version(table: str) -> int:
+        """Método que contiene el controlador para obtener el contador de una tabla.
+
+        Args:
+        ----------
+        table: str.
+            Nombre de la tabla.
+
+        Returns:
+        ----------
+        int.
+            Contador de cambios; 0 si la tabla no ha tenido escrituras."""
+
+        version = (db.session.query(func.sum(ChangeCounterModel.version))
+                   .filter_by(table_name = table).scalar())
+        return int(version or 0)
+
+    @classmethod
+    def stripe(cls) -> int:
+        """Método que obtiene la franja del hilo actual. Se asignan en orden de
+        llegada, para que hilos distintos usen franjas distintas.
+
+        Returns:
+        ----------
+        int.
+            Franja del hilo."""
+
+        stripe = getattr(cls._local, "stripe", None)
+
+        if stripe is None:
+            stripe = cls._local.stripe = next(cls._next_stripe) % cls.STRIPES
+
+        return stripe
+
+    @classmethod
+    def etag_data(cls, table: str, key: Optional[Any] = None) -> Dict[str, Any]:
+        """Método que construye los datos del ETag de un listado o de un registro.
+
+        Args:
+        ----------
+        table: str.
+            Nombre de la tabla.
+
+        key: Optional[Any].
+            Lo que distingue la respuesta dentro de la tabla: el ID del registro
+            (junto con los de sus padres en la ruta) o los parámetros de paginación.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Datos a partir de los que se calcula el ETag."""
+
+        return {"table": table, "version": cls.get_version(table), "key": key}
+
+    @classmethod
+    def changed_tables(cls, session: Session) -> Set[str]:
+        """Método que obtiene las tablas afectadas por los cambios de una sesión.
+
+        Args:
+        ----------
+        session: Session.
+            Sesión con cambios pendientes de confirmar.
+
+        Returns:
+        ----------
+        Set[str].
+            Tablas afectadas."""
+
+        tables = {getattr(instance, "__tablename__", None) for instance in session.new}
+        tables.update(getattr(instance, "__tablename__", None) for instance in session.dirty
+                      if session.is_modified(instance))
+
+        for instance in session.deleted:
+            table = getattr(instance, "__tablename__", None)
+            tables.add(table)
+            tables.update(cls.DEPENDENTS.get(table, []))
+
+        return tables & cls.TRACKED_TABLES
+
+    @classmethod
+    def increment(cls, session: Session, tables: Set[str]) -> None:
+        """Método que incrementa los contadores de las tablas dentro de la transacción de la sesión.
+
+        Args:
+        ----------
+        session: Session.
+            Sesión en curso.
+
+        tables: Set[str].
+            Tablas a incrementar."""
+
+        connection = session.connection()
+        stripe = cls.stripe()
+
+        for table in sorted(tables):
+            connection.execute(update(ChangeCounterModel)
+                               .where(ChangeCounterModel.table_name == table, ChangeCounterModel.stripe == stripe)
+                               .values(version = ChangeCounterModel.version + 1))
+
+    @classmethod
+    def seed(cls, connection: Connection) -> None:
+        """Método que crea las franjas de los contadores en cero.
+
+        Args:
+        ----------
+        connection: Connection.
+            Conexión con la que se creó la tabla."""
+
+        connection.execute(insert(ChangeCounterModel), [{"table_name": table, "stripe": stripe, "version": 0}
+                                                        for table in sorted(cls.TRACKED_TABLES)
+                                                        for stripe in range(cls.STRIPES)])
+
+
+@event.listens_for(Session, "after_flush")
+def increment_counters(session: Session, flush_context: Any) -> None:
+    """Función que incrementa los contadores de las tablas escritas, en la
+    misma transacción que la escritura.
+
+    Args:
+    ----------
+    session: Session.
+        Sesión en curso.
+
+    flush_context: Any.
+        Contexto del flush."""
+
+    tables = ChangeCounterController.changed_tables(session)
+
+    if tables:
+        ChangeCounterController.increment(session, tables)
+
+@event.listens_for(ChangeCounterModel.__table__, "after_create")
+def seed_counters(table: Table, connection: Connection, **kwargs: Any) -> None:
+    """Función que crea las franjas de los contadores al crear la tabla con
+    'create_all', para que las escrituras solo tengan que actualizarlas.
+
+    Args:
+    ----------
+    table: Table.
+        Tabla de los contadores.
+
+    connection: Connection.
+        Conexión con la que se creó la tabla."""
+
+    ChangeCounterController.seed(connection)
@@ -0,0 +1,166 @@
+"""Módulo que contiene los controladores de los mensajes en cuarentena."""
+
+# Librerías Externas.
+from typing import Any, Dict, List, Optional, Tuple
+
+from datetime import datetime
+
+from flask_smorest import abort
+
+from sqlalchemy.orm import defer
+from sqlalchemy.exc import SQLAlchemyError
+
+# Librerías Internas.
+from db import db
+from config import Config
+from models import FailedMessageModel
+from controllers.pagination import paginate
+from controllers.fieldsets import load_options
+from workers.codec import decompress_payload, decode_envelope
+
+
+class FailedMessageController:
+    """Clase que encapsula los controladores de los mensajes en cuarentena."""
+
+    @staticmethod
+    def get_all_failed_messages(cursor: Optional[str] = None, limit: int = Config.PAGE_SIZE_DEFAULT,
+                                fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Método que contiene el controlador para obtener una página de mensajes
+        en cuarentena, ordenada por 'id' y paginada por llave. El cuerpo de los
+        mensajes no se lee.
+
+        Args:
+        ----------
+        cursor: Optional[str].
+            Cursor de la página anterior; si es None se obtiene la primera página.
+
+        limit: int.
+            Cantidad máxima de registros de la página.
+
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Registros de la página y cursor de la siguiente."""
+
+        query = FailedMessageModel.query.options(defer(FailedMessageModel.data),
+                                                 *load_options(FailedMessageModel, fields))
+
+        return paginate(query, cursor, limit)
+
+    @staticmethod
+    def quarantine_message(message_id: str, data: bytes, attributes: Dict[str, str], ordering_key: str,
+                           attempts: int, error: str) -> FailedMessageModel:
+        """Método que contiene el controlador para poner un mensaje en cuarentena.
+
+        Args:
+        ----------
+        message_id: str.
+            ID del mensaje en Pub/Sub.
+
+        data: bytes.
+            Cuerpo del mensaje tal como llegó.
+
+        attributes: Dict[str, str].
+            Atributos del mensaje.
+
+        ordering_key: str.
+            Llave de orden del mensaje.
+
+        attempts: int.
+            Intentos de entrega del mensaje.
+
+        error: str.
+            Último error al aplicar el mensaje.
+
+        Returns:
+        ----------
+        FailedMessageModel.
+            Registro creado en la base de datos."""
+
+        # La tabla, la acción y el ID de la petición solo facilitan la búsqueda; el mensaje
+        # puede estar en cuarentena justamente porque no se pudo decodificar.
+        try:
+            metadata = decode_envelope(decompress_payload(data, attributes), attributes)["metadata"] or {}
+        except Exception:
+            metadata = {}
+
+        failed_message = FailedMessageModel(message_id = message_id, data = data, attributes = attributes,
+                                            ordering_key = ordering_key or "", table_name = metadata.get("table"),
+                                            action = metadata.get("action"), request_id = metadata.get("request_id"),
+                                            error = error, attempts = attempts, failed_at = datetime.now())
+
+        try:
+            db.session.add(failed_message)
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            abort(500, message = "Error al tratar de registrar el mensaje en cuarentena.")
+
+        return failed_message
+
+    @staticmethod
+    def get_failed_messages_to_replay(ids: Optional[List[int]] = None, limit: int = 100) -> List[FailedMessageModel]:
+        """Método que contiene el controlador para obtener los mensajes en
+        cuarentena a volver a aplicar, en el orden en que entraron.
+
+        Args:
+        ----------
+        ids: Optional[List[int]].
+            IDs de los mensajes; si es None se toman los más antiguos.
+
+        limit: int.
+            Cantidad máxima de mensajes.
+
+        Returns:
+        ----------
+        List[FailedMessageModel].
+            Registros de la base de datos."""
+
+        query = FailedMessageModel.query
+
+        if ids is not None:
+            query = query.filter(FailedMessageModel.id.in_(ids))
+
+        return query.order_by(FailedMessageModel.id).limit(limit).all()
+
+    @staticmethod
+    def release_failed_message(failed_message: FailedMessageModel) -> None:
+        """Método que contiene el controlador para sacar de la cuarentena un
+        mensaje que ya se aplicó.
+
+        Args:
+        ----------
+        failed_message: FailedMessageModel.
+            Registro a eliminar."""
+
+        try:
+            db.session.delete(failed_message)
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            abort(500, message = "Error al tratar de sacar el mensaje de la cuarentena.")
+
+    @staticmethod
+    def record_replay_failure(failed_message: FailedMessageModel, error: str) -> None:
+        """Método que contiene el controlador para registrar que un mensaje en
+        cuarentena volvió a fallar.
+
+        Args:
+        ----------
+        failed_message: FailedMessageModel.
+            Registro del mensaje.
+
+        error: str.
+            Nuevo error al aplicar el mensaje."""
+
+        failed_message.error = error
+        failed_message.replay_attempts += 1
+
+        try:
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            abort(500, message = "Error al tratar de actualizar el mensaje en cuarentena.")
@@ -0,0 +1,107 @@
+"""Módulo que contiene la selección de campos (?fields=) de las lecturas."""
+
+# Librerías Externas.
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from flask_smorest import abort
+from marshmallow import Schema
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+def parse_fields(fields: Optional[str], schema: Type[Schema]) -> Optional[Tuple[str, ...]]:
+    """Función que interpreta el parámetro 'fields', una lista de campos
+    separados por comas. El campo 'id' siempre se incluye.
+
+    Args:
+    ----------
+    fields: Optional[str].
+        Parámetro recibido; si es None se devuelven todos los campos.
+
+    schema: Type[Schema].
+        Esquema con el que se serializa la respuesta.
+
+    Returns:
+    ----------
+    Optional[Tuple[str, ...]].
+        Campos solicitados, o None si se solicitan todos."""
+
+    if fields is None:
+        return None
+
+    names = tuple(dict.fromkeys(["id"] + [name.strip() for name in fields.split(",") if name.strip()]))
+    unknown = [name for name in names if name not in schema._declared_fields]
+
+    if unknown:
+        abort(400, message = f"Campos desconocidos: {', '.join(unknown)}.")
+
+    return names
+
+def load_options(model: Any, fields: Optional[Tuple[str, ...]], required: Tuple[str, ...] = ()) -> List[LoaderOption]:
+    """Función que construye las opciones para que la consulta solo lea las
+    columnas de los campos solicitados.
+
+    Args:
+    ----------
+    model: Any.
+        Modelo consultado.
+
+    fields: Optional[Tuple[str, ...]].
+        Campos solicitados; si es None se leen todas las columnas.
+
+    required: Tuple[str, ...].
+        Campos que el controlador necesita aunque no se hayan solicitado.
+
+    Returns:
+    ----------
+    List[LoaderOption].
+        Opciones de la consulta."""
+
+    if fields is None:
+        return []
+
+    columns = model.__table__.columns
+    return [load_only(*[getattr(model, name) for name in (*fields, *required) if name in columns])]
+
+def select_fields(record: Any, fields: Optional[Tuple[str, ...]]) -> Any:
+    """Función que reduce un registro a los campos solicitados, sin tocar los
+    atributos que no se leyeron. El esquema omite los campos que no están.
+
+    Args:
+    ----------
+    record: Any.
+        Registro de la base de datos.
+
+    fields: Optional[Tuple[str, ...]].
+        Campos solicitados; si es None se devuelve el registro completo.
+
+    Returns:
+    ----------
+    Any.
+        Registro o diccionario con los campos solicitados."""
+
+    if fields is None:
+        return record
+
+    return {name: getattr(record, name) for name in fields}
+
+def select_page_fields(page: Dict[str, Any], fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Función que reduce los registros de una página a los campos solicitados.
+
+    Args:
+    ----------
+    page: Dict[str, Any].
+        Página ('items' y 'next_cursor').
+
+    fields: Optional[Tuple[str, ...]].
+        Campos solicitados.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Página reducida."""
+
+    if fields is None:
+        return page
+
+    return {**page, "items": [select_fields(record, fields) for record in page["items"]]}
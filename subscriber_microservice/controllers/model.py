@@ -1,7 +1,7 @@
 """Módulo que contiene los controladores para las vistas relacionadas con 'modelos'."""
 
 # Librerías Externas.
-from typing import Dict, List
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from datetime import datetime
 
@@ -11,23 +11,55 @@ from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 # Librerías Internas.
 from db import db
+from config import Config
 from models import ModelModel
+from controllers.pagination import paginate, stream
+from controllers.fieldsets import load_options
 
 
 class ModelController:
     """Clase que encapsula los controladores de modelos."""
 
     @staticmethod
-    def get_all_models() -> List[ModelModel]:
-        """Método que contiene el controlador para obtener todos los modelos.
+    def get_all_models(cursor: Optional[str] = None, limit: int = Config.PAGE_SIZE_DEFAULT,
+                       fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Método que contiene el controlador para obtener una página de modelos,
+        ordenada por 'id' y paginada por llave.
         
+        Args:
+        ----------
+        cursor: Optional[str].
+            Cursor de la página anterior; si es None se obtiene la primera página.
+
+        limit: int.
+            Cantidad máxima de registros de la página.
+
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
+
         Returns:
         ----------
-        List[ModelModel].
-            Lista que contiene todos los registros."""
+        Dict[str, Any].
+            Registros de la página y cursor de la siguiente."""
 
-        problems = ModelModel.query.all()
-        return problems
+        return paginate(ModelModel.query.options(*load_options(ModelModel, fields)), cursor, limit)
+    
+    @staticmethod
+    def stream_all_models(fields: Optional[Tuple[str, ...]] = None) -> Iterator[ModelModel]:
+        """Método que contiene el controlador para recorrer todos los modelos
+        con un cursor del servidor, para exportarlos sin cargarlos en memoria.
+        
+        Args:
+        ----------
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
+
+        Returns:
+        ----------
+        Iterator[ModelModel].
+            Registros de la base de datos."""
+
+        return stream(ModelModel, Config.EXPORT_YIELD_PER, load_options(ModelModel, fields))
     
     @staticmethod
     def post_model(problem_id: str, model_data: Dict[str, str]) -> ModelModel:
@@ -56,7 +88,7 @@ class ModelController:
         return model
     
     @staticmethod
-    def get_model(problem_id: str, model_id: str) -> ModelModel:
+    def get_model(problem_id: str, model_id: str, fields: Optional[Tuple[str, ...]] = None) -> ModelModel:
         """Método que contiene el controlador para obtener un modelo.
         
         Args:
@@ -66,17 +98,20 @@ class ModelController:
         
         model_id: str.
             ID del modelo a buscar en la base de datos.
+
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
         
         Returns:
         ----------
         ModelModel.
             Registro de la base de datos."""
         
-        model = ModelModel.query.filter(ModelModel.id == model_id, ModelModel.problem_id == problem_id).first()
+        model = ModelModel.query.options(*load_options(ModelModel, fields)).filter(ModelModel.id == model_id, ModelModel.problem_id == problem_id).first()
 
         if model:
             return model
-        return {"message": f"No existe un registro para el modelo {model_id} asociado al problema {problem_id}."}
+        abort(404, message = f"No existe un registro para el modelo {model_id} asociado al problema {problem_id}.")
 
     @staticmethod
     def delete_model(problem_id: str, model_id: str) -> ModelModel:
@@ -106,8 +141,8 @@ class ModelController:
         return {"message": "Modelo eliminado."}
     
     @staticmethod
-    def update_problem(problem_id: str, model_data: Dict[str, str]) -> ModelModel:
-        """Método que contiene el controlador para actualizar un problema.
+    def update_model(problem_id: str, model_id: str, model_data: Dict[str, str]) -> ModelModel:
+        """Método que contiene el controlador para actualizar un modelo.
         
         Args:
         ----------
@@ -116,13 +151,16 @@ class ModelController:
         
         model_id: str.
             ID del modelo a buscar en la base de datos.
+
+        model_data: Dict[str, str].
+            Campos a actualizar sobre el registro.
         
         Returns:
         ----------
-        ProblemModel.
+        ModelModel.
             Registro actualizado en la base de datos."""
 
-        model = ModelModel.query.get_or_404(problem_id)
+        model = ModelModel.query.filter(ModelModel.id == model_id, ModelModel.problem_id == problem_id).first_or_404()
 
         for key, value in model_data.items():
             if hasattr(model, key):
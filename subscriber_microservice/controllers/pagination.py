@@ -0,0 +1,119 @@
+"""Módulo que contiene la paginación por llave (keyset) de los listados."""
+
+# Librerías Externas.
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+import json
+import base64
+import binascii
+
+from flask_smorest import abort
+from sqlalchemy import select
+from sqlalchemy.orm.interfaces import LoaderOption
+from flask_sqlalchemy.query import Query
+
+# Librerías Internas.
+from db import db
+
+
+def encode_cursor(last_id: int) -> str:
+    """Función que construye el cursor opaco que apunta después de un registro.
+
+    Args:
+    ----------
+    last_id: int.
+        ID del último registro de la página.
+
+    Returns:
+    ----------
+    str.
+        Cursor."""
+
+    return base64.urlsafe_b64encode(json.dumps({"after": last_id}).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Función que obtiene el ID a partir del cual continúa un listado.
+
+    Args:
+    ----------
+    cursor: Optional[str].
+        Cursor recibido; si es None el listado empieza desde el principio.
+
+    Returns:
+    ----------
+    Optional[int].
+        ID del último registro de la página anterior."""
+
+    if cursor is None:
+        return None
+
+    try:
+        after = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))["after"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        after = None
+
+    if type(after) is not int:
+        abort(400, message = "El cursor de paginación no es válido.")
+
+    return after
+
+def paginate(query: Query, cursor: Optional[str], limit: int) -> Dict[str, Any]:
+    """Función que obtiene una página de un listado ordenado por 'id'. Solo se
+    cargan los registros de la página, sin importar el tamaño de la tabla.
+
+    Args:
+    ----------
+    query: Query.
+        Consulta del modelo a listar.
+
+    cursor: Optional[str].
+        Cursor de la página anterior.
+
+    limit: int.
+        Cantidad máxima de registros de la página.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Registros de la página y cursor de la siguiente ('next_cursor'), que es
+        None si no hay más registros."""
+
+    model = query.column_descriptions[0]["entity"]
+    after = decode_cursor(cursor)
+
+    if after is not None:
+        query = query.filter(model.id > after)
+
+    records = query.order_by(model.id).limit(limit + 1).all()
+
+    if len(records) <= limit:
+        return {"items": records, "next_cursor": None}
+
+    records = records[:limit]
+
+    return {"items": records, "next_cursor": encode_cursor(records[-1].id)}
+
+def stream(model: Any, batch_size: int, options: Sequence[LoaderOption] = ()) -> Iterator[Any]:
+    """Función que recorre todos los registros de un modelo ordenados por 'id'
+    con un cursor del servidor: se leen de a 'batch_size' y los ya entregados
+    se pueden liberar, sin cargar la tabla completa en memoria.
+
+    Args:
+    ----------
+    model: Any.
+        Modelo a recorrer.
+
+    batch_size: int.
+        Registros que se leen por vuelta del cursor.
+
+    options: Sequence[LoaderOption].
+        Opciones de la consulta, por ejemplo las columnas a leer.
+
+    Returns:
+    ----------
+    Iterator[Any].
+        Registros."""
+
+    statement = select(model).options(*options).order_by(model.id).execution_options(yield_per = batch_size)
+
+    return iter(db.session.execute(statement).scalars())
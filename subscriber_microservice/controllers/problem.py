@@ -1,7 +1,7 @@
 """Módulo que contiene los controladores para las vistas relacionadas con 'problemas'."""
 
 # Librerías Externas.
-from typing import Dict, List
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from datetime import datetime
 
@@ -11,23 +11,55 @@ from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 # Librerías Internas.
 from db import db
+from config import Config
 from models import ProblemModel
+from controllers.pagination import paginate, stream
+from controllers.fieldsets import load_options
 
 
 class ProblemController:
     """Clase que encapsula los controladores de problemas."""
 
     @staticmethod
-    def get_all_problems() -> List[ProblemModel]:
-        """Método que contiene el controlador para obtener todos los problemas.
+    def get_all_problems(cursor: Optional[str] = None, limit: int = Config.PAGE_SIZE_DEFAULT,
+                         fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Método que contiene el controlador para obtener una página de problemas,
+        ordenada por 'id' y paginada por llave.
         
+        Args:
+        ----------
+        cursor: Optional[str].
+            Cursor de la página anterior; si es None se obtiene la primera página.
+
+        limit: int.
+            Cantidad máxima de registros de la página.
+
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Registros de la página y cursor de la siguiente."""
+
+        return paginate(ProblemModel.query.options(*load_options(ProblemModel, fields)), cursor, limit)
+    
+    @staticmethod
+    def stream_all_problems(fields: Optional[Tuple[str, ...]] = None) -> Iterator[ProblemModel]:
+        """Método que contiene el controlador para recorrer todos los problemas
+        con un cursor del servidor, para exportarlos sin cargarlos en memoria.
+        
+        Args:
+        ----------
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
+
         Returns:
         ----------
-        List[ProblemModel].
-            Lista que contiene todos los registros."""
+        Iterator[ProblemModel].
+            Registros de la base de datos."""
 
-        problems = ProblemModel.query.all()
-        return problems
+        return stream(ProblemModel, Config.EXPORT_YIELD_PER, load_options(ProblemModel, fields))
     
     @staticmethod
     def post_problem(problem_data: Dict[str, str]) -> ProblemModel:
@@ -56,20 +88,23 @@ class ProblemController:
         return problem
     
     @staticmethod
-    def get_problem(problem_id: int) -> ProblemModel:
+    def get_problem(problem_id: int, fields: Optional[Tuple[str, ...]] = None) -> ProblemModel:
         """Método que contiene el controlador para obtener un problema.
         
         Args:
         ----------
         problem_id: int.
             ID del problema a buscar en la base de datos.
+
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
         
         Returns:
         ----------
         ProblemModel.
             Registro de la base de datos."""
         
-        problem = ProblemModel.query.get_or_404(problem_id)
+        problem = ProblemModel.query.options(*load_options(ProblemModel, fields)).get_or_404(problem_id)
         return problem
     
     @staticmethod
@@ -1,7 +1,7 @@
 """Módulo que contiene los controladores para las vistas relacionadas con 'versiones'."""
 
 # Librerías Externas.
-from typing import Dict, List
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from datetime import datetime
 
@@ -11,23 +11,55 @@ from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 # Librerías Internas.
 from db import db
+from config import Config
 from models import VersionModel
+from controllers.pagination import paginate, stream
+from controllers.fieldsets import load_options
 
 
 class VersionController:
     """Clase que encapsula los controladores de versión."""
 
     @staticmethod
-    def get_all_versions() -> List[VersionModel]:
-        """Método que contiene el controlador para obtener todas las versiones.
+    def get_all_versions(cursor: Optional[str] = None, limit: int = Config.PAGE_SIZE_DEFAULT,
+                         fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Método que contiene el controlador para obtener una página de versiones,
+        ordenada por 'id' y paginada por llave.
         
+        Args:
+        ----------
+        cursor: Optional[str].
+            Cursor de la página anterior; si es None se obtiene la primera página.
+
+        limit: int.
+            Cantidad máxima de registros de la página.
+
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Registros de la página y cursor de la siguiente."""
+
+        return paginate(VersionModel.query.options(*load_options(VersionModel, fields)), cursor, limit)
+    
+    @staticmethod
+    def stream_all_versions(fields: Optional[Tuple[str, ...]] = None) -> Iterator[VersionModel]:
+        """Método que contiene el controlador para recorrer todas las versiones
+        con un cursor del servidor, para exportarlas sin cargarlos en memoria.
+        
+        Args:
+        ----------
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
+
         Returns:
         ----------
-        List[VersionModel].
-            Lista que contiene todos los registros."""
+        Iterator[VersionModel].
+            Registros de la base de datos."""
 
-        versions = VersionModel.query.all()
-        return versions
+        return stream(VersionModel, Config.EXPORT_YIELD_PER, load_options(VersionModel, fields))
     
     @staticmethod
     def post_version(model_id: int, version_data: Dict[str, str]) -> VersionModel:
@@ -68,20 +100,25 @@ class VersionController:
         return version
     
     @staticmethod
-    def get_version(version_id: int) -> VersionModel:
+    def get_version(version_id: int, fields: Optional[Tuple[str, ...]] = None) -> VersionModel:
         """Método que contiene el controlador para obtener una versión.
         
         Args:
         ----------
         version_id: int.
             ID de la versión a buscar en la base de datos.
+
+        fields: Optional[Tuple[str, ...]].
+            Campos a leer; si es None se leen todos.
         
         Returns:
         ----------
         VersionModel.
             Registro de la base de datos."""
         
-        version = VersionModel.query.get_or_404(version_id)
+        # 'model_id' se lee siempre porque la vista valida que la versión pertenezca al modelo.
+        options = load_options(VersionModel, fields, required = ("model_id",))
+        version = VersionModel.query.options(*options).get_or_404(version_id)
         print(version)
         return version
     
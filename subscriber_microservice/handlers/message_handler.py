@@ -1,10 +1,15 @@
 """Módulo que contiene la forma de procesar un mensaje de Pub/Sub."""
 
 # Librerías Externas.
-from typing import Dict
+from typing import Any, Dict, List, Optional
+
+import inspect
 
 # Librerías Internas.
-from controllers import ProblemController, ModelController, VersionController
+from controllers import ProblemController, ModelController, VersionController, FailedMessageController
+from workers.codec import decompress_payload, decode_envelope
+from workers.batch import BatchTransaction
+from workers.failures import describe_error
 
 
 class MessageHandler:
@@ -14,11 +19,15 @@ class MessageHandler:
                             "PUT": ProblemController.update_problem,
                             "DELETE": ProblemController.delete_problem},
                "models": {"POST": ModelController.post_model,
-                          "PUT": ModelController.update_problem,
+                          "PUT": ModelController.update_model,
                           "DELETE": ModelController.delete_model},
                "versions": {"POST": VersionController.post_version,
                             "PUT": VersionController.update_version,
                             "DELETE": VersionController.delete_version}}
+
+    DATA_ARGUMENTS = {"problems": "problem_data",
+                      "models": "model_data",
+                      "versions": "version_data"}
     
     @classmethod
     def process_message(cls, request_data: Dict[str, str], request_ids: Dict[str, int], metadata: Dict[str, str]):
@@ -46,14 +55,61 @@ class MessageHandler:
 
         handler_func = cls.ACTIONS[table][action]
 
-        if table == "problem":
-            return handler_func(problem_data = request_data, 
-                                problem_id = request_ids["problem_id"])
+        # Cada controlador recibe solo los IDs y datos que declara en su firma.
+        arguments = {cls.DATA_ARGUMENTS[table]: request_data, **(request_ids or {})}
+        parameters = inspect.signature(handler_func).parameters
+
+        return handler_func(**{key: value for key, value in arguments.items() if key in parameters})
+
+    @classmethod
+    def replay_failed_messages(cls, ids: Optional[List[int]] = None, limit: int = 100) -> Dict[str, Any]:
+        """Método de clase que vuelve a aplicar mensajes en cuarentena, en el orden
+        en que entraron. Los que se aplican salen de la cuarentena en la misma
+        transacción; los que vuelven a fallar se quedan con el nuevo error.
+
+        Args:
+        ----------
+        ids: Optional[List[int]].
+            IDs de los mensajes a aplicar; si es None se toman los más antiguos.
+
+        limit: int.
+            Cantidad máxima de mensajes a aplicar.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            IDs de los mensajes aplicados y errores de los que fallaron."""
+
+        replayed, failed = [], []
+
+        # Todo el lote corre en una sola transacción y cada mensaje en su SAVEPOINT: aplicarlo y sacarlo
+        # de la cuarentena se confirman o se revierten juntos, así que un mensaje no puede quedar
+        # aplicado y todavía en cuarentena (y aplicarse dos veces en el siguiente intento).
+        with BatchTransaction() as tx:
+            # Todo acceso a la sesión va dentro de un SAVEPOINT del lote, también la consulta y
+            # los IDs: si la sesión abre el suyo por fuera, su 'commit' liberaría también el del lote.
+            with tx.savepoint():
+                failed_messages = [(failed_message.id, failed_message) for failed_message
+                                   in FailedMessageController.get_failed_messages_to_replay(ids, limit)]
+
+            for failed_message_id, failed_message in failed_messages:
+                try:
+                    with tx.savepoint():
+                        payload = decompress_payload(failed_message.data, failed_message.attributes)
+                        data = decode_envelope(payload, failed_message.attributes)
+
+                        cls.process_message(data["request"], data["ids"], data["metadata"])
+                        FailedMessageController.release_failed_message(failed_message)
+
+                except Exception as e:
+                    error = describe_error(e)
+
+                    with tx.savepoint():
+                        FailedMessageController.record_replay_failure(failed_message, error)
+
+                    failed.append({"id": failed_message_id, "error": error})
+                    continue
 
-        elif table == "models":
-            return handler_func(model_data = request_data, 
-                                problem_id = request_ids["problem_id"], 
-                                model_id = request_ids["model_id"])
+                replayed.append(failed_message_id)
 
-        else:
-            return handler_func(version_data = request_data)
+        return {"replayed": replayed, "failed": failed}
@@ -5,3 +5,5 @@ from models.user import UserModel
 from models.model import ModelModel
 from models.problem import ProblemModel
 from models.version import VersionModel
+from models.change_counter import ChangeCounterModel
+from models.failed_message import FailedMessageModel
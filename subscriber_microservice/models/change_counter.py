@@ -0,0 +1,21 @@
+"""Módulo que contiene el modelo de los contadores de cambios por tabla."""
+
+# Librerías Internas.
+from db import db
+
+
+class ChangeCounterModel(db.Model):
+    """Clase que contiene el modelo de los contadores de cambios. Cada tabla
+    tiene varias franjas de contador y cada escritura incrementa una de ellas
+    en la misma transacción; el contador de la tabla es la suma de sus franjas."""
+
+    __tablename__ = "change_counter_stripes"
+
+    table_name = db.Column(db.String(50), primary_key = True,
+                           comment = "Nombre de la tabla.")
+
+    stripe = db.Column(db.Integer, primary_key = True, autoincrement = False,
+                       comment = "Franja del contador.")
+
+    version = db.Column(db.BigInteger, unique = False, nullable = False, default = 0,
+                        comment = "Cantidad de escrituras confirmadas sobre la tabla en la franja.")
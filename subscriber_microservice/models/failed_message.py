@@ -0,0 +1,48 @@
+"""Módulo que contiene el modelo de los mensajes en cuarentena."""
+
+# Librerías Internas.
+from db import db
+
+
+class FailedMessageModel(db.Model):
+    """Clase que contiene el modelo de los mensajes que fallaron en todos sus
+    intentos. Se guardan tal como llegaron para inspeccionarlos y volver a
+    aplicarlos."""
+
+    __tablename__ = "failed_messages"
+
+    id = db.Column(db.Integer, primary_key = True, autoincrement = True,
+                   comment = "Primary key de la tabla.")
+
+    message_id = db.Column(db.String(100), unique = False, nullable = False,
+                           comment = "ID del mensaje en Pub/Sub.")
+
+    data = db.Column(db.LargeBinary, unique = False, nullable = False,
+                     comment = "Cuerpo del mensaje tal como llegó.")
+
+    attributes = db.Column(db.JSON, unique = False, nullable = False,
+                           comment = "Atributos del mensaje.")
+
+    ordering_key = db.Column(db.String(255), unique = False, nullable = False, default = "",
+                             comment = "Llave de orden del mensaje.")
+
+    table_name = db.Column(db.String(50), unique = False, nullable = True,
+                           comment = "Tabla del mensaje, si se pudo decodificar.")
+
+    action = db.Column(db.String(10), unique = False, nullable = True,
+                       comment = "Acción del mensaje, si se pudo decodificar.")
+
+    request_id = db.Column(db.String(100), unique = False, nullable = True,
+                           comment = "ID de la petición del mensaje, si se pudo decodificar.")
+
+    error = db.Column(db.Text, unique = False, nullable = False,
+                      comment = "Último error al aplicar el mensaje.")
+
+    attempts = db.Column(db.Integer, unique = False, nullable = False,
+                         comment = "Intentos de entrega hasta la cuarentena.")
+
+    replay_attempts = db.Column(db.Integer, unique = False, nullable = False, default = 0,
+                                comment = "Intentos fallidos de volver a aplicar el mensaje.")
+
+    failed_at = db.Column(db.DateTime, unique = False, nullable = False,
+                          comment = "Fecha en que el mensaje entró en cuarentena.")
@@ -0,0 +1,7 @@
+"""Módulo de encapsulamiento del folder."""
+
+# Librerías Internas.
+from resources.model import blp as ModelBlueprint
+from resources.problem import blp as ProblemBlueprint
+from resources.version import blp as VersionBlueprint
+from resources.failed_message import blp as FailedMessageBlueprint
@@ -0,0 +1,71 @@
+"""Módulo que contiene las vistas de administración de los mensajes en cuarentena.
+Requieren un token JWT del login del publicador, porque la API de lectura es pública."""
+
+# Librerías Externas.
+from typing import Any, Dict
+
+from flask.views import MethodView
+from flask_smorest import Blueprint
+from flask_jwt_extended import jwt_required
+
+# Librerías Internas.
+from controllers import FailedMessageController
+from controllers.fieldsets import parse_fields, select_page_fields
+from handlers.message_handler import MessageHandler
+
+from schemas import FailedMessageSchema, FailedMessagePageSchema, PaginationQuerySchema, ReplaySchema, ReplayResultSchema
+
+
+blp = Blueprint("failed_message", __name__, description = "Vistas de administración de los mensajes en cuarentena.")
+
+
+@blp.route("/failed-message")
+class FailedMessageList(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @jwt_required()
+    @blp.arguments(PaginationQuerySchema, location = "query")
+    @blp.response(200, FailedMessagePageSchema)
+    def get(self, pagination: Dict[str, Any]) -> Dict[str, Any]:
+        """Método GET que permite obtener los mensajes en cuarentena, paginados
+        por llave: cada página trae el cursor de la siguiente.
+
+        Args:
+        ----------
+        pagination: Dict[str, Any].
+            Cursor de la página anterior, límite de registros y campos solicitados.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Registros de la página y cursor de la siguiente."""
+
+        fields = parse_fields(pagination.get("fieldset"), FailedMessageSchema)
+
+        page = FailedMessageController.get_all_failed_messages(pagination.get("cursor"), pagination["limit"], fields)
+
+        return select_page_fields(page, fields)
+
+
+@blp.route("/failed-message/replay")
+class FailedMessageReplay(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @jwt_required()
+    @blp.arguments(ReplaySchema)
+    @blp.response(200, ReplayResultSchema)
+    def post(self, replay_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Método POST que permite volver a aplicar mensajes en cuarentena, los
+        indicados en 'ids' o, si no se envían, los más antiguos hasta 'limit'.
+
+        Args:
+        ----------
+        replay_data: Dict[str, Any].
+            IDs de los mensajes y cantidad máxima a aplicar.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            IDs de los mensajes aplicados y errores de los que fallaron."""
+
+        return MessageHandler.replay_failed_messages(replay_data.get("ids"), replay_data["limit"])
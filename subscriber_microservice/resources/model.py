@@ -0,0 +1,112 @@
+"""Módulo que contiene las vistas de lectura de 'modelos'."""
+
+# Librerías Externas.
+from typing import Any, Dict
+
+from flask import Response, stream_with_context
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+# Librerías Internas.
+from controllers import ModelController, ChangeCounterController
+from controllers.fieldsets import parse_fields, select_fields, select_page_fields
+
+from config import Config
+from workers.export import serialize_records, EXPORT_MIMETYPES
+
+from schemas import PlainModelSchema, ModelPageSchema, PaginationQuerySchema, ExportQuerySchema, FieldsQuerySchema
+
+
+blp = Blueprint("models", __name__, description = "Vistas de lectura relacionadas con 'modelos'.")
+
+
+@blp.route("/model")
+class ModelList(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.etag
+    @blp.arguments(PaginationQuerySchema, location = "query")
+    @blp.response(200, ModelPageSchema)
+    def get(self, pagination: Dict[str, Any]) -> Dict[str, Any]:
+        """Método GET que permite obtener todos los modelos registrados, paginados
+        por llave: cada página trae el cursor de la siguiente.
+
+        Args:
+        ----------
+        pagination: Dict[str, Any].
+            Cursor de la página anterior, límite de registros y campos solicitados.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Registros de la página y cursor de la siguiente."""
+
+        fields = parse_fields(pagination.get("fieldset"), PlainModelSchema)
+
+        blp.set_etag(ChangeCounterController.etag_data("models", pagination))
+
+        page = ModelController.get_all_models(pagination.get("cursor"), pagination["limit"], fields)
+
+        return select_page_fields(page, fields)
+
+
+@blp.route("/model/export")
+class ModelExport(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.arguments(ExportQuerySchema, location = "query")
+    def get(self, export_args: Dict[str, str]) -> Response:
+        """Método GET que permite exportar todos los modelos en una respuesta por
+        partes (NDJSON o arreglo JSON), leyendo y serializando los registros a
+        medida que se envían.
+
+        Args:
+        ----------
+        export_args: Dict[str, str].
+            Formato de la exportación y campos solicitados.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente por partes."""
+
+        export_format = export_args["format"]
+        fields = parse_fields(export_args.get("fieldset"), PlainModelSchema)
+
+        records = (select_fields(record, fields) for record in ModelController.stream_all_models(fields))
+        chunks = serialize_records(records, PlainModelSchema(), export_format, batch_size = Config.EXPORT_YIELD_PER)
+
+        return Response(stream_with_context(chunks), mimetype = EXPORT_MIMETYPES[export_format])
+
+
+@blp.route("/problem/<string:problem_id>/model/<string:model_id>")
+class Model(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.etag
+    @blp.arguments(FieldsQuerySchema, location = "query")
+    @blp.response(200, PlainModelSchema)
+    def get(self, fields_args: Dict[str, str], problem_id: str, model_id: str) -> Any:
+        """Método GET que permite obtener un modelo de un problema determinado.
+
+        Args:
+        ----------
+        fields_args: Dict[str, str].
+            Campos solicitados.
+
+        problem_id: str.
+            ID del problema.
+
+        model_id: str.
+            ID del modelo.
+
+        Returns:
+        ----------
+        Any.
+            Registro de la base de datos, reducido a los campos solicitados."""
+
+        fields = parse_fields(fields_args.get("fieldset"), PlainModelSchema)
+
+        blp.set_etag(ChangeCounterController.etag_data("models", [problem_id, model_id, fields]))
+
+        return select_fields(ModelController.get_model(problem_id, model_id, fields), fields)
@@ -0,0 +1,109 @@
+"""Módulo que contiene las vistas de lectura de 'problemas'."""
+
+# Librerías Externas.
+from typing import Any, Dict
+
+from flask import Response, stream_with_context
+from flask.views import MethodView
+from flask_smorest import Blueprint
+
+# Librerías Internas.
+from controllers import ProblemController, ChangeCounterController
+from controllers.fieldsets import parse_fields, select_fields, select_page_fields
+
+from config import Config
+from workers.export import serialize_records, EXPORT_MIMETYPES
+
+from schemas import PlainProblemSchema, ProblemPageSchema, PaginationQuerySchema, ExportQuerySchema, FieldsQuerySchema
+
+
+blp = Blueprint("problem", __name__, description = "Vistas de lectura relacionadas con 'problemas'.")
+
+
+@blp.route("/problem")
+class ProblemList(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.etag
+    @blp.arguments(PaginationQuerySchema, location = "query")
+    @blp.response(200, ProblemPageSchema)
+    def get(self, pagination: Dict[str, Any]) -> Dict[str, Any]:
+        """Método GET que permite obtener todos los problemas registrados, paginados
+        por llave: cada página trae el cursor de la siguiente.
+
+        Args:
+        ----------
+        pagination: Dict[str, Any].
+            Cursor de la página anterior, límite de registros y campos solicitados.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Registros de la página y cursor de la siguiente."""
+
+        fields = parse_fields(pagination.get("fieldset"), PlainProblemSchema)
+
+        blp.set_etag(ChangeCounterController.etag_data("problems", pagination))
+
+        page = ProblemController.get_all_problems(pagination.get("cursor"), pagination["limit"], fields)
+
+        return select_page_fields(page, fields)
+
+
+@blp.route("/problem/export")
+class ProblemExport(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.arguments(ExportQuerySchema, location = "query")
+    def get(self, export_args: Dict[str, str]) -> Response:
+        """Método GET que permite exportar todos los problemas en una respuesta por
+        partes (NDJSON o arreglo JSON), leyendo y serializando los registros a
+        medida que se envían.
+
+        Args:
+        ----------
+        export_args: Dict[str, str].
+            Formato de la exportación y campos solicitados.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente por partes."""
+
+        export_format = export_args["format"]
+        fields = parse_fields(export_args.get("fieldset"), PlainProblemSchema)
+
+        records = (select_fields(record, fields) for record in ProblemController.stream_all_problems(fields))
+        chunks = serialize_records(records, PlainProblemSchema(), export_format, batch_size = Config.EXPORT_YIELD_PER)
+
+        return Response(stream_with_context(chunks), mimetype = EXPORT_MIMETYPES[export_format])
+
+
+@blp.route("/problem/<string:problem_id>")
+class Problem(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.etag
+    @blp.arguments(FieldsQuerySchema, location = "query")
+    @blp.response(200, PlainProblemSchema)
+    def get(self, fields_args: Dict[str, str], problem_id: str) -> Any:
+        """Método GET que permite obtener un problema.
+
+        Args:
+        ----------
+        fields_args: Dict[str, str].
+            Campos solicitados.
+
+        problem_id: str.
+            ID del problema a consultar.
+
+        Returns:
+        ----------
+        Any.
+            Registro de la base de datos, reducido a los campos solicitados."""
+
+        fields = parse_fields(fields_args.get("fieldset"), PlainProblemSchema)
+
+        blp.set_etag(ChangeCounterController.etag_data("problems", [problem_id, fields]))
+
+        return select_fields(ProblemController.get_problem(problem_id, fields), fields)
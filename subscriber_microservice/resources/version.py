@@ -0,0 +1,117 @@
+"""Módulo que contiene las vistas de lectura de 'versiones'."""
+
+# Librerías Externas.
+from typing import Any, Dict
+
+from flask import Response, stream_with_context
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+
+# Librerías Internas.
+from controllers import VersionController, ChangeCounterController
+from controllers.fieldsets import parse_fields, select_fields, select_page_fields
+
+from config import Config
+from workers.export import serialize_records, EXPORT_MIMETYPES
+
+from schemas import PlainVersionSchema, VersionPageSchema, PaginationQuerySchema, ExportQuerySchema, FieldsQuerySchema
+
+
+blp = Blueprint("versions", __name__, description = "Vistas de lectura relacionadas con 'versiones'.")
+
+
+@blp.route("/version")
+class VersionList(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.etag
+    @blp.arguments(PaginationQuerySchema, location = "query")
+    @blp.response(200, VersionPageSchema)
+    def get(self, pagination: Dict[str, Any]) -> Dict[str, Any]:
+        """Método GET que permite obtener todas las versiones registradas, paginadas
+        por llave: cada página trae el cursor de la siguiente.
+
+        Args:
+        ----------
+        pagination: Dict[str, Any].
+            Cursor de la página anterior, límite de registros y campos solicitados.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Registros de la página y cursor de la siguiente."""
+
+        fields = parse_fields(pagination.get("fieldset"), PlainVersionSchema)
+
+        blp.set_etag(ChangeCounterController.etag_data("versions", pagination))
+
+        page = VersionController.get_all_versions(pagination.get("cursor"), pagination["limit"], fields)
+
+        return select_page_fields(page, fields)
+
+
+@blp.route("/version/export")
+class VersionExport(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.arguments(ExportQuerySchema, location = "query")
+    def get(self, export_args: Dict[str, str]) -> Response:
+        """Método GET que permite exportar todas las versiones en una respuesta por
+        partes (NDJSON o arreglo JSON), leyendo y serializando los registros a
+        medida que se envían.
+
+        Args:
+        ----------
+        export_args: Dict[str, str].
+            Formato de la exportación y campos solicitados.
+
+        Returns:
+        ----------
+        Response.
+            Respuesta enviada al cliente por partes."""
+
+        export_format = export_args["format"]
+        fields = parse_fields(export_args.get("fieldset"), PlainVersionSchema)
+
+        records = (select_fields(record, fields) for record in VersionController.stream_all_versions(fields))
+        chunks = serialize_records(records, PlainVersionSchema(), export_format, batch_size = Config.EXPORT_YIELD_PER)
+
+        return Response(stream_with_context(chunks), mimetype = EXPORT_MIMETYPES[export_format])
+
+
+@blp.route("/model/<string:model_id>/version/<string:version_id>")
+class Version(MethodView):
+    """Clase que encapsula los verbos de la ruta definida."""
+
+    @blp.etag
+    @blp.arguments(FieldsQuerySchema, location = "query")
+    @blp.response(200, PlainVersionSchema)
+    def get(self, fields_args: Dict[str, str], model_id: str, version_id: str) -> Any:
+        """Método GET que permite obtener una versión de un modelo determinado.
+
+        Args:
+        ----------
+        fields_args: Dict[str, str].
+            Campos solicitados.
+
+        model_id: str.
+            ID del modelo.
+
+        version_id: str.
+            ID de la versión.
+
+        Returns:
+        ----------
+        Any.
+            Registro de la base de datos, reducido a los campos solicitados."""
+
+        fields = parse_fields(fields_args.get("fieldset"), PlainVersionSchema)
+
+        blp.set_etag(ChangeCounterController.etag_data("versions", [model_id, version_id, fields]))
+
+        version = VersionController.get_version(version_id, fields)
+
+        if str(version.model_id) != model_id:
+            abort(404, message = f"No existe un registro para la versión {version_id} asociada al modelo {model_id}.")
+
+        return select_fields(version, fields)
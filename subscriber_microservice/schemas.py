@@ -5,6 +5,9 @@ from typing import Dict
 
 from marshmallow import Schema, fields, validate, post_load, validates, ValidationError
 
+# Librerías Internas.
+from config import Config
+
 
 URL_REGEX = r"^(https?:\/\/)?([\w\-]+\.)+[\w\-]+(\/[\w\-._~:/?#[\]@!$&'()*+,;=]*)?$"
 
@@ -15,6 +18,34 @@ class MessageSchema(Schema):
     message = fields.Str(dump_only = True)
 
 
+class FieldsQuerySchema(Schema):
+    """Clase que contiene el esquema del parámetro de selección de campos de las lecturas."""
+
+    fieldset = fields.Str(required = False, data_key = "fields",
+                          error_messages = {"invalid": "Los campos deben ser un string separado por comas."})
+
+
+class PaginationQuerySchema(FieldsQuerySchema):
+    """Clase que contiene el esquema de los parámetros de paginación de los listados."""
+
+    cursor = fields.Str(required = False,
+                        error_messages = {"invalid": "El cursor debe ser un string."})
+
+    limit = fields.Int(required = False, load_default = Config.PAGE_SIZE_DEFAULT,
+                       validate = validate.Range(min = 1, max = Config.PAGE_SIZE_MAX,
+                                                 error = f"El límite debe estar entre 1 y {Config.PAGE_SIZE_MAX}."),
+                       error_messages = {"invalid": "El límite debe ser un entero."})
+
+
+class ExportQuerySchema(FieldsQuerySchema):
+    """Clase que contiene el esquema de los parámetros de las exportaciones."""
+
+    format = fields.Str(required = False, load_default = "ndjson",
+                        validate = validate.OneOf(choices = ["ndjson", "json"],
+                                                  error = "El formato debe ser ('ndjson', 'json')."),
+                        error_messages = {"invalid": "El formato debe ser un string."})
+
+
 class PlainProblemSchema(Schema):
     """Clase que contiene los esquemas de validación para 'problem'."""
 
@@ -284,3 +315,89 @@ class UpdateVersionSchema(Schema):
         
         if len(metrics) < 2:
             raise ValidationError("Debe ingresar al menos la métrica en entrenamiento y validación.")
+
+
+class ProblemPageSchema(Schema):
+    """Clase que contiene el esquema de una página del listado de 'problem'."""
+
+    items = fields.List(fields.Nested(PlainProblemSchema), dump_only = True)
+
+    next_cursor = fields.Str(dump_only = True, allow_none = True)
+
+
+class ModelPageSchema(Schema):
+    """Clase que contiene el esquema de una página del listado de 'models'."""
+
+    items = fields.List(fields.Nested(PlainModelSchema), dump_only = True)
+
+    next_cursor = fields.Str(dump_only = True, allow_none = True)
+
+
+class VersionPageSchema(Schema):
+    """Clase que contiene el esquema de una página del listado de 'versions'."""
+
+    items = fields.List(fields.Nested(PlainVersionSchema), dump_only = True)
+
+    next_cursor = fields.Str(dump_only = True, allow_none = True)
+
+
+class FailedMessageSchema(Schema):
+    """Clase que contiene el esquema de los mensajes en cuarentena."""
+
+    id = fields.Int(dump_only = True)
+
+    message_id = fields.Str(dump_only = True)
+
+    attributes = fields.Raw(dump_only = True)
+
+    ordering_key = fields.Str(dump_only = True)
+
+    table_name = fields.Str(dump_only = True, allow_none = True)
+
+    action = fields.Str(dump_only = True, allow_none = True)
+
+    request_id = fields.Str(dump_only = True, allow_none = True)
+
+    error = fields.Str(dump_only = True)
+
+    attempts = fields.Int(dump_only = True)
+
+    replay_attempts = fields.Int(dump_only = True)
+
+    failed_at = fields.DateTime(dump_only = True, format = "%Y-%m-%d %H:%M:%S")
+
+
+class FailedMessagePageSchema(Schema):
+    """Clase que contiene el esquema de una página del listado de 'failed-message'."""
+
+    items = fields.List(fields.Nested(FailedMessageSchema), dump_only = True)
+
+    next_cursor = fields.Str(dump_only = True, allow_none = True)
+
+
+class ReplaySchema(Schema):
+    """Clase que contiene el esquema de la petición para volver a aplicar mensajes en cuarentena."""
+
+    ids = fields.List(fields.Int(), required = False,
+                      error_messages = {"invalid": "Los IDs deben ser una lista de enteros."})
+
+    limit = fields.Int(required = False, load_default = Config.PAGE_SIZE_DEFAULT,
+                       validate = validate.Range(min = 1, max = Config.PAGE_SIZE_MAX,
+                                                 error = f"El límite debe estar entre 1 y {Config.PAGE_SIZE_MAX}."),
+                       error_messages = {"invalid": "El límite debe ser un entero."})
+
+
+class ReplayErrorSchema(Schema):
+    """Clase que contiene el esquema de un mensaje en cuarentena que volvió a fallar."""
+
+    id = fields.Int(dump_only = True)
+
+    error = fields.Str(dump_only = True)
+
+
+class ReplayResultSchema(Schema):
+    """Clase que contiene el esquema del resultado de volver a aplicar mensajes en cuarentena."""
+
+    replayed = fields.List(fields.Int(), dump_only = True)
+
+    failed = fields.List(fields.Nested(ReplayErrorSchema), dump_only = True)
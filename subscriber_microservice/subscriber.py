@@ -1,55 +1,305 @@
 """Módulo encargado de las comunicaciones con Pub/Sub."""
 
 # Librerías Externas.
-import json
+from typing import Any, Callable, Dict, Optional
 
-from google.cloud import pubsub_v1
+import signal
+import threading
+from functools import partial
+from concurrent.futures import Future, TimeoutError, wait
 
 # Librerías Internas.
+from db import db
 from app import create_app
+from workers.acker import AckBatcher
+from workers.batch import BatchTransaction, enable_sqlite_savepoints
+from workers.transport import build_transport
+from workers.failures import FailurePolicy, describe_error
+from workers.partitioner import PartitionedExecutor, entity_key
+from workers.codec import decompress_payload, decode_envelope
 from handlers.message_handler import MessageHandler
+from controllers.failed_message import FailedMessageController
 
-from config import PROJECT_ID, SUBSCRIPTION_NAME
+from config import Config
 
 
 app = create_app()
 
+with app.app_context():
+    db.create_all()
 
-subscriber = pubsub_v1.SubscriberClient()
-subscription_path = subscriber.subscription_path(PROJECT_ID, SUBSCRIPTION_NAME)
+    if Config.SUBSCRIBER_BATCH_APPLY:
+        enable_sqlite_savepoints(db.engine)
+
+
+transport = build_transport()
+
+acker = AckBatcher(transport, max_messages = Config.ACK_BATCH_MAX_MESSAGES,
+                   max_latency = Config.ACK_BATCH_MAX_LATENCY)
+
+executor = PartitionedExecutor(partitions = Config.SUBSCRIBER_PARTITIONS, app = app,
+                               transaction = BatchTransaction if Config.SUBSCRIBER_BATCH_APPLY else None,
+                               max_batch = Config.SUBSCRIBER_BATCH_MAX_MESSAGES)
+
+failures = FailurePolicy(max_attempts = Config.FAILURE_MAX_ATTEMPTS, backoff_base = Config.FAILURE_BACKOFF_BASE,
+                         backoff_max = Config.FAILURE_BACKOFF_MAX, max_tracked = Config.FAILURE_TRACKED_MESSAGES)
 
 
 def process_msg() -> None:
-    """Función que encapsula la lógica de trabajo de qué hacer con los mensajes."""
+    """Función que encapsula la lógica de trabajo de qué hacer con los mensajes.
+    
+    Cada mensaje se envía a la partición de su entidad raíz: los mensajes de
+    una misma entidad se aplican en orden y los de entidades distintas en
+    paralelo. Las confirmaciones se envían agrupadas al terminar todos."""
     
-    response = subscriber.pull(request = {"subscription": subscription_path, 
-                                          "max_messages": 10})
+    received_messages = transport.pull(max_messages = 10)
     
-    if not response.received_messages:
+    if not received_messages:
         print("No hay mensajes qué procesar aún.")
         return
 
-    for received_message in response.received_messages:
+    futures = [dispatch(received_message.message.data, received_message.message.attributes,
+                        received_message.message.message_id)
+               for received_message in received_messages]
 
-        try:
-            data = json.loads(received_message.message.data.decode("utf-8"))
+    wait(futures)
+
+    for received_message, future in zip(received_messages, futures):
+        handle_message(received_message, future)
+
+    acker.flush()
+
+def dispatch(data: bytes, attributes: Dict[str, str], message_id: str) -> Future:
+    """Función que decodifica un mensaje y lo envía a la partición de su entidad
+    raíz. Los mensajes sin entidad raíz no dependen de ningún otro.
+
+    Args:
+    ----------
+    data: bytes.
+        Cuerpo del mensaje.
+
+    attributes: Dict[str, str].
+        Atributos del mensaje.
+
+    message_id: str.
+        ID del mensaje.
+
+    Returns:
+    ----------
+    Future.
+        Futuro con el mensaje decodificado una vez aplicado; falla si no se
+        pudo decodificar o aplicar, y se cancela si falló un mensaje anterior
+        de la misma entidad."""
+
+    try:
+        payload = decompress_payload(data, attributes)
+        decoded = decode_envelope(payload, attributes)
+
+    except Exception as e:
+        future = Future()
+        future.set_exception(e)
+        return future
+
+    key = entity_key(decoded) or f"__unordered-{message_id}"
+    return executor.submit(key, partial(apply_message, decoded))
+
+def apply_message(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Función que aplica un mensaje en la base de datos. Se ejecuta en el hilo
+    de una partición, que ya tiene abierto el contexto de la app.
+
+    Args:
+    ----------
+    data: Dict[str, Any].
+        Mensaje decodificado.
+
+    Returns:
+    ----------
+    Dict[str, Any].
+        Mensaje decodificado."""
+
+    request_ids = data["ids"]
+    metadata = data["metadata"]
+    request_data = data["request"]
+
+    MessageHandler.process_message(request_data, request_ids, metadata)
+
+    return data
+
+def settle(future: Future, message: Any, delivery_attempt: Optional[int], ack: Callable[[], None],
+           nack: Callable[[], None], delay: Callable[[int], None]) -> bool:
+    """Función que confirma un mensaje si se aplicó, o lo rechaza si se canceló
+    porque falló uno anterior de la misma entidad.
+
+    Si el mensaje falló, se vuelve a entregar tras una espera exponencial en
+    el número de intento; tras FAILURE_MAX_ATTEMPTS intentos se pone en
+    cuarentena y se confirma, para que no bloquee los mensajes siguientes de
+    su entidad.
+
+    Args:
+    ----------
+    future: Future.
+        Futuro devuelto por 'dispatch', ya terminado.
+
+    message: Any.
+        Mensaje de Pub/Sub, con 'message_id', 'data', 'attributes' y 'ordering_key'.
+
+    delivery_attempt: Optional[int].
+        Intento de entrega informado por Pub/Sub, si lo informa.
+
+    ack: Callable[[], None].
+        Función que confirma el mensaje.
+
+    nack: Callable[[], None].
+        Función que rechaza el mensaje para que se vuelva a entregar de inmediato.
+
+    delay: Callable[[int], None].
+        Función que libera el mensaje para que se vuelva a entregar tras los segundos dados.
+
+    Returns:
+    ----------
+    bool.
+        True si el mensaje se procesó correctamente."""
 
-            request_ids = data["ids"]
-            metadata = data["metadata"]
-            request_data = data["request"]
+    if future.cancelled():
+        nack()
+        return False
 
-            with app.app_context():
+    if future.exception() is None:
+        ack()
+        print(f"Mensaje procesado: {future.result()}")
+        return True
 
-                MessageHandler.process_message(request_data, request_ids, metadata)
-                        
-            subscriber.acknowledge(request={"subscription": subscription_path, 
-                                            "ack_ids": [received_message.ack_id]})
-            
-            print(f"Mensaje procesado: {data}")
+    error = describe_error(future.exception())
+    attempt = failures.attempt(message.message_id, delivery_attempt)
+    print(f"Error procesando el mensaje {message.message_id} (intento {attempt}): {error}")
 
+    if failures.exhausted(attempt) and quarantine(message, attempt, error):
+        ack()
+        print(f"Mensaje {message.message_id} puesto en cuarentena tras {attempt} intentos.")
+        return False
+
+    delay(failures.backoff(attempt))
+    return False
+
+def quarantine(message: Any, attempt: int, error: str) -> bool:
+    """Función que guarda un mensaje en la tabla de cuarentena. Si no se puede
+    guardar, el mensaje se sigue reintentando.
+
+    Args:
+    ----------
+    message: Any.
+        Mensaje de Pub/Sub.
+
+    attempt: int.
+        Número de intento.
+
+    error: str.
+        Último error al aplicar el mensaje.
+
+    Returns:
+    ----------
+    bool.
+        True si el mensaje quedó en cuarentena."""
+
+    with app.app_context():
+        try:
+            FailedMessageController.quarantine_message(message.message_id, message.data, dict(message.attributes),
+                                                       message.ordering_key, attempt, error)
         except Exception as e:
-            print(f"Error procesando el mensaje: {e}")
+            db.session.rollback()
+            print(f"Error poniendo en cuarentena el mensaje {message.message_id}: {describe_error(e)}")
+            failures.quarantined(message.message_id, ok = False)
+            return False
+
+    failures.quarantined(message.message_id)
+    return True
+
+def handle_message(received_message: Any, future: Future) -> bool:
+    """Función que agrega al lote del agrupador la confirmación de un mensaje
+    leído con 'pull', o su rechazo si falló.
+
+    Args:
+    ----------
+    received_message: Any.
+        Mensaje recibido de Pub/Sub.
+
+    future: Future.
+        Futuro devuelto por 'dispatch', ya terminado.
+
+    Returns:
+    ----------
+    bool.
+        True si el mensaje se procesó correctamente."""
+
+    ack_id = received_message.ack_id
+
+    return settle(future, received_message.message, received_message.delivery_attempt,
+                  partial(acker.ack, ack_id), partial(acker.nack, ack_id), partial(acker.delay, ack_id))
+
+def on_message(message: Any) -> None:
+    """Función que procesa un mensaje entregado por el streaming pull. Espera a
+    que la partición lo aplique para confirmarlo, o lo rechaza si falló, de modo
+    que al detener el streaming pull no queden mensajes aplicados sin confirmar.
+
+    Args:
+    ----------
+    message: Any.
+        Mensaje entregado por el streaming pull."""
+
+    future = dispatch(message.data, message.attributes, message.message_id)
+    wait([future])
+
+    def delay(seconds: int) -> None:
+        # Sin 'drop' el cliente seguiría renovando el plazo y el mensaje no se volvería a entregar.
+        message.modify_ack_deadline(seconds)
+        message.drop()
+
+    settle(future, message, message.delivery_attempt, message.ack, message.nack, delay)
+
+def consume() -> None:
+    """Función que consume mensajes de forma continua con un streaming pull,
+    con a lo sumo SUBSCRIBER_FLOW_MAX_MESSAGES mensajes y SUBSCRIBER_FLOW_MAX_BYTES
+    bytes sin confirmar.
+
+    Al recibir SIGTERM o SIGINT deja de recibir mensajes y espera, hasta
+    SUBSCRIBER_DRAIN_TIMEOUT segundos, a que terminen los que están en proceso."""
+
+    stop = threading.Event()
+
+    streaming_pull = transport.subscribe(on_message,
+                                         max_messages = Config.SUBSCRIBER_FLOW_MAX_MESSAGES,
+                                         max_bytes = Config.SUBSCRIBER_FLOW_MAX_BYTES,
+                                         max_workers = Config.SUBSCRIBER_MAX_WORKERS)
+
+    # Si el streaming pull termina por un error también se detiene el consumo.
+    streaming_pull.add_done_callback(lambda _: stop.set())
+
+    for signum in [signal.SIGTERM, signal.SIGINT]:
+        signal.signal(signum, lambda *_: stop.set())
+
+    print("Escuchando mensajes...")
+    stop.wait()
+
+    print("Deteniendo el suscriptor, esperando los mensajes en proceso...")
+    streaming_pull.cancel()
+
+    try:
+        streaming_pull.result(timeout = Config.SUBSCRIBER_DRAIN_TIMEOUT)
+        print("Suscriptor detenido.")
+
+    except TimeoutError:
+        print(f"Quedaron mensajes en proceso tras {Config.SUBSCRIBER_DRAIN_TIMEOUT} segundos; se volverán a entregar.")
+
+    except Exception as e:
+        print(f"El streaming pull terminó con un error: {e}")
+
+    executor.shutdown(wait = False)
+    print(f"Particiones: {executor.stats()['partitions']}")
+    print(f"Fallos: {failures.stats()}")
 
 
 if __name__ == "__main__":
-    process_msg()
+    if Config.SUBSCRIBER_MODE == "pull":
+        process_msg()
+    else:
+        consume()
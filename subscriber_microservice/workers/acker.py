@@ -0,0 +1,197 @@
+"""Módulo que contiene el agrupador de confirmaciones de mensajes."""
+
+# Librerías Externas.
+from typing import Any, Dict, List, Union
+
+import time
+import threading
+
+
+class AckBatcher:
+    """Clase que agrupa las confirmaciones (ack), los rechazos (plazo de
+    confirmación en cero) y las esperas (plazo de confirmación en N segundos)
+    de mensajes ya procesados, y los envía en una sola llamada por tipo, y por
+    plazo, cuando se juntan 'max_messages' o cuando el más antiguo lleva
+    'max_latency' segundos esperando."""
+
+    def __init__(self, client: Any, max_messages: int = 100, max_latency: float = 0.05) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        client: Any.
+            Transporte o broker con los métodos 'acknowledge' y 'modify_ack_deadline'.
+
+        max_messages: int.
+            Mensajes máximos por llamada.
+
+        max_latency: float.
+            Segundos máximos que espera una confirmación antes de enviarse."""
+
+        self.client = client
+        self.max_messages = max_messages
+        self.max_latency = max_latency
+
+        self._ready = threading.Condition()
+        # 'ack' -> confirmaciones; segundos del nuevo plazo -> mensajes a liberar (0 es un rechazo).
+        self._pending: Dict[Union[str, int], List[str]] = {}
+        self._first_at = None
+        self._closed = False
+
+        self.counters = {"acks": 0, "ack_rpcs": 0, "nacks": 0, "nack_rpcs": 0,
+                         "delays": 0, "delay_rpcs": 0, "errors": 0}
+
+        self._thread = threading.Thread(target = self._run, daemon = True)
+        self._thread.start()
+
+    def ack(self, ack_id: str) -> None:
+        """Método que agrega la confirmación de un mensaje. Se debe llamar
+        después de que su transacción se confirmó en la base de datos.
+
+        Args:
+        ----------
+        ack_id: str.
+            ID de confirmación del mensaje."""
+
+        self._add("ack", ack_id)
+
+    def nack(self, ack_id: str) -> None:
+        """Método que agrega el rechazo de un mensaje para que se vuelva a entregar.
+
+        Args:
+        ----------
+        ack_id: str.
+            ID de confirmación del mensaje."""
+
+        self._add(0, ack_id)
+
+    def delay(self, ack_id: str, seconds: int) -> None:
+        """Método que agrega la liberación de un mensaje para que se vuelva a
+        entregar tras 'seconds' segundos. Se agrupa con las de igual plazo.
+
+        Args:
+        ----------
+        ack_id: str.
+            ID de confirmación del mensaje.
+
+        seconds: int.
+            Segundos hasta la nueva entrega."""
+
+        self._add(int(seconds), ack_id)
+
+    def _add(self, kind: Union[str, int], ack_id: str) -> None:
+        """Método que agrega una confirmación o una liberación, y envía el lote si está lleno.
+
+        Args:
+        ----------
+        kind: Union[str, int].
+            'ack', o los segundos del nuevo plazo del mensaje.
+
+        ack_id: str.
+            ID de confirmación del mensaje."""
+
+        batch = None
+
+        with self._ready:
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+                self._ready.notify()
+
+            pending = self._pending.setdefault(kind, [])
+            pending.append(ack_id)
+
+            if len(pending) >= self.max_messages:
+                batch = self._pending.pop(kind)
+
+        if batch:
+            self._send(kind, batch)
+
+    def _run(self) -> None:
+        """Método del hilo que envía los lotes cuya espera venció."""
+
+        while True:
+            with self._ready:
+                while self._first_at is None and not self._closed:
+                    self._ready.wait()
+
+                if self._closed:
+                    return
+
+                remaining = self._first_at + self.max_latency - time.monotonic()
+
+                if remaining > 0:
+                    self._ready.wait(remaining)
+                    continue
+
+            self.flush()
+
+    def _send(self, kind: Union[str, int], ack_ids: List[str]) -> None:
+        """Método que envía un lote de confirmaciones o de liberaciones. Si
+        falla, los mensajes se vuelven a entregar cuando vence su plazo.
+
+        Args:
+        ----------
+        kind: Union[str, int].
+            'ack', o los segundos del nuevo plazo de los mensajes.
+
+        ack_ids: List[str].
+            IDs de confirmación de los mensajes."""
+
+        try:
+            if kind == "ack":
+                self.client.acknowledge(ack_ids)
+            else:
+                self.client.modify_ack_deadline(ack_ids, kind)
+
+        except Exception as e:
+            print(f"Error enviando {len(ack_ids)} {kind}: {e}")
+
+            with self._ready:
+                self.counters["errors"] += 1
+
+            return
+
+        name = "ack" if kind == "ack" else "nack" if kind == 0 else "delay"
+
+        with self._ready:
+            self.counters[f"{name}s"] += len(ack_ids)
+            self.counters[f"{name}_rpcs"] += 1
+
+    def flush(self) -> None:
+        """Método que envía de inmediato todo lo pendiente."""
+
+        with self._ready:
+            pending = self._pending
+            self._pending = {}
+            self._first_at = None
+
+        for kind, ack_ids in pending.items():
+            if ack_ids:
+                self._send(kind, ack_ids)
+
+    def close(self) -> None:
+        """Método que detiene el hilo y envía lo pendiente."""
+
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
+
+        self._thread.join()
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume los envíos.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Contadores y mensajes por llamada."""
+
+        with self._ready:
+            counters = dict(self.counters)
+
+        counters["acks_per_rpc"] = round(counters["acks"] / counters["ack_rpcs"], 1) if counters["ack_rpcs"] else 0.0
+        counters["nacks_per_rpc"] = round(counters["nacks"] / counters["nack_rpcs"], 1) if counters["nack_rpcs"] else 0.0
+        counters["delays_per_rpc"] = round(counters["delays"] / counters["delay_rpcs"], 1) if counters["delay_rpcs"] else 0.0
+
+        return counters
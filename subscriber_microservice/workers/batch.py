@@ -0,0 +1,121 @@
+"""Módulo que contiene la transacción con la que se aplica un lote de mensajes."""
+
+# Librerías Externas.
+from typing import Any, Iterator, Optional
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from flask_sqlalchemy.session import Session
+
+# Librerías Internas.
+from db import db
+
+
+class BatchSession(Session):
+    """Clase de sesión ligada a la conexión de un lote. Con
+    'join_transaction_mode = "create_savepoint"' los 'commit' y 'rollback' de
+    los controladores solo liberan o revierten un SAVEPOINT, sin tocar la
+    transacción del lote. Hereda de la sesión de Flask-SQLAlchemy para que
+    apliquen sus eventos (p. ej. los contadores de cambios)."""
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, bind: Any = None, **kwargs: Any) -> Any:
+        """Método que retorna la conexión del lote, en lugar del engine que
+        elegiría la sesión de Flask-SQLAlchemy.
+
+        Returns:
+        ----------
+        Any.
+            Conexión del lote."""
+
+        return bind if bind is not None else self.bind
+
+
+class BatchTransaction:
+    """Clase que aplica un lote de mensajes en una sola transacción: cada
+    mensaje corre dentro de su propio SAVEPOINT y uno que falla solo revierte
+    el suyo. Mientras el lote está abierto, 'db.session' es la sesión del lote."""
+
+    def __init__(self) -> None:
+        """Método constructor."""
+
+        self.connection: Optional[Connection] = None
+        self.session: Optional[BatchSession] = None
+
+    def __enter__(self) -> "BatchTransaction":
+        """Método que abre la conexión, la transacción y la sesión del lote.
+
+        Returns:
+        ----------
+        BatchTransaction.
+            Transacción del lote."""
+
+        self.connection = db.engine.connect()
+        self.transaction = self.connection.begin()
+
+        self.session = BatchSession(db, bind = self.connection, join_transaction_mode = "create_savepoint")
+        db.session.registry.set(self.session)
+
+        return self
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """Método que ejecuta un mensaje dentro de su propio SAVEPOINT. Si el
+        mensaje falla, se revierten sus cambios (incluso los que sus
+        controladores ya 'confirmaron') y se propaga el error."""
+
+        nested = self.connection.begin_nested()
+
+        try:
+            yield
+            self.session.commit()
+            nested.commit()
+
+        except Exception:
+            self.session.rollback()
+            nested.rollback()
+            raise
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Método que confirma el lote, o lo revierte si hubo un error fuera de
+        los SAVEPOINT, y restaura la sesión de la app."""
+
+        try:
+            if exc_type is None:
+                self.transaction.commit()
+            else:
+                self.transaction.rollback()
+
+        finally:
+            self.session.close()
+            self.connection.close()
+            db.session.registry.clear()
+
+
+def enable_sqlite_savepoints(engine: Engine) -> None:
+    """Función que habilita los SAVEPOINT en SQLite. El driver 'sqlite3' abre
+    las transacciones por su cuenta y no las anida bien, así que se le quita
+    ese manejo y se emite el BEGIN al abrir cada transacción. Es IMMEDIATE para
+    que los lotes de particiones distintas esperen el bloqueo de escritura en
+    lugar de fallar al tomarlo a mitad de la transacción. No hace nada con
+    otros motores.
+
+    Args:
+    ----------
+    engine: Engine.
+        Engine de la app."""
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    # Las conexiones que ya están en el pool se crearon sin el evento 'connect'.
+    engine.dispose()
@@ -0,0 +1,86 @@
+"""Módulo encargado de la serialización incremental de las exportaciones."""
+
+# Librerías Externas.
+from typing import Any, Iterable, Iterator, List
+
+import json
+
+from marshmallow import Schema
+
+
+EXPORT_MIMETYPES = {"ndjson": "application/x-ndjson",
+                    "json": "application/json"}
+
+
+def serialize_records(records: Iterable[Any], schema: Schema, export_format: str,
+                      batch_size: int = 1000) -> Iterator[str]:
+    """Función que serializa registros a medida que se leen, como líneas NDJSON
+    o como un arreglo JSON enviado por partes. Cada fragmento contiene hasta
+    'batch_size' registros, de modo que la memoria no depende del tamaño total.
+
+    Args:
+    ----------
+    records: Iterable[Any].
+        Registros a serializar, idealmente leídos de un cursor del servidor.
+
+    schema: Schema.
+        Esquema con el que se serializa cada registro.
+
+    export_format: str.
+        'ndjson' o 'json'.
+
+    batch_size: int.
+        Registros por fragmento.
+
+    Returns:
+    ----------
+    Iterator[str].
+        Fragmentos de la respuesta."""
+
+    ndjson = export_format == "ndjson"
+    separator = "\n" if ndjson else ","
+    started = False
+    batch: List[str] = []
+
+    if not ndjson:
+        yield "["
+
+    for record in records:
+        batch.append(json.dumps(schema.dump(record)))
+
+        if len(batch) >= batch_size:
+            yield _join(batch, separator, ndjson, started)
+            started, batch = True, []
+
+    if batch:
+        yield _join(batch, separator, ndjson, started)
+
+    if not ndjson:
+        yield "]"
+
+def _join(batch: List[str], separator: str, ndjson: bool, started: bool) -> str:
+    """Función auxiliar que une los registros de un fragmento.
+
+    Args:
+    ----------
+    batch: List[str].
+        Registros serializados.
+
+    separator: str.
+        Separador entre registros.
+
+    ndjson: bool.
+        Si la salida es NDJSON.
+
+    started: bool.
+        Si ya se envió algún fragmento con registros.
+
+    Returns:
+    ----------
+    str.
+        Fragmento."""
+
+    if ndjson:
+        return separator.join(batch) + "\n"
+
+    return ("," if started else "") + separator.join(batch)
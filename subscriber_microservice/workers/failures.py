@@ -0,0 +1,156 @@
+"""Módulo que contiene la política de reintentos de los mensajes que fallan."""
+
+# Librerías Externas.
+from typing import Any, Dict, Optional
+
+import threading
+from collections import OrderedDict
+
+
+def describe_error(error: BaseException) -> str:
+    """Función que obtiene el mensaje de un error. Los errores de 'abort' de
+    los controladores guardan su mensaje en 'data'.
+
+    Args:
+    ----------
+    error: BaseException.
+        Error.
+
+    Returns:
+    ----------
+    str.
+        Mensaje del error."""
+
+    data = getattr(error, "data", None)
+
+    if isinstance(data, dict) and data.get("message"):
+        return f"{type(error).__name__}: {data['message']}"
+
+    return f"{type(error).__name__}: {error}"
+
+
+class FailurePolicy:
+    """Clase que decide qué hacer con un mensaje que falló: volver a entregarlo
+    tras un tiempo de espera exponencial o, tras 'max_attempts' intentos,
+    ponerlo en cuarentena.
+
+    Los intentos se toman de 'delivery_attempt' de Pub/Sub, que solo viene
+    cuando la suscripción tiene política de dead-letter; si no, se cuentan en
+    memoria con un LRU acotado por ID de mensaje."""
+
+    def __init__(self, max_attempts: int = 5, backoff_base: float = 10.0, backoff_max: float = 600.0,
+                 max_tracked: int = 10000) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        max_attempts: int.
+            Intentos tras los que el mensaje se pone en cuarentena.
+
+        backoff_base: float.
+            Segundos de espera tras el primer intento; se duplican en cada uno.
+
+        backoff_max: float.
+            Segundos máximos de espera (Pub/Sub admite hasta 600).
+
+        max_tracked: int.
+            Mensajes máximos cuyos intentos se cuentan en memoria."""
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_tracked = max_tracked
+
+        self._lock = threading.Lock()
+        self._attempts: "OrderedDict[str, int]" = OrderedDict()
+
+        self.counters = {"failures": 0, "backoffs": 0, "quarantined": 0, "quarantine_errors": 0}
+
+    def attempt(self, message_id: str, delivery_attempt: Optional[int] = None) -> int:
+        """Método que registra un fallo de un mensaje y obtiene su número de intento.
+
+        Args:
+        ----------
+        message_id: str.
+            ID del mensaje.
+
+        delivery_attempt: Optional[int].
+            Intento de entrega informado por Pub/Sub; 0 o None si no lo informa.
+
+        Returns:
+        ----------
+        int.
+            Número de intento, empezando en 1."""
+
+        with self._lock:
+            self.counters["failures"] += 1
+
+            count = self._attempts.pop(message_id, 0) + 1
+            self._attempts[message_id] = count
+
+            while len(self._attempts) > self.max_tracked:
+                self._attempts.popitem(last = False)
+
+        return delivery_attempt or count
+
+    def exhausted(self, attempt: int) -> bool:
+        """Método que indica si un mensaje agotó sus intentos.
+
+        Args:
+        ----------
+        attempt: int.
+            Número de intento.
+
+        Returns:
+        ----------
+        bool.
+            True si se debe poner en cuarentena."""
+
+        return attempt >= self.max_attempts
+
+    def backoff(self, attempt: int) -> int:
+        """Método que obtiene los segundos de espera antes de la siguiente entrega.
+
+        Args:
+        ----------
+        attempt: int.
+            Número de intento.
+
+        Returns:
+        ----------
+        int.
+            Segundos de espera."""
+
+        with self._lock:
+            self.counters["backoffs"] += 1
+
+        return int(min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def quarantined(self, message_id: str, ok: bool = True) -> None:
+        """Método que registra el resultado de poner un mensaje en cuarentena.
+
+        Args:
+        ----------
+        message_id: str.
+            ID del mensaje.
+
+        ok: bool.
+            True si el mensaje quedó en cuarentena."""
+
+        with self._lock:
+            if ok:
+                self._attempts.pop(message_id, None)
+                self.counters["quarantined"] += 1
+            else:
+                self.counters["quarantine_errors"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume los fallos.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Contadores y mensajes cuyos intentos se cuentan en memoria."""
+
+        with self._lock:
+            return {**self.counters, "tracked": len(self._attempts)}
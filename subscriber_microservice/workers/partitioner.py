@@ -0,0 +1,286 @@
+"""Módulo que contiene el pool de hilos particionado por entidad raíz."""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import zlib
+import queue
+import threading
+from contextlib import nullcontext
+from concurrent.futures import Future
+
+from flask import Flask
+
+# Librerías Internas.
+from db import db
+
+
+def entity_key(data: Dict[str, Any]) -> Optional[str]:
+    """Función que obtiene la entidad raíz de un mensaje a partir de sus IDs:
+    el modelo para las versiones y el problema para los problemas y modelos.
+    Coincide con la llave de orden con la que el publicador envía el mensaje.
+
+    Args:
+    ----------
+    data: Dict[str, Any].
+        Mensaje decodificado.
+
+    Returns:
+    ----------
+    Optional[str].
+        Entidad raíz, o None si el mensaje no tiene una (p. ej. crear un problema)."""
+
+    request_ids = data["ids"] or {}
+
+    if data["metadata"]["table"] == "versions" and request_ids.get("model_id") is not None:
+        return f"model-{request_ids['model_id']}"
+
+    if request_ids.get("problem_id") is not None:
+        return f"problem-{request_ids['problem_id']}"
+
+    return None
+
+
+class PartitionedExecutor:
+    """Clase que ejecuta tareas en 'partitions' hilos, cada uno dueño de un rango
+    del hash de la llave de la tarea: las tareas de llaves distintas corren en
+    paralelo y las de una misma llave corren en orden de envío en un solo hilo.
+
+    Si una tarea falla, las tareas de la misma llave que ya estaban en cola se
+    cancelan para no aplicarlas fuera de orden; las enviadas después (p. ej. la
+    nueva entrega del mensaje fallido) sí se ejecutan. Cada hilo mantiene un
+    solo contexto de la app mientras vive.
+
+    Con 'transaction', cada hilo toma hasta 'max_batch' tareas de su cola y las
+    ejecuta dentro de una misma transacción, cada una en su SAVEPOINT; los
+    futuros de las tareas exitosas se resuelven después de confirmar el lote."""
+
+    def __init__(self, partitions: int = 4, app: Optional[Flask] = None,
+                 transaction: Optional[Callable[[], Any]] = None, max_batch: int = 100) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        partitions: int.
+            Cantidad de particiones (hilos).
+
+        app: Optional[Flask].
+            App cuyo contexto abre cada hilo; si es None las tareas corren sin contexto.
+
+        transaction: Optional[Callable[[], Any]].
+            Fábrica de la transacción de un lote (p. ej. BatchTransaction); si es
+            None cada tarea corre por separado.
+
+        max_batch: int.
+            Tareas máximas por lote cuando hay 'transaction'."""
+
+        self.app = app
+        self.partitions = partitions
+        self.transaction = transaction
+        self.max_batch = max_batch if transaction is not None else 1
+
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._queues: List["queue.Queue"] = [queue.Queue() for _ in range(partitions)]
+        self.counters = [{"processed": 0, "failed": 0, "cancelled": 0, "batches": 0} for _ in range(partitions)]
+
+        self._threads = [threading.Thread(target = self._run, args = (partition,), daemon = True,
+                                          name = f"partition-{partition}")
+                         for partition in range(partitions)]
+
+        for thread in self._threads:
+            thread.start()
+
+    def partition(self, key: str) -> int:
+        """Método que obtiene la partición de una llave. El hash es estable
+        entre procesos, a diferencia de 'hash' de Python.
+
+        Args:
+        ----------
+        key: str.
+            Llave de la tarea.
+
+        Returns:
+        ----------
+        int.
+            Partición."""
+
+        return zlib.crc32(key.encode()) % self.partitions
+
+    def submit(self, key: str, fn: Callable[[], Any]) -> Future:
+        """Método que envía una tarea a la partición de su llave.
+
+        Args:
+        ----------
+        key: str.
+            Llave de la tarea; las tareas sin orden pueden usar una llave única.
+
+        fn: Callable[[], Any].
+            Tarea.
+
+        Returns:
+        ----------
+        Future.
+            Futuro con el resultado de la tarea; se cancela si una tarea anterior
+            de la misma llave falló."""
+
+        future = Future()
+
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+
+        self._queues[self.partition(key)].put((sequence, key, fn, future))
+        return future
+
+    def _run(self, partition: int) -> None:
+        """Método del hilo de una partición.
+
+        Args:
+        ----------
+        partition: int.
+            Partición."""
+
+        if self.app is None:
+            self._work(partition)
+            return
+
+        with self.app.app_context():
+            self._work(partition)
+
+    def _work(self, partition: int) -> None:
+        """Método que ejecuta en orden los lotes de una partición hasta recibir la señal de parada.
+
+        Args:
+        ----------
+        partition: int.
+            Partición."""
+
+        tasks = self._queues[partition]
+
+        # Llave bloqueada -> última secuencia enviada cuando falló una de sus tareas.
+        blocked: Dict[str, int] = {}
+
+        while True:
+            items = [tasks.get()]
+
+            while items[-1] is not None and len(items) < self.max_batch:
+                try:
+                    items.append(tasks.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = items[-1] is None
+
+            if stopping:
+                items.pop()
+
+            if items:
+                self._apply(partition, items, blocked)
+
+            if stopping:
+                return
+
+    def _apply(self, partition: int, items: List[Tuple[int, str, Callable[[], Any], Future]],
+               blocked: Dict[str, int]) -> None:
+        """Método que ejecuta un lote de tareas de una partición.
+
+        Args:
+        ----------
+        partition: int.
+            Partición.
+
+        items: List[Tuple[int, str, Callable[[], Any], Future]].
+            Tareas del lote en orden de envío.
+
+        blocked: Dict[str, int].
+            Llaves bloqueadas de la partición."""
+
+        counters = self.counters[partition]
+        completed: List[Tuple[str, Future, Any]] = []
+
+        try:
+            with self.transaction() if self.transaction is not None else nullcontext() as transaction:
+                for sequence, key, fn, future in items:
+                    for blocked_key in [blocked_key for blocked_key, until in blocked.items() if until < sequence]:
+                        del blocked[blocked_key]
+
+                    if key in blocked:
+                        future.cancel()
+
+                    if not future.set_running_or_notify_cancel():
+                        counters["cancelled"] += 1
+                        continue
+
+                    try:
+                        with transaction.savepoint() if transaction is not None else nullcontext():
+                            result = fn()
+
+                    except Exception as e:
+                        if transaction is None and self.app is not None:
+                            db.session.rollback()
+
+                        self._block(blocked, key)
+                        counters["failed"] += 1
+                        future.set_exception(e)
+                        continue
+
+                    completed.append((key, future, result))
+
+        except Exception as e:
+            # Si no se pudo abrir o confirmar el lote, ninguna de sus tareas quedó aplicada.
+            for _, key, _, future in items:
+                if not future.done():
+                    self._block(blocked, key)
+                    counters["failed"] += 1
+                    future.set_exception(e)
+
+            return
+
+        counters["batches"] += 1
+
+        for _, future, result in completed:
+            counters["processed"] += 1
+            future.set_result(result)
+
+    def _block(self, blocked: Dict[str, int], key: str) -> None:
+        """Método que bloquea una llave hasta la última tarea enviada, para
+        cancelar las de la misma llave que ya estaban en cola.
+
+        Args:
+        ----------
+        blocked: Dict[str, int].
+            Llaves bloqueadas de la partición.
+
+        key: str.
+            Llave de la tarea que falló."""
+
+        with self._lock:
+            blocked[key] = self._sequence
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Método que detiene los hilos tras ejecutar las tareas en cola.
+
+        Args:
+        ----------
+        wait: bool.
+            Si es True espera a que terminen."""
+
+        for tasks in self._queues:
+            tasks.put(None)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """Método que resume el estado de las particiones.
+
+        Returns:
+        ----------
+        Dict[str, Any].
+            Tareas en cola y contadores de cada partición."""
+
+        return {"partitions": [{"partition": partition, "depth": self._queues[partition].qsize(),
+                                **self.counters[partition]}
+                               for partition in range(self.partitions)]}
@@ -0,0 +1,475 @@
+"""Módulo que contiene los transportes de los que se consumen los mensajes."""
+
+# Librerías Externas.
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import threading
+from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    from google.cloud import pubsub_v1
+    from google.cloud.pubsub_v1 import types
+    from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
+except ImportError:
+    pubsub_v1 = None
+
+# Librerías Internas.
+from config import PROJECT_ID, SUBSCRIPTION_NAME, Config
+from workers.acker import AckBatcher
+from workers.broker import LocalBroker
+
+
+@dataclass
+class LocalMessage:
+    """Clase que replica los campos usados de un mensaje de Pub/Sub."""
+
+    message_id: str
+    data: bytes
+    attributes: Dict[str, str]
+    ordering_key: str
+    publish_time: float
+
+
+@dataclass
+class LocalReceivedMessage:
+    """Clase que replica los campos usados de un mensaje recibido de Pub/Sub."""
+
+    ack_id: str
+    message: LocalMessage
+    delivery_attempt: int
+
+
+class LocalStreamedMessage:
+    """Clase que replica los campos y métodos usados de un mensaje entregado
+    por el streaming pull de Pub/Sub."""
+
+    def __init__(self, row: Dict[str, Any], streaming_pull: "LocalStreamingPull") -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        row: Dict[str, Any].
+            Mensaje entregado por el broker.
+
+        streaming_pull: LocalStreamingPull.
+            Streaming pull que entregó el mensaje."""
+
+        self.message_id = row["message_id"]
+        self.ack_id = row["message_id"]
+        self.data = row["data"]
+        self.attributes = row["attributes"]
+        self.ordering_key = row["ordering_key"]
+        self.publish_time = row["publish_time"]
+        self.delivery_attempt = row["delivery_attempt"]
+        self.size = len(row["data"])
+
+        self.settled = False
+        self.nacked = False
+        self._streaming_pull = streaming_pull
+
+    def ack(self) -> None:
+        """Método que confirma el mensaje."""
+
+        self._streaming_pull.settle(self, ack = True)
+
+    def nack(self) -> None:
+        """Método que rechaza el mensaje para que se vuelva a entregar de inmediato."""
+
+        self.modify_ack_deadline(0)
+
+    def modify_ack_deadline(self, seconds: int) -> None:
+        """Método que libera el mensaje para que se vuelva a entregar tras 'seconds' segundos.
+
+        Args:
+        ----------
+        seconds: int.
+            Segundos hasta la nueva entrega."""
+
+        self.nacked = True
+        self._streaming_pull.settle(self, ack = False, seconds = seconds)
+
+    def drop(self) -> None:
+        """Método que deja de renovar el plazo del mensaje. En el broker local
+        el cupo ya se liberó al confirmarlo o liberarlo, así que no hace nada."""
+
+
+class LocalStreamingPull(Future):
+    """Clase que replica el streaming pull de Pub/Sub sobre el broker local: un
+    hilo lee mensajes mientras haya cupo en el control de flujo y los entrega a
+    un pool de hilos, en orden dentro de cada llave de orden."""
+
+    def __init__(self, broker: LocalBroker, callback: Callable[[Any], None], acker: AckBatcher,
+                 max_messages: int = 100, max_bytes: int = 10000000, max_workers: int = 4,
+                 poll_interval: float = 0.05) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        broker: LocalBroker.
+            Broker local.
+
+        acker: AckBatcher.
+            Agrupador con el que se confirman o liberan los mensajes.
+
+        callback: Callable[[Any], None].
+            Función que procesa cada mensaje y lo confirma o rechaza.
+
+        max_messages: int.
+            Mensajes máximos entregados sin confirmar.
+
+        max_bytes: int.
+            Bytes máximos entregados sin confirmar.
+
+        max_workers: int.
+            Hilos que ejecutan 'callback'.
+
+        poll_interval: float.
+            Segundos de espera cuando el broker no tiene mensajes."""
+
+        super().__init__()
+
+        self.broker = broker
+        self.callback = callback
+        self.acker = acker
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.poll_interval = poll_interval
+
+        self._stopped = threading.Event()
+        self._capacity = threading.Condition()
+        self._outstanding = {"messages": 0, "bytes": 0}
+        self._executor = ThreadPoolExecutor(max_workers = max_workers)
+
+        self._thread = threading.Thread(target = self._run, daemon = True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Método del hilo que lee mensajes del broker hasta que se cancela el
+        streaming pull, y luego espera a que terminen los que están en proceso."""
+
+        try:
+            while not self._stopped.is_set():
+                with self._capacity:
+                    while (self._outstanding["messages"] >= self.max_messages
+                           or self._outstanding["bytes"] >= self.max_bytes) and not self._stopped.is_set():
+                        self._capacity.wait(self.poll_interval)
+
+                    available = self.max_messages - self._outstanding["messages"]
+
+                if self._stopped.is_set():
+                    break
+
+                messages = [LocalStreamedMessage(row, self) for row in self.broker.pull(available)]
+
+                if not messages:
+                    self._stopped.wait(self.poll_interval)
+                    continue
+
+                groups: Dict[str, List[LocalStreamedMessage]] = defaultdict(list)
+
+                with self._capacity:
+                    for position, message in enumerate(messages):
+                        self._outstanding["messages"] += 1
+                        self._outstanding["bytes"] += message.size
+                        groups[message.ordering_key or f"__unordered-{position}"].append(message)
+
+                for group in groups.values():
+                    self._executor.submit(self._deliver, group)
+
+            self._executor.shutdown(wait = True)
+            self.acker.close()
+            self.set_result(None)
+
+        except Exception as e:
+            self.set_exception(e)
+
+    def _deliver(self, messages: List[LocalStreamedMessage]) -> None:
+        """Método que entrega en orden los mensajes de una misma llave de orden.
+        Si uno se rechaza o el streaming pull se cancela, los siguientes se
+        liberan para que se vuelvan a entregar.
+
+        Args:
+        ----------
+        messages: List[LocalStreamedMessage].
+            Mensajes de una misma llave de orden."""
+
+        for position, message in enumerate(messages):
+            if self._stopped.is_set():
+                for pending in messages[position:]:
+                    pending.nack()
+                return
+
+            try:
+                self.callback(message)
+            except Exception as e:
+                print(f"Error en el callback del mensaje {message.message_id}: {e}")
+
+            if not message.settled:
+                message.nack()
+
+            if message.nacked:
+                for pending in messages[position + 1:]:
+                    pending.nack()
+                return
+
+    def settle(self, message: LocalStreamedMessage, ack: bool, seconds: int = 0) -> None:
+        """Método que confirma o libera un mensaje entregado y devuelve su cupo
+        al control de flujo. Un mensaje solo se confirma o libera una vez.
+
+        Args:
+        ----------
+        message: LocalStreamedMessage.
+            Mensaje entregado.
+
+        ack: bool.
+            True para confirmarlo, False para liberarlo.
+
+        seconds: int.
+            Segundos hasta la nueva entrega si se libera."""
+
+        with self._capacity:
+            if message.settled:
+                return
+
+            message.settled = True
+            self._outstanding["messages"] -= 1
+            self._outstanding["bytes"] -= message.size
+            self._capacity.notify()
+
+        if ack:
+            self.acker.ack(message.ack_id)
+        else:
+            self.acker.delay(message.ack_id, seconds)
+
+    def cancel(self) -> bool:
+        """Método que deja de leer mensajes. Los que están en proceso terminan y
+        los que aún no se entregaron se liberan; 'result' espera a que acabe.
+
+        Returns:
+        ----------
+        bool.
+            Siempre True."""
+
+        self._stopped.set()
+        return True
+
+    def cancelled(self) -> bool:
+        """Método que indica si el streaming pull se canceló.
+
+        Returns:
+        ----------
+        bool.
+            True si se canceló."""
+
+        return self._stopped.is_set()
+
+
+class PubSubTransport:
+    """Clase que consume mensajes de una suscripción de Google Cloud Pub/Sub."""
+
+    def __init__(self, project_id: Optional[str] = PROJECT_ID,
+                 subscription_name: Optional[str] = SUBSCRIPTION_NAME) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        project_id: Optional[str].
+            Proyecto de GCP.
+
+        subscription_name: Optional[str].
+            Suscripción de Pub/Sub."""
+
+        if pubsub_v1 is None:
+            raise ImportError("Se requiere 'google-cloud-pubsub' para usar el transporte 'pubsub'.")
+
+        self.client = pubsub_v1.SubscriberClient()
+        self.subscription_path = self.client.subscription_path(project_id, subscription_name)
+
+    def pull(self, max_messages: int = 10) -> List[Any]:
+        """Método que obtiene mensajes de la suscripción.
+
+        Args:
+        ----------
+        max_messages: int.
+            Cantidad máxima de mensajes.
+
+        Returns:
+        ----------
+        List[Any].
+            Mensajes recibidos."""
+
+        response = self.client.pull(request = {"subscription": self.subscription_path, 
+                                               "max_messages": max_messages})
+
+        return list(response.received_messages)
+
+    def acknowledge(self, ack_ids: List[str]) -> None:
+        """Método que confirma mensajes procesados.
+
+        Args:
+        ----------
+        ack_ids: List[str].
+            IDs de confirmación de los mensajes."""
+
+        self.client.acknowledge(request = {"subscription": self.subscription_path, 
+                                           "ack_ids": ack_ids})
+
+    def modify_ack_deadline(self, ack_ids: List[str], seconds: int) -> None:
+        """Método que modifica el plazo de confirmación de mensajes. Con 0
+        segundos los mensajes se vuelven a entregar de inmediato.
+
+        Args:
+        ----------
+        ack_ids: List[str].
+            IDs de confirmación de los mensajes.
+
+        seconds: int.
+            Nuevo plazo en segundos."""
+
+        self.client.modify_ack_deadline(request = {"subscription": self.subscription_path,
+                                                   "ack_ids": ack_ids,
+                                                   "ack_deadline_seconds": int(seconds)})
+
+    def subscribe(self, callback: Callable[[Any], None], max_messages: int = 100,
+                  max_bytes: int = 10000000, max_workers: int = 4) -> Future:
+        """Método que abre un streaming pull sobre la suscripción. Los mensajes
+        se entregan a 'callback' desde un pool de hilos, sin superar los límites
+        de control de flujo de mensajes y bytes pendientes de confirmar.
+
+        Args:
+        ----------
+        callback: Callable[[Any], None].
+            Función que procesa cada mensaje y lo confirma o rechaza.
+
+        max_messages: int.
+            Mensajes máximos entregados sin confirmar.
+
+        max_bytes: int.
+            Bytes máximos entregados sin confirmar.
+
+        max_workers: int.
+            Hilos que ejecutan 'callback'.
+
+        Returns:
+        ----------
+        Future.
+            Futuro del streaming pull; 'cancel' deja de recibir mensajes y
+            'result' espera a que terminen los que están en proceso."""
+
+        flow_control = types.FlowControl(max_messages = max_messages, max_bytes = max_bytes)
+        scheduler = ThreadScheduler(ThreadPoolExecutor(max_workers = max_workers))
+
+        return self.client.subscribe(self.subscription_path, callback, flow_control = flow_control,
+                                     scheduler = scheduler, await_callbacks_on_shutdown = True)
+
+
+class LocalTransport:
+    """Clase que consume mensajes del broker local, para ejecuciones sin GCP."""
+
+    def __init__(self, path: str = Config.LOCAL_BROKER_PATH) -> None:
+        """Método constructor.
+
+        Args:
+        ----------
+        path: str.
+            Ruta del archivo SQLite del broker, compartido con el publicador."""
+
+        self.broker = LocalBroker(path)
+
+    def pull(self, max_messages: int = 10) -> List[LocalReceivedMessage]:
+        """Método que obtiene mensajes del broker.
+
+        Args:
+        ----------
+        max_messages: int.
+            Cantidad máxima de mensajes.
+
+        Returns:
+        ----------
+        List[LocalReceivedMessage].
+            Mensajes recibidos."""
+
+        return [LocalReceivedMessage(ack_id = row["message_id"],
+                                     delivery_attempt = row["delivery_attempt"],
+                                     message = LocalMessage(message_id = row["message_id"],
+                                                            data = row["data"],
+                                                            attributes = row["attributes"],
+                                                            ordering_key = row["ordering_key"],
+                                                            publish_time = row["publish_time"]))
+                for row in self.broker.pull(max_messages)]
+
+    def acknowledge(self, ack_ids: List[str]) -> None:
+        """Método que confirma mensajes procesados.
+
+        Args:
+        ----------
+        ack_ids: List[str].
+            IDs de confirmación de los mensajes."""
+
+        self.broker.acknowledge(ack_ids)
+
+    def modify_ack_deadline(self, ack_ids: List[str], seconds: int) -> None:
+        """Método que modifica el plazo de confirmación de mensajes.
+
+        Args:
+        ----------
+        ack_ids: List[str].
+            IDs de confirmación de los mensajes.
+
+        seconds: int.
+            Nuevo plazo en segundos."""
+
+        self.broker.modify_ack_deadline(ack_ids, seconds)
+
+    def subscribe(self, callback: Callable[[Any], None], max_messages: int = 100,
+                  max_bytes: int = 10000000, max_workers: int = 4) -> Future:
+        """Método que abre un streaming pull sobre el broker.
+
+        Args:
+        ----------
+        callback: Callable[[Any], None].
+            Función que procesa cada mensaje y lo confirma o rechaza.
+
+        max_messages: int.
+            Mensajes máximos entregados sin confirmar.
+
+        max_bytes: int.
+            Bytes máximos entregados sin confirmar.
+
+        max_workers: int.
+            Hilos que ejecutan 'callback'.
+
+        Returns:
+        ----------
+        Future.
+            Futuro del streaming pull."""
+
+        acker = AckBatcher(self.broker, max_messages = Config.ACK_BATCH_MAX_MESSAGES,
+                           max_latency = Config.ACK_BATCH_MAX_LATENCY)
+
+        return LocalStreamingPull(self.broker, callback, acker, max_messages = max_messages,
+                                  max_bytes = max_bytes, max_workers = max_workers)
+
+
+def build_transport(name: str = Config.PUBSUB_TRANSPORT) -> Union[PubSubTransport, LocalTransport]:
+    """Función que construye el transporte configurado.
+
+    Args:
+    ----------
+    name: str.
+        Transporte a usar ('pubsub' o 'local').
+
+    Returns:
+    ----------
+    Union[PubSubTransport, LocalTransport].
+        Transporte de consumo."""
+
+    if name == "local":
+        return LocalTransport()
+
+    if name == "pubsub":
+        return PubSubTransport()
+
+    raise ValueError(f"El transporte '{name}' no existe.")
@@ -0,0 +1,24 @@
+"""Módulo que expone la API de lectura del suscriptor (problemas, modelos,
+versiones y mensajes en cuarentena), la que consulta el publicador por
+QUERY_API_URL. Se sirve con gunicorn:
+
+    gunicorn --bind 0.0.0.0:8081 wsgi:app
+
+o, en desarrollo, con 'python wsgi.py' en el puerto READ_API_PORT."""
+
+# Librerías Internas.
+from db import db
+from app import create_app
+from config import Config
+from workers.batch import enable_sqlite_savepoints
+
+
+app = create_app()
+
+# La reaplicación de la cuarentena usa los SAVEPOINT de 'BatchTransaction'.
+with app.app_context():
+    enable_sqlite_savepoints(db.engine)
+
+
+if __name__ == "__main__":
+    app.run(host = "0.0.0.0", port = Config.READ_API_PORT)